@@ -0,0 +1,228 @@
+# File: python-admin/benchmarks/fake_netlify.py
+# Local stand-in for the Netlify deploy API, for testing deploys without a real site
+#
+# Usage: python fake_netlify.py [--port 8911] [--site-id test-site] [--token test-token]
+#            [--seed-folder ../../website]
+#
+# Then set "netlify_api_base": "http://127.0.0.1:8911/api/v1" (plus the site id
+# and token) in the project's settings.json and deploy from the app.
+
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class FakeNetlify:
+    """Implements the digest-deploy endpoints in memory
+
+    Sites keep a {path: sha1} file list and the server keeps every uploaded
+    blob, so a second deploy of the same content requires no uploads.
+    Byte counters show how much each deploy actually transferred.
+    """
+
+    def __init__(self, site_id="test-site", token="test-token", port=0):
+        self.token = token
+        self.lock = threading.Lock()
+        self.sites = {site_id: {"id": site_id, "name": site_id,
+                                "url": f"https://{site_id}.example.netlify.app", "files": {}}}
+        self.blobs = {}    # sha1 -> bytes
+        self.deploys = {}  # deploy id -> {site, files, required, state}
+        self.requests = 0
+        self.bytes_received = 0
+        self.uploads = 0
+        self.restores = 0
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def api_base(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/api/v1"
+
+    def seed_site(self, site_id, files):
+        """Give a site live files ({path: bytes}) as if deployed earlier"""
+        with self.lock:
+            for path, data in files.items():
+                sha = hashlib.sha1(data).hexdigest()
+                self.blobs[sha] = data
+                self.sites[site_id]["files"][path] = sha
+
+    def seed_from_folder(self, site_id, folder):
+        folder = Path(folder)
+        self.seed_site(site_id, {
+            "/" + path.relative_to(folder).as_posix(): path.read_bytes()
+            for path in folder.rglob("*") if path.is_file()
+        })
+
+    def stats(self):
+        with self.lock:
+            return {"requests": self.requests, "bytes_received": self.bytes_received,
+                    "uploads": self.uploads, "restores": self.restores}
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    # --- endpoint logic (called with the lock held) ---
+
+    def get_site(self, site_id):
+        site = self.sites.get(site_id)
+        if site is None:
+            return 404, {"message": "Not Found"}
+        return 200, {key: site[key] for key in ("id", "name", "url")}
+
+    def list_files(self, site_id):
+        site = self.sites.get(site_id)
+        if site is None:
+            return 404, {"message": "Not Found"}
+        return 200, [{"id": path, "path": path, "sha": sha, "size": len(self.blobs.get(sha, b""))}
+                     for path, sha in sorted(site["files"].items())]
+
+    def create_deploy(self, site_id, body):
+        if site_id not in self.sites:
+            return 404, {"message": "Not Found"}
+        files = body.get("files")
+        if not isinstance(files, dict) or not all(re.fullmatch(r"[0-9a-f]{40}", str(sha)) for sha in files.values()):
+            return 422, {"message": "files must map paths to SHA1 digests"}
+        deploy_id = f"deploy-{len(self.deploys) + 1}"
+        required = {sha for sha in files.values() if sha not in self.blobs}
+        deploy = {"id": deploy_id, "site": site_id, "files": dict(files), "required": required, "state": "uploading"}
+        self.deploys[deploy_id] = deploy
+        self._finish_if_complete(deploy)
+        return 200, {"id": deploy_id, "state": deploy["state"], "required": sorted(required)}
+
+    def upload_file(self, deploy_id, path, data):
+        deploy = self.deploys.get(deploy_id)
+        if deploy is None:
+            return 404, {"message": "Not Found"}
+        sha = hashlib.sha1(data).hexdigest()
+        if deploy["files"].get(path) != sha:
+            return 422, {"message": f"{path} does not match its digest"}
+        self.blobs[sha] = data
+        self.uploads += 1
+        deploy["required"].discard(sha)
+        self._finish_if_complete(deploy)
+        return 200, {"id": sha, "path": path, "sha": sha}
+
+    def get_deploy(self, deploy_id):
+        deploy = self.deploys.get(deploy_id)
+        if deploy is None:
+            return 404, {"message": "Not Found"}
+        site = self.sites[deploy["site"]]
+        return 200, {"id": deploy_id, "state": deploy["state"], "required": sorted(deploy["required"]),
+                     "deploy_ssl_url": site["url"]}
+
+    def restore_deploy(self, site_id, deploy_id):
+        deploy = self.deploys.get(deploy_id)
+        if deploy is None or deploy["site"] != site_id:
+            return 404, {"message": "Not Found"}
+        if deploy["state"] != "ready":
+            return 422, {"message": "Only ready deploys can be restored"}
+        self.sites[site_id]["files"] = dict(deploy["files"])
+        self.restores += 1
+        return self.get_deploy(deploy_id)
+
+    def _finish_if_complete(self, deploy):
+        if not deploy["required"] and deploy["state"] == "uploading":
+            self.sites[deploy["site"]]["files"] = dict(deploy["files"])
+            deploy["state"] = "ready"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _route(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                data = self.rfile.read(length) if length else b""
+                with server.lock:
+                    server.requests += 1
+                    server.bytes_received += len(data) + sum(len(k) + len(v) for k, v in self.headers.items())
+                    if self.headers.get("Authorization") != f"Bearer {server.token}":
+                        return 401, {"message": "Access Denied"}
+
+                    path = self.path.split("?", 1)[0]
+                    match = re.fullmatch(r"/api/v1/sites/([^/]+)(/files|/deploys)?", path)
+                    if match and method == "GET" and not match.group(2):
+                        return server.get_site(match.group(1))
+                    if match and method == "GET" and match.group(2) == "/files":
+                        return server.list_files(match.group(1))
+                    if match and method == "POST" and match.group(2) == "/deploys":
+                        try:
+                            body = json.loads(data or b"{}")
+                        except ValueError:
+                            return 400, {"message": "Invalid JSON"}
+                        return server.create_deploy(match.group(1), body)
+
+                    match = re.fullmatch(r"/api/v1/sites/([^/]+)/deploys/([^/]+)/restore", path)
+                    if match and method == "POST":
+                        return server.restore_deploy(match.group(1), match.group(2))
+
+                    match = re.fullmatch(r"/api/v1/deploys/([^/]+)(/files/(.+))?", path)
+                    if match and method == "GET" and not match.group(2):
+                        return server.get_deploy(match.group(1))
+                    if match and method == "PUT" and match.group(2):
+                        return server.upload_file(match.group(1), "/" + match.group(3), data)
+                return 404, {"message": "Not Found"}
+
+            def do_GET(self):
+                self._reply(*self._route("GET"))
+
+            def do_POST(self):
+                self._reply(*self._route("POST"))
+
+            def do_PUT(self):
+                self._reply(*self._route("PUT"))
+
+            def log_message(self, format, *args):
+                pass  # Keep output readable
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the Netlify deploy API")
+    parser.add_argument("--port", type=int, default=8911)
+    parser.add_argument("--site-id", default="test-site")
+    parser.add_argument("--token", default="test-token")
+    parser.add_argument("--seed-folder", help="folder whose files the site starts with (e.g. ../../website)")
+    args = parser.parse_args()
+
+    server = FakeNetlify(args.site_id, args.token, args.port)
+    if args.seed_folder:
+        server.seed_from_folder(args.site_id, args.seed_folder)
+    server.start()
+    print("Fake Netlify running. Add to settings.json:")
+    print(json.dumps({"netlify_api_base": server.api_base, "netlify_site_id": args.site_id,
+                      "netlify_access_token": args.token}, indent=2))
+    try:
+        while True:
+            time.sleep(5)
+            print(f"  {server.stats()}")
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# File: python-admin/benchmarks/generate_catalog.py
+# Synthetic wreaths.json generator for benchmarks
+#
+# Usage: python generate_catalog.py 10000 -o wreaths.json [--seed 1]
+
+import sys
+import json
+import random
+import string
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+# Hashtag vocabulary drawn from the website's filter-config.json plus general tags
+FILTER_CONFIG = Path(__file__).resolve().parent.parent.parent / "website" / "filter-config.json"
+GENERAL_TAGS = [
+    "wreath", "wreaths", "wreathmaker", "nwt", "home", "homedecor", "frontdoor",
+    "doordecor", "handmade", "decomesh", "farmhouse", "rustic", "burlap", "sunflower",
+    "football", "baseball", "gameday", "movie", "welcome", "seasonal", "glitter",
+]
+THEMES = [
+    ("Christmas", ["christmas", "christmasdecor", "christmaswreath", "grinch", "holiday", "red", "green"]),
+    ("Halloween", ["halloween", "halloweendecor", "skulldecor", "creepyhalloween", "orange", "black"]),
+    ("Mardi Gras", ["mardigras", "masquerade", "carnival", "purple", "gold"]),
+    ("Spring", ["spring", "magnolia", "daisies", "everydaywreath", "pink"]),
+    ("Summer", ["summer", "summerdecor", "redwhiteandblue", "icecreamdecor", "blue"]),
+    ("Astros", ["astros", "houston", "baseball", "orange", "gameday"]),
+    ("Saints", ["saints", "neworleans", "football", "gold", "black"]),
+    ("Farmhouse", ["farmhouse", "rustic", "burlap", "everydaywreath", "white"]),
+]
+ADJECTIVES = ["Classic", "Sparkling", "Rustic", "Whimsical", "Vintage", "Deluxe", "Cozy",
+              "Festive", "Elegant", "Bold", "Glittery", "Cheerful", "Spooky", "Sunny"]
+NOUNS = ["Wreath", "Door Wreath", "Mesh Wreath", "Ribbon Wreath", "Swag", "Door Hanger"]
+SENTENCES = [
+    "This {adj} {theme} wreath measures {size}\" across and is ready to hang.",
+    "I used layers of deco mesh, glittery leaves and hand-tied ribbon on an evergreen base.",
+    "It is finished with a custom bow and a few surprise accents you will love.",
+    "Perfect for a front door, a covered porch or an indoor wall.",
+    "Every piece is handmade in my studio, so no two are exactly alike.",
+    "Ships boxed and padded so it arrives looking its best.",
+    "Add a timer light string for a soft glow in the evenings.",
+    "Pairs well with the matching {theme} door hanger in my closet.",
+]
+IMAGE_HOST = "https://di2ponv0v5otw.cloudfront.net/posts"
+
+
+def load_filter_tags():
+    """All hashtags named in the website filter config"""
+    try:
+        with open(FILTER_CONFIG) as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return [tag for category in config for sub in category.get('subcategories', [])
+            for tag in sub.get('hashtags', [])]
+
+
+def random_id(rng, timestamp_ms):
+    """Id in the same shape as the real catalog: ms timestamp + 9 base36 chars"""
+    suffix = ''.join(rng.choice(string.ascii_lowercase + string.digits) for _ in range(9))
+    return f"{timestamp_ms}{suffix}"
+
+
+def image_urls(rng, day):
+    """A Poshmark-style list of CloudFront image URLs"""
+    post = ''.join(rng.choice('0123456789abcdef') for _ in range(24))
+    return [
+        f"{IMAGE_HOST}/{day:%Y/%m/%d}/{post}/m_{post[:-2]}{index:02x}.jpeg"
+        for index in range(rng.choice([2, 5, 5, 6, 9, 10, 10]))
+    ]
+
+
+def generate_wreath(rng, index, filter_tags):
+    """One synthetic wreath with the key order and field types of wreaths.json"""
+    theme, theme_tags = rng.choice(THEMES)
+    adjective = rng.choice(ADJECTIVES)
+    added = date(2023, 1, 1) + timedelta(days=rng.randrange(900))
+    created = added - timedelta(days=rng.randrange(400))
+
+    tags = list(dict.fromkeys(
+        theme_tags + rng.sample(GENERAL_TAGS, 5) + rng.sample(filter_tags or GENERAL_TAGS, 3)))
+    inline_tags = rng.sample(tags, min(4, len(tags)))
+    sentences = [s.format(adj=adjective.lower(), theme=theme, size=rng.choice([18, 22, 24, 25, 28, 30]))
+                 for s in rng.sample(SENTENCES, rng.randint(3, len(SENTENCES)))]
+    description = ' '.join(sentences) + ' ' + ' '.join(f"#{tag}" for tag in inline_tags)
+
+    wreath = {
+        "id": random_id(rng, 1700000000000 + index * 7919),
+        "title": f"{adjective} {theme} {rng.choice(NOUNS)} #{index}",
+        "localPrice": float(rng.choice([0, 45, 55, 65, 75, 85, 95, 120, 150])),
+        "sold": rng.random() < 0.05,
+        "featured": rng.random() < 0.1,
+        "hashtags": tags,
+        "category": "holiday",
+        "dateAdded": added.isoformat(),
+        "description": description,
+        "platforms": {"poshmark": "", "fbMarketplace": "", "mercari": "", "other1": ""},
+        "images": image_urls(rng, added),
+    }
+    if rng.random() < 0.8:
+        wreath["dateCreated"] = created.isoformat()
+    return wreath
+
+
+def generate_catalog(count, seed=0):
+    """A deterministic list of synthetic wreaths"""
+    rng = random.Random(seed)
+    filter_tags = load_filter_tags()
+    return [generate_wreath(rng, index, filter_tags) for index in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic wreaths.json")
+    parser.add_argument("count", type=int, help="number of wreaths")
+    parser.add_argument("-o", "--output", default="wreaths.json", help="output file")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    with open(args.output, 'w') as f:
+        json.dump(generate_catalog(args.count, args.seed), f, indent=2)
+    print(f"Wrote {args.count} wreaths to {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
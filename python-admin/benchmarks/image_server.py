@@ -0,0 +1,134 @@
+# File: python-admin/benchmarks/image_server.py
+# Local HTTP server with deterministic JPEGs and configurable network conditions
+
+import time
+import random
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QRectF
+from PySide6.QtGui import QImage, QPainter, QColor, QLinearGradient
+
+# Poshmark serves listing images as roughly 580px squares (m_) and larger originals
+IMAGE_SIZES = {"small": (300, 300), "medium": (580, 580), "large": (1200, 1200)}
+
+
+def make_jpeg(seed, width, height, quality=85):
+    """A deterministic JPEG of busy shapes, so it compresses like a photo"""
+    rng = random.Random(seed)
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    painter = QPainter(image)
+    gradient = QLinearGradient(0, 0, width, height)
+    gradient.setColorAt(0, QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+    gradient.setColorAt(1, QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+    painter.fillRect(0, 0, width, height, gradient)
+    for _ in range(400):
+        painter.setBrush(QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.randrange(80, 255)))
+        painter.setPen(QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        size = rng.uniform(4, width / 8)
+        painter.drawEllipse(QRectF(rng.uniform(0, width), rng.uniform(0, height), size, size))
+    painter.end()
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "JPG", quality)
+    buffer.close()
+    return bytes(data)
+
+
+class ImageServer:
+    """Serves a pool of generated JPEGs on 127.0.0.1 with simulated latency,
+    bandwidth limits and failures
+
+    Every path maps to one pool image by hash, so any Poshmark-style URL
+    works. Statistics are kept for throughput reporting.
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, bandwidth_kbps=0, failure_rate=0.0,
+                 image_size="medium", pool_size=16, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth_kbps = bandwidth_kbps  # Per connection; 0 means unlimited
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+
+        width, height = IMAGE_SIZES[image_size]
+        self.pool = [make_jpeg(seed * 1000 + index, width, height) for index in range(pool_size)]
+
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.bytes_sent = 0
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def url(self, name):
+        """URL for an image name (any path works)"""
+        return f"{self.base_url}/posts/{name}.jpeg"
+
+    def stats(self):
+        """Snapshot of the request counters"""
+        with self.lock:
+            return {"requests": self.requests, "failures": self.failures, "bytes_sent": self.bytes_sent}
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _decide(self):
+        """Latency for one request and whether it should fail"""
+        with self.lock:
+            self.requests += 1
+            delay = max(0.0, self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            fail = self.rng.random() < self.failure_rate
+            if fail:
+                self.failures += 1
+        return delay, fail
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                delay, fail = server._decide()
+                time.sleep(delay)
+                if fail:
+                    self.send_error(503, "Simulated failure")
+                    return
+
+                digest = hashlib.md5(self.path.encode()).digest()
+                body = server.pool[digest[0] % len(server.pool)]
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+
+                chunk_size = 16 * 1024
+                bytes_per_second = server.bandwidth_kbps * 1024 / 8
+                for start in range(0, len(body), chunk_size):
+                    chunk = body[start:start + chunk_size]
+                    self.wfile.write(chunk)
+                    if bytes_per_second:
+                        time.sleep(len(chunk) / bytes_per_second)
+                with server.lock:
+                    server.bytes_sent += len(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output readable
+
+        return Handler
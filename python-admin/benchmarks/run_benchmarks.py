@@ -0,0 +1,203 @@
+# File: python-admin/benchmarks/run_benchmarks.py
+# Headless end-to-end timings of the admin's main operations
+#
+# Usage: python run_benchmarks.py [--sizes 1000 10000 100000] [--repeat 3] [-o report.json]
+#
+# Each size gets a fresh temporary project folder with a synthetic catalog.
+# The real TwinfolksWreathManager runs on Qt's offscreen platform; only the
+# modal dialogs are answered automatically and image downloads are not started
+# (the image pipeline has its own benchmark).
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ADMIN_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ADMIN_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import PySide6
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication, QMessageBox, QFileDialog
+
+from generate_catalog import generate_catalog
+
+FILTER_CONFIG = ADMIN_DIR.parent / "website" / "filter-config.json"
+
+FILTER_CASES = {
+    "featured": {"show_all": False, "featured": True, "sold": False, "available": False},
+    "available": {"show_all": False, "featured": False, "sold": False, "available": True},
+    "show all": {"show_all": True, "featured": False, "sold": False, "available": False},
+}
+SEARCH_QUERIES = ["christmas", "rustic wre", "glittery halloween door"]
+
+
+def answer_dialogs_automatically(import_files):
+    """Replace modal dialogs so operations run without a user"""
+    QMessageBox.information = staticmethod(lambda *args, **kwargs: QMessageBox.StandardButton.Ok)
+    QMessageBox.warning = staticmethod(lambda *args, **kwargs: QMessageBox.StandardButton.Ok)
+    QMessageBox.critical = staticmethod(lambda *args, **kwargs: QMessageBox.StandardButton.Ok)
+    QMessageBox.question = staticmethod(lambda *args, **kwargs: QMessageBox.StandardButton.Yes)
+    QFileDialog.getOpenFileNames = staticmethod(lambda *args, **kwargs: (list(import_files), ''))
+
+
+def timed(function, *args):
+    """Run a call and return milliseconds"""
+    started = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - started) * 1000
+
+
+def wait_for_catalog(window, timeout_ms=600000):
+    """Run the event loop until the background catalog load finishes"""
+    if not window.catalog_loading:
+        return
+    loop = QEventLoop()
+    window.catalog_loaded.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    window.catalog_loaded.disconnect(loop.quit)
+
+
+def make_project(folder, size, seed):
+    """Project folder with a synthetic catalog, filter config and import file"""
+    folder.mkdir(parents=True, exist_ok=True)
+    with open(folder / "wreaths.json", 'w') as f:
+        json.dump(generate_catalog(size, seed), f, indent=2)
+    if FILTER_CONFIG.exists():
+        shutil.copy2(FILTER_CONFIG, folder / "filter-config.json")
+
+    import_file = folder / "import_batch.json"
+    with open(import_file, 'w') as f:
+        json.dump(generate_catalog(max(1, size // 10), seed + 1), f, indent=2)
+    return import_file
+
+
+def benchmark_size(main_pyside, size, seed):
+    """Time every operation once for one catalog size"""
+    timings = {}
+
+    def record(name, ms):
+        timings[name] = round(ms, 2)
+
+    with tempfile.TemporaryDirectory(prefix=f"wreath_bench_{size}_") as temp:
+        project = Path(temp) / "project"
+        import_file = make_project(project, size, seed)
+        answer_dialogs_automatically([import_file])
+        main_pyside.AppLocationManager.get_current_project_folder = staticmethod(lambda: project)
+
+        # load_wreaths: window construction plus the background load and first sort
+        started = time.perf_counter()
+        window = main_pyside.TwinfolksWreathManager()
+        record("window_init", (time.perf_counter() - started) * 1000)
+        wait_for_catalog(window)
+        record("load_wreaths", (time.perf_counter() - started) * 1000)
+        record("load_wreaths_rendered", timed(window.flush_table_render) + timings["load_wreaths"])
+
+        # populate_table: the first time slice, then the rest of the rows
+        record("populate_table", timed(window.populate_table))
+        record("populate_table_rendered", timings["populate_table"] + timed(window.flush_table_render))
+
+        # _do_sort: every combo preset
+        for preset in main_pyside.SORT_PRESETS:
+            record(f"_do_sort[{preset}]", timed(window._do_sort, preset) + timed(window.flush_table_render))
+
+        # apply_filters: status filters and search queries
+        for name, filters in FILTER_CASES.items():
+            window.active_filters = dict(filters)
+            record(f"apply_filters[{name}]", timed(window.apply_filters) + timed(window.flush_table_render))
+        for query in SEARCH_QUERIES:
+            window.search_text = query
+            record(f"apply_filters[search '{query}']", timed(window.apply_filters) + timed(window.flush_table_render))
+        window.search_text = ""
+        window.active_filters = dict(FILTER_CASES["show all"])
+        window.apply_filters()
+        window.flush_table_render()
+
+        # import_wreaths: a file with a tenth of the catalog size
+        record("import_wreaths", timed(window.import_wreaths) + timed(window.flush_table_render))
+
+        # save_wreaths: first save serializes everything, later saves only edits
+        record("save_wreaths[full]", timed(window.save_wreaths))
+        wreath = window.wreaths_data[0]
+        window.before_wreath_change(wreath['id'], wreath)
+        wreath['title'] = wreath['title'] + " (edited)"
+        window.index_wreath(wreath)
+        window.mark_changes_made()
+        record("save_wreaths[one edit]", timed(window.save_wreaths))
+
+        record("create_backup", timed(window.create_backup))
+
+        window.settings_store.flush()
+        window.stop_catalog_load()
+        window.close()
+        window.deleteLater()
+        QApplication.processEvents()
+
+    return timings
+
+
+def summarize(samples):
+    """Median/min/max of repeated runs for each operation"""
+    summary = {}
+    for name in samples[0]:
+        values = [run[name] for run in samples]
+        summary[name] = {
+            "median_ms": round(statistics.median(values), 2),
+            "min_ms": round(min(values), 2),
+            "max_ms": round(max(values), 2),
+            "runs_ms": values,
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the wreath admin headlessly")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="catalog sizes to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per size")
+    parser.add_argument("--seed", type=int, default=0, help="catalog random seed")
+    parser.add_argument("-o", "--output", default=os.path.join(tempfile.gettempdir(), "benchmark_report.json"),
+                        help="JSON report file (default: in the system temp folder)")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    import main_pyside
+
+    # Thumbnails are left as "Loading..." so runs never touch the network
+    main_pyside.ImageDownloadThread.start = lambda self, *args: None
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pyside6": PySide6.__version__,
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM"),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+    for size in args.sizes:
+        print(f"Benchmarking {size} wreaths...")
+        samples = [benchmark_size(main_pyside, size, args.seed) for _ in range(args.repeat)]
+        report["sizes"][str(size)] = summarize(samples)
+        for name, stats in report["sizes"][str(size)].items():
+            print(f"  {name:<46}{stats['median_ms']:>10.1f} ms")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
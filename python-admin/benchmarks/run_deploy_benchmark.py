@@ -0,0 +1,92 @@
+# File: python-admin/benchmarks/run_deploy_benchmark.py
+# Bytes and time per deploy against the local fake Netlify server
+#
+# Usage: python run_deploy_benchmark.py [--size 1000] [-o deploy_report.json]
+#
+# Runs the real NetlifyDeployThread three times: a first deploy, the same
+# catalog again (nothing should be uploaded) and a deploy after one edit.
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ADMIN_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ADMIN_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from PySide6.QtCore import QCoreApplication
+
+from fake_netlify import FakeNetlify
+from generate_catalog import generate_catalog
+
+WEBSITE_DIR = ADMIN_DIR.parent / "website"
+
+
+def run_deploy(deploy_manager_pyside, server, wreaths):
+    """One deploy on the calling thread; returns the outcome and the transfer it caused"""
+    thread = deploy_manager_pyside.NetlifyDeployThread(
+        "test-site", "test-token", wreaths, json.dumps(wreaths, indent=2), server.api_base)
+    outcome = {}
+    thread.finished.connect(lambda success, message: outcome.update(success=success, message=message))
+
+    before = server.stats()
+    started = time.perf_counter()
+    thread.run()  # Signals are delivered directly, no event loop needed
+    wall_ms = (time.perf_counter() - started) * 1000
+    after = server.stats()
+    return {
+        "success": outcome.get("success"),
+        "message": outcome.get("message", "").splitlines()[0] if outcome.get("message") else "",
+        "wall_ms": round(wall_ms, 1),
+        "requests": after["requests"] - before["requests"],
+        "files_uploaded": after["uploads"] - before["uploads"],
+        "bytes_sent": after["bytes_received"] - before["bytes_received"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark digest deploys against a fake Netlify API")
+    parser.add_argument("--size", type=int, default=1000, help="wreaths in the catalog")
+    parser.add_argument("-o", "--output", default=os.path.join(tempfile.gettempdir(), "deploy_benchmark_report.json"),
+                        help="JSON report file (default: in the system temp folder)")
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    import deploy_manager_pyside
+
+    server = FakeNetlify()
+    if WEBSITE_DIR.exists():
+        server.seed_from_folder("test-site", WEBSITE_DIR)
+    server.start()
+
+    wreaths = generate_catalog(args.size)
+    report = {"timestamp": datetime.now().isoformat(timespec="seconds"), "size": args.size,
+              "catalog_bytes": len(json.dumps(wreaths, indent=2).encode()), "deploys": {}}
+    try:
+        report["deploys"]["first"] = run_deploy(deploy_manager_pyside, server, wreaths)
+        report["deploys"]["unchanged"] = run_deploy(deploy_manager_pyside, server, wreaths)
+        wreaths[0]["title"] += " (edited)"
+        report["deploys"]["one edit"] = run_deploy(deploy_manager_pyside, server, wreaths)
+    finally:
+        server.stop()
+
+    print(f"Catalog: {args.size} wreaths, {report['catalog_bytes'] / 1024:.0f} KB")
+    for name, result in report["deploys"].items():
+        print(f"  {name:<10} {'ok' if result['success'] else 'FAILED':<7}{result['bytes_sent'] / 1024:>9.1f} KB sent "
+              f"{result['files_uploaded']:>3} uploads {result['requests']:>3} requests {result['wall_ms']:>9.1f} ms")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# File: python-admin/benchmarks/run_image_benchmark.py
+# Offline benchmark of the table thumbnail and image viewer loaders
+#
+# Usage: python run_image_benchmark.py [--rows 200] [--viewer-images 10]
+#            [--latency-ms 80] [--jitter-ms 40] [--bandwidth-kbps 4000]
+#            [--failure-rate 0.02] [--image-size medium] [-o image_report.json]
+#
+# Images come from a local server (image_server.py), never from CloudFront.
+# Each loader runs twice against a fresh cache folder: cold (everything is
+# downloaded) and warm (everything should come from the cache).
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ADMIN_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ADMIN_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import PySide6
+from PySide6.QtWidgets import QApplication
+
+from image_server import ImageServer
+from diagnostics import current_rss_bytes
+
+
+def run_until(done, running_threads, timeout_s):
+    """Spin the event loop until done() is true, sampling threads and memory"""
+    started = time.perf_counter()
+    baseline_rss = current_rss_bytes()
+    peak_rss = baseline_rss
+    peak_threads = 0
+    while not done() and time.perf_counter() - started < timeout_s:
+        QApplication.processEvents()
+        peak_threads = max(peak_threads, running_threads())
+        rss = current_rss_bytes()
+        if rss is not None and peak_rss is not None:
+            peak_rss = max(peak_rss, rss)
+        time.sleep(0.002)
+    QApplication.processEvents()
+    return {
+        "wall_ms": round((time.perf_counter() - started) * 1000, 1),
+        "timed_out": not done(),
+        "peak_threads": peak_threads,
+        "peak_rss_growth_bytes": (peak_rss - baseline_rss) if baseline_rss is not None else None,
+    }
+
+
+def throughput(result, before, after, loaded):
+    """Add request, byte and rate figures from the server counters"""
+    seconds = max(result["wall_ms"] / 1000, 1e-9)
+    sent = after["bytes_sent"] - before["bytes_sent"]
+    result.update({
+        "requests": after["requests"] - before["requests"],
+        "failed_requests": after["failures"] - before["failures"],
+        "bytes_downloaded": sent,
+        "images_loaded": loaded,
+        "images_per_second": round(loaded / seconds, 1),
+        "megabytes_per_second": round(sent / seconds / (1024 * 1024), 2),
+    })
+    return result
+
+
+def bench_table_thumbnails(main_pyside, server, urls, cache_folder, timeout_s):
+    """Create one WreathImageWidget per row, as populate_table does"""
+    thread_class = main_pyside.ImageDownloadThread
+    thread_class._failed_urls.clear()
+    before = server.stats()
+    tracemalloc.start()
+
+    widgets = [main_pyside.WreathImageWidget(url, str(cache_folder)) for url in urls]
+    result = run_until(
+        lambda: not thread_class._active,
+        lambda: sum(1 for thread in list(thread_class._active) if thread.isRunning()),
+        timeout_s,
+    )
+    result["peak_python_alloc_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    loaded = sum(1 for widget in widgets if not widget.pixmap().isNull())
+    for widget in widgets:
+        widget.deleteLater()
+    QApplication.processEvents()
+    return throughput(result, before, server.stats(), loaded)
+
+
+def bench_image_viewer(image_viewer, server, urls, cache_folder, timeout_s):
+    """Open ImageViewerDialog on one wreath's image list"""
+    before = server.stats()
+    tracemalloc.start()
+
+    dialog = image_viewer.ImageViewerDialog(list(urls), None, str(cache_folder))
+    thumbnails = list(dialog.thumbnail_widgets)
+
+    def threads():
+        return [t.download_thread for t in thumbnails if hasattr(t, 'download_thread')]
+
+    result = run_until(
+        lambda: all(thread.isFinished() for thread in threads()),
+        lambda: sum(1 for thread in threads() if thread.isRunning()),
+        timeout_s,
+    )
+    result["peak_python_alloc_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    loaded = sum(1 for t in thumbnails if t.pixmap() is not None and not t.pixmap().isNull())
+    dialog.close()
+    dialog.deleteLater()
+    QApplication.processEvents()
+    return throughput(result, before, server.stats(), loaded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark image loading against a local server")
+    parser.add_argument("--rows", type=int, default=200, help="table thumbnails to load")
+    parser.add_argument("--viewer-images", type=int, default=10, help="images in the viewer dialog")
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--jitter-ms", type=float, default=40)
+    parser.add_argument("--bandwidth-kbps", type=float, default=4000, help="per connection; 0 = unlimited")
+    parser.add_argument("--failure-rate", type=float, default=0.02)
+    parser.add_argument("--image-size", choices=["small", "medium", "large"], default="medium")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default=os.path.join(tempfile.gettempdir(), "image_benchmark_report.json"),
+                        help="JSON report file (default: in the system temp folder)")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    import main_pyside
+    import image_viewer_pyside
+
+    server = ImageServer(args.latency_ms, args.jitter_ms, args.bandwidth_kbps, args.failure_rate,
+                         args.image_size, seed=args.seed).start()
+    table_urls = [server.url(f"table/{row:05d}/m_0") for row in range(args.rows)]
+    viewer_urls = [server.url(f"viewer/m_{index}") for index in range(args.viewer_images)]
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pyside6": PySide6.__version__,
+        "server": {
+            "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms,
+            "bandwidth_kbps": args.bandwidth_kbps, "failure_rate": args.failure_rate,
+            "image_size": args.image_size,
+            "image_bytes": [len(image) for image in server.pool],
+        },
+        "scenarios": {},
+    }
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="wreath_image_bench_") as temp:
+            table_cache = Path(temp) / "table_cache"
+            viewer_cache = Path(temp) / "viewer_cache"
+            table_cache.mkdir()
+            viewer_cache.mkdir()
+
+            for phase in ("cold", "warm"):
+                name = f"table_thumbnails_{phase}"
+                print(f"Running {name} ({len(table_urls)} rows)...")
+                report["scenarios"][name] = bench_table_thumbnails(
+                    main_pyside, server, table_urls, table_cache, args.timeout)
+
+            for phase in ("cold", "warm"):
+                name = f"image_viewer_{phase}"
+                print(f"Running {name} ({len(viewer_urls)} images)...")
+                report["scenarios"][name] = bench_image_viewer(
+                    image_viewer_pyside, server, viewer_urls, viewer_cache, args.timeout)
+    finally:
+        server.stop()
+
+    for name, result in report["scenarios"].items():
+        print(f"  {name:<26}{result['wall_ms']:>10.1f} ms  {result['images_loaded']:>5} loaded  "
+              f"{result['requests']:>5} requests  peak threads {result['peak_threads']}")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
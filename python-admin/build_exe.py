@@ -3,19 +3,170 @@
 
 import os
 import sys
+import json
+import time
+import argparse
+import platform
 import subprocess
 import shutil
+from datetime import datetime
 from pathlib import Path
 
-def build_executable():
+APP_NAME = "TwinfolksWreathManager"
+ENTRY_SCRIPT = "main_pyside.py"
+EXE_SUFFIX = ".exe" if os.name == "nt" else ""
+
+# Qt modules the app never imports (it only uses QtCore, QtGui and QtWidgets)
+EXCLUDED_MODULES = [
+    "PySide6.Qt3DAnimation", "PySide6.Qt3DCore", "PySide6.Qt3DExtras", "PySide6.Qt3DInput",
+    "PySide6.Qt3DLogic", "PySide6.Qt3DRender", "PySide6.QtBluetooth", "PySide6.QtCharts",
+    "PySide6.QtDataVisualization", "PySide6.QtDesigner", "PySide6.QtHelp", "PySide6.QtLocation",
+    "PySide6.QtMultimedia", "PySide6.QtMultimediaWidgets", "PySide6.QtNetwork", "PySide6.QtNfc",
+    "PySide6.QtOpenGL", "PySide6.QtOpenGLWidgets", "PySide6.QtPdf", "PySide6.QtPdfWidgets",
+    "PySide6.QtPositioning", "PySide6.QtQml", "PySide6.QtQuick", "PySide6.QtQuick3D",
+    "PySide6.QtQuickControls2", "PySide6.QtQuickWidgets", "PySide6.QtRemoteObjects",
+    "PySide6.QtScxml", "PySide6.QtSensors", "PySide6.QtSerialPort", "PySide6.QtSql",
+    "PySide6.QtStateMachine", "PySide6.QtSvgWidgets", "PySide6.QtTest", "PySide6.QtTextToSpeech",
+    "PySide6.QtUiTools", "PySide6.QtWebChannel", "PySide6.QtWebEngineCore",
+    "PySide6.QtWebEngineWidgets", "PySide6.QtWebSockets", "PySide6.QtXml",
+    "tkinter", "unittest", "pydoc",
+]
+
+# Qt plugin folders the app needs; every other plugin folder is pruned
+KEPT_QT_PLUGINS = {"platforms", "platformthemes", "styles", "imageformats", "iconengines"}
+
+BUILD_PROFILES = {
+    # Single self-extracting file: easy to share, but Qt is unpacked to a
+    # temp folder on every launch
+    "onefile": {
+        "options": ["--onefile", "--windowed"],
+        "exclude": False,
+    },
+    # Folder build that starts fast: nothing to unpack, unused Qt modules and
+    # plugins left out, and optimized bytecode
+    "fast-start": {
+        "options": ["--onedir", "--windowed", "--noupx"],
+        "exclude": True,
+    },
+}
+
+def pyinstaller_version():
+    """Installed PyInstaller version as a tuple of ints"""
+    import PyInstaller
+    return tuple(int(part) for part in PyInstaller.__version__.split(".")[:2] if part.isdigit())
+
+def pyinstaller_command(profile_name):
+    """PyInstaller command line for a build profile"""
+    profile = BUILD_PROFILES[profile_name]
+    
+    if profile["exclude"] and pyinstaller_version() < (6, 6):
+        # Older PyInstaller optimizes bytecode at the interpreter's level
+        cmd = [sys.executable, "-O", "-m", "PyInstaller"]
+    else:
+        cmd = [sys.executable, "-m", "PyInstaller"]
+    
+    cmd += profile["options"]
+    cmd += ["--name", APP_NAME, "--clean", "--noconfirm"]
+    
+    if Path("assets/icon.ico").exists():
+        cmd += ["--icon", "assets/icon.ico"]                 # App icon (optional)
+    if Path("assets").exists():
+        cmd += ["--add-data", f"assets{os.pathsep}assets"]   # Include assets folder (optional)
+    
+    if profile["exclude"]:
+        if pyinstaller_version() >= (6, 6):
+            cmd += ["--optimize", "1"]
+        for module in EXCLUDED_MODULES:
+            cmd += ["--exclude-module", module]
+    
+    cmd.append(ENTRY_SCRIPT)
+    return cmd
+
+def prune_qt_plugins(app_folder):
+    """Delete Qt plugin folders the app never loads from a onedir build"""
+    removed_bytes = 0
+    for plugins_dir in app_folder.rglob("plugins"):
+        if plugins_dir.parent.name not in ("PySide6", "Qt"):
+            continue
+        for plugin_dir in plugins_dir.iterdir():
+            if plugin_dir.is_dir() and plugin_dir.name not in KEPT_QT_PLUGINS:
+                removed_bytes += folder_size(plugin_dir)
+                shutil.rmtree(plugin_dir)
+                print(f"🧹 Pruned Qt plugins: {plugin_dir.name}")
+    return removed_bytes
+
+def folder_size(path):
+    """Total size in bytes of a file or folder"""
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_size
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+def benchmark_launch(exe_path, runs=5, timeout=120):
+    """Launch the built app with --startup-profile and time each run
+
+    The first run is the cold start (nothing in the OS file cache yet, and
+    for onefile builds, Qt still to unpack); the rest are warm starts.
+    """
+    results = []
+    report_file = Path("build") / "startup_profile.json"
+    report_file.parent.mkdir(exist_ok=True)
+    
+    for run in range(runs):
+        if report_file.exists():
+            report_file.unlink()
+        started = time.perf_counter()
+        try:
+            subprocess.run(
+                [str(exe_path), f"--startup-profile={report_file.resolve()}"],
+                capture_output=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            print(f"⚠️ Launch {run + 1} timed out after {timeout}s")
+            continue
+        wall_ms = (time.perf_counter() - started) * 1000
+        
+        phases = None
+        if report_file.exists():
+            with open(report_file) as f:
+                phases = json.load(f)
+        results.append({"run": run + 1, "cold": run == 0, "wall_ms": round(wall_ms, 1), "profile": phases})
+        print(f"⏱️ Launch {run + 1}: {wall_ms:.0f} ms{' (cold)' if run == 0 else ''}")
+    
+    return results
+
+def write_benchmark_report(profile_name, exe_path, bundle_path, runs):
+    """Save bundle size and launch timings so releases can be compared"""
+    warm = sorted(r["wall_ms"] for r in runs if not r["cold"])
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "profile": profile_name,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pyinstaller": ".".join(str(part) for part in pyinstaller_version()),
+        "executable": str(exe_path),
+        "bundle_bytes": folder_size(bundle_path),
+        "bundle_files": sum(1 for _ in Path(bundle_path).rglob("*")) if Path(bundle_path).is_dir() else 1,
+        "cold_start_ms": runs[0]["wall_ms"] if runs and runs[0]["cold"] else None,
+        "warm_start_median_ms": warm[len(warm) // 2] if warm else None,
+        "warm_start_min_ms": warm[0] if warm else None,
+        "runs": runs,
+    }
+    report_path = Path("dist") / f"launch_benchmark_{profile_name}.json"
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📊 Launch benchmark saved: {report_path}")
+    return report
+
+def build_executable(profile_name="onefile", benchmark_runs=5):
     """Build standalone executable using PyInstaller"""
     
-    print("🔨 Building Twinfolks Wreath Manager executable...")
+    print(f"🔨 Building Twinfolks Wreath Manager executable ({profile_name})...")
     print("=" * 50)
     
     # Check if we're in the right directory
-    if not Path("main.py").exists():
-        print("❌ Error: main.py not found!")
+    if not Path(ENTRY_SCRIPT).exists():
+        print(f"❌ Error: {ENTRY_SCRIPT} not found!")
         print("Please run this script from the python-admin directory.")
         return False
         
@@ -35,23 +186,14 @@ def build_executable():
             shutil.rmtree(folder)
             
     # Remove old spec file
-    spec_file = Path("main.spec")
+    spec_file = Path(f"{APP_NAME}.spec")
     if spec_file.exists():
         spec_file.unlink()
         
     print("\n📦 Building executable...")
     
     # PyInstaller command
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--onefile",                    # Single executable file
-        "--windowed",                   # No console window
-        "--name", "TwinfolksWreathManager",
-        "--icon", "assets/icon.ico",    # App icon (optional)
-        "--add-data", "assets;assets",  # Include assets folder (optional)
-        "--clean",                      # Clean before building
-        "main.py"
-    ]
+    cmd = pyinstaller_command(profile_name)
     
     try:
         # Run PyInstaller
@@ -61,19 +203,37 @@ def build_executable():
             print("✅ Build completed successfully!")
             
             # Check if executable was created
-            exe_path = Path("dist/TwinfolksWreathManager.exe")
+            onedir = "--onedir" in BUILD_PROFILES[profile_name]["options"]
+            bundle_path = Path("dist") / APP_NAME if onedir else Path("dist") / f"{APP_NAME}{EXE_SUFFIX}"
+            exe_path = bundle_path / f"{APP_NAME}{EXE_SUFFIX}" if onedir else bundle_path
             if exe_path.exists():
-                exe_size = exe_path.stat().st_size / (1024 * 1024)  # MB
+                if onedir:
+                    pruned = prune_qt_plugins(bundle_path)
+                    print(f"🧹 Pruned {pruned / (1024 * 1024):.1f} MB of unused Qt plugins")
+                
+                bundle_size = folder_size(bundle_path) / (1024 * 1024)  # MB
                 print(f"\n🎉 Executable created: {exe_path}")
-                print(f"📏 Size: {exe_size:.1f} MB")
+                print(f"📏 Size: {bundle_size:.1f} MB")
+                
+                # Time cold and warm launches of the build
+                if benchmark_runs > 0:
+                    print("\n⏱️ Benchmarking launch time...")
+                    runs = benchmark_launch(exe_path, benchmark_runs)
+                    write_benchmark_report(profile_name, exe_path, bundle_path, runs)
                 
                 # Create a release folder
-                release_folder = Path("../TwinfolksWreathManager_Release")
+                release_folder = Path(f"../{APP_NAME}_Release")
                 release_folder.mkdir(exist_ok=True)
                 
-                # Copy executable to release folder
-                release_exe = release_folder / "TwinfolksWreathManager.exe"
-                shutil.copy2(exe_path, release_exe)
+                # Copy executable (or the whole app folder) to release folder
+                if onedir:
+                    release_exe = release_folder / APP_NAME / exe_path.name
+                    if (release_folder / APP_NAME).exists():
+                        shutil.rmtree(release_folder / APP_NAME)
+                    shutil.copytree(bundle_path, release_folder / APP_NAME)
+                else:
+                    release_exe = release_folder / exe_path.name
+                    shutil.copy2(exe_path, release_exe)
                 
                 # Create README for users
                 readme_content = """
@@ -117,7 +277,7 @@ Built with ❤️ for beautiful handcrafted wreaths!
                     f.write(readme_content)
                     
                 print(f"\n📁 Release package created: {release_folder}")
-                print(f"   - TwinfolksWreathManager.exe")
+                print(f"   - {release_exe.relative_to(release_folder)}")
                 print(f"   - README.txt")
                 
                 print(f"\n🎯 Next Steps:")
@@ -167,6 +327,14 @@ If no icon files are provided, the application will use the default system icon.
         """)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Twinfolks Wreath Manager executable")
+    parser.add_argument("--profile", choices=sorted(BUILD_PROFILES), default="onefile",
+                        help="onefile (single shareable file) or fast-start (folder build tuned for launch time)")
+    parser.add_argument("--benchmark-runs", type=int, default=5,
+                        help="launches to time after building (0 to skip)")
+    parser.add_argument("--no-pause", action="store_true", help="don't wait for Enter at the end")
+    args = parser.parse_args()
+    
     print("🎀 Twinfolks Wreath Manager - Build Script")
     print("=========================================\n")
     
@@ -174,7 +342,7 @@ if __name__ == "__main__":
     create_assets_folder()
     
     # Build executable
-    success = build_executable()
+    success = build_executable(args.profile, args.benchmark_runs)
     
     if success:
         print("\n🎉 Build completed successfully!")
@@ -182,4 +350,5 @@ if __name__ == "__main__":
     else:
         print("\n❌ Build failed. Please check the error messages above.")
         
-    input("\nPress Enter to exit...")
\ No newline at end of file
+    if not args.no_pause:
+        input("\nPress Enter to exit...")
\ No newline at end of file
@@ -0,0 +1,160 @@
+# File: python-admin/change_tracker.py
+# Per-wreath change tracking since the last save and the last deploy
+
+import copy
+import json
+import textwrap
+
+from wreath_record import to_json_value
+
+# Points in time that changes are measured against
+BASELINES = ('save', 'deploy')
+
+
+def diff_fields(old, new):
+    """Field-level differences between two versions of a wreath
+
+    Returns {field: (old value, new value)} for every field that differs.
+    """
+    diffs = {}
+    for field in list(old) + [key for key in new if key not in old]:
+        old_value = old.get(field)
+        new_value = new.get(field)
+        if old_value != new_value:
+            diffs[field] = (old_value, new_value)
+    return diffs
+
+
+class ChangeSet:
+    """Added, modified and deleted wreaths relative to one baseline"""
+
+    def __init__(self, added=None, modified=None, deleted=None):
+        self.added = added or []        # wreath ids
+        self.modified = modified or {}  # wreath id -> field diffs
+        self.deleted = deleted or []    # wreath ids
+
+    def __bool__(self):
+        return bool(self.added or self.modified or self.deleted)
+
+    def __len__(self):
+        return len(self.added) + len(self.modified) + len(self.deleted)
+
+    @property
+    def changed_ids(self):
+        """Ids whose saved form differs from the baseline"""
+        return set(self.added) | set(self.modified) | set(self.deleted)
+
+    def summary(self):
+        """Short human-readable summary, e.g. '3 changed (1 added, 2 modified)'"""
+        if not self:
+            return "No changes"
+        parts = []
+        if self.added:
+            parts.append(f"{len(self.added)} added")
+        if self.modified:
+            parts.append(f"{len(self.modified)} modified")
+        if self.deleted:
+            parts.append(f"{len(self.deleted)} deleted")
+        return f"{len(self)} changed ({', '.join(parts)})"
+
+
+def changes_between(old_wreaths, new_wreaths):
+    """Compare two whole catalogs by wreath id (e.g. the deployed one and the current one)"""
+    old_by_id = {w.get('id'): w for w in old_wreaths}
+    new_by_id = {w.get('id'): w for w in new_wreaths}
+    change_set = ChangeSet()
+    for wreath_id, current in new_by_id.items():
+        original = old_by_id.get(wreath_id)
+        if original is None:
+            change_set.added.append(wreath_id)
+        else:
+            diffs = diff_fields(original, current)
+            if diffs:
+                change_set.modified[wreath_id] = diffs
+    change_set.deleted = [wreath_id for wreath_id in old_by_id if wreath_id not in new_by_id]
+    return change_set
+
+
+class ChangeTracker:
+    """Remembers the original version of every wreath touched since a baseline
+
+    Call before_change() before a wreath is edited, added or deleted. The
+    original is only copied on its first change after each baseline, so
+    tracking costs nothing for wreaths that are never touched and comparing
+    against a baseline only looks at the touched ones.
+    """
+
+    def __init__(self):
+        # baseline -> {wreath id: original wreath dict, or None if it did not exist}
+        self._originals = {baseline: {} for baseline in BASELINES}
+
+    def before_change(self, wreath_id, wreath=None):
+        """Record a wreath's current state before it changes (None for new wreaths)"""
+        original = None
+        for baseline in BASELINES:
+            originals = self._originals[baseline]
+            if wreath_id not in originals:
+                if original is None and wreath is not None:
+                    original = copy.deepcopy(wreath)
+                originals[wreath_id] = original
+
+    def touched_ids(self, baseline='save'):
+        """Ids changed in any way since a baseline (including net-zero edits)"""
+        return set(self._originals[baseline])
+
+    def changes(self, wreaths_by_id, baseline='save'):
+        """Compare the touched wreaths against a baseline"""
+        change_set = ChangeSet()
+        for wreath_id, original in self._originals[baseline].items():
+            current = wreaths_by_id.get(wreath_id)
+            if original is None and current is not None:
+                change_set.added.append(wreath_id)
+            elif original is not None and current is None:
+                change_set.deleted.append(wreath_id)
+            elif original is not None:
+                diffs = diff_fields(original, current)
+                if diffs:
+                    change_set.modified[wreath_id] = diffs
+        return change_set
+
+    def reset(self, baseline=None):
+        """Start a new baseline (after a save or deploy), or all of them"""
+        for name in ([baseline] if baseline else BASELINES):
+            self._originals[name].clear()
+
+
+class CatalogSerializer:
+    """Builds wreaths.json text from cached per-wreath JSON fragments
+
+    Produces exactly what json.dump(wreaths, f, indent=2) would, but only
+    re-serializes wreaths that changed since the previous call.
+    """
+
+    def __init__(self):
+        self._fragments = {}  # wreath id -> indented JSON text for that wreath
+
+    def invalidate(self, wreath_ids):
+        """Forget the cached fragments of changed wreaths"""
+        for wreath_id in wreath_ids:
+            self._fragments.pop(wreath_id, None)
+
+    def clear(self):
+        """Forget every cached fragment"""
+        self._fragments.clear()
+
+    def fragment(self, wreath):
+        """Cached JSON text for one wreath, indented as a list element"""
+        wreath_id = wreath.get('id')
+        text = self._fragments.get(wreath_id) if wreath_id else None
+        if text is None:
+            text = textwrap.indent(json.dumps(wreath, indent=2, default=to_json_value), '  ')
+            if wreath_id:
+                self._fragments[wreath_id] = text
+        return text
+
+    def serialize(self, wreaths):
+        """Full catalog JSON text"""
+        if not wreaths:
+            return "[]"
+        fragment = self.fragment
+        return "[\n" + ",\n".join(fragment(wreath) for wreath in wreaths) + "\n]"
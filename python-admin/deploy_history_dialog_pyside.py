@@ -0,0 +1,86 @@
+# File: python-admin/deploy_history_dialog_pyside.py
+# Deploy history with one-click rollback to an earlier deploy
+
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                            QPushButton, QTableWidget, QTableWidgetItem,
+                            QHeaderView, QAbstractItemView)
+from PySide6.QtCore import Qt
+
+from deploy_ledger import format_time
+
+
+class DeployHistoryDialog(QDialog):
+    """Lists ledger entries newest first; accepting means roll back to selected_entry"""
+
+    COLUMNS = ["When", "Type", "Wreaths", "Changes", "Deploy ID"]
+
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.selected_entry = None
+
+        self.setWindowTitle("Deploy History")
+        self.setModal(True)
+        self.resize(850, 420)
+
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        info = QLabel("The top entry is live on the website. Rolling back re-publishes an "
+                      "earlier deploy on Netlify without uploading anything.")
+        info.setWordWrap(True)
+        layout.addWidget(info)
+
+        self.table = QTableWidget(len(self.history), len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+
+        for row, entry in enumerate(self.history):
+            kind = "Rollback" if entry.get('kind') == 'rollback' else "Deploy"
+            if row == 0:
+                kind += " (live)"
+            values = [format_time(entry.get('time')), kind, str(entry.get('wreath_count', '')),
+                      entry.get('summary') or "", entry.get('deploy_id') or ""]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column == 2:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+        self.table.resizeColumnsToContents()
+        self.table.itemSelectionChanged.connect(self.update_buttons)
+        self.table.itemDoubleClicked.connect(lambda item: self.rollback_selected())
+        layout.addWidget(self.table)
+
+        button_row = QHBoxLayout()
+        button_row.addStretch()
+        self.rollback_btn = QPushButton("Roll Back to Selected Deploy")
+        self.rollback_btn.clicked.connect(self.rollback_selected)
+        button_row.addWidget(self.rollback_btn)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.reject)
+        button_row.addWidget(close_btn)
+        layout.addLayout(button_row)
+
+        self.update_buttons()
+
+    def current_entry(self):
+        rows = self.table.selectionModel().selectedRows()
+        return self.history[rows[0].row()] if rows else None
+
+    def update_buttons(self):
+        """Rolling back only makes sense to content other than what is live"""
+        entry = self.current_entry()
+        live_hash = self.history[0].get('content_hash') if self.history else None
+        self.rollback_btn.setEnabled(entry is not None and entry.get('content_hash') != live_hash)
+
+    def rollback_selected(self):
+        if not self.rollback_btn.isEnabled():
+            return
+        self.selected_entry = self.current_entry()
+        self.accept()
@@ -0,0 +1,103 @@
+# File: python-admin/deploy_ledger.py
+# Local history of website deploys: content hashes, deploy ids and the deployed catalogs
+
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+
+from settings_store import atomic_write_text, atomic_write_json
+
+
+def content_hash(digests):
+    """One hash for a whole deploy from its {path: sha1} file digests"""
+    text = "".join(f"{path}\0{digests[path]}\n" for path in sorted(digests))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class DeployLedger:
+    """Deploy history kept in the project's deploys/ folder
+
+    history.json lists each deploy (or rollback) with its deploy id, time,
+    content hash, file digests and wreath count. The wreaths.json that was
+    deployed is kept next to it, so changes since the last deploy can be
+    shown across sessions.
+    """
+
+    def __init__(self, folder, keep_snapshots=20):
+        self.folder = Path(folder)
+        self.history_file = self.folder / "history.json"
+        self.keep_snapshots = keep_snapshots
+        self.entries = []  # Oldest first
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.history_file, encoding='utf-8') as f:
+                entries = json.load(f)
+            self.entries = [e for e in entries if isinstance(e, dict) and e.get('content_hash')]
+        except (OSError, ValueError):
+            self.entries = []
+
+    def save(self):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self.history_file, self.entries)
+
+    def history(self, site_id):
+        """Entries for a site, newest first"""
+        return [e for e in reversed(self.entries) if e.get('site_id') == site_id]
+
+    def last(self, site_id):
+        """The deploy currently live on a site according to the ledger, or None"""
+        history = self.history(site_id)
+        return history[0] if history else None
+
+    def snapshot_file(self, hash_value):
+        return self.folder / f"wreaths_{hash_value[:16]}.json"
+
+    def load_snapshot(self, entry):
+        """The wreaths list deployed by an entry, or None if it is no longer kept"""
+        try:
+            with open(self.snapshot_file(entry['content_hash']), encoding='utf-8') as f:
+                wreaths = json.load(f)
+            return wreaths if isinstance(wreaths, list) else None
+        except (OSError, ValueError):
+            return None
+
+    def record(self, site_id, deploy_id, digests, wreath_count, summary, json_content=None, kind='deploy'):
+        """Add a successful deploy or rollback and keep its catalog snapshot"""
+        entry = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "kind": kind,
+            "site_id": site_id,
+            "deploy_id": deploy_id,
+            "content_hash": content_hash(digests),
+            "files": dict(digests),
+            "wreath_count": wreath_count,
+            "summary": summary,
+        }
+        self.folder.mkdir(parents=True, exist_ok=True)
+        if json_content is not None and not self.snapshot_file(entry['content_hash']).exists():
+            atomic_write_text(self.snapshot_file(entry['content_hash']), json_content)
+        self.entries.append(entry)
+        self.save()
+        self.prune_snapshots()
+        return entry
+
+    def prune_snapshots(self):
+        """Delete catalog snapshots no recent entry refers to"""
+        kept = {self.snapshot_file(e['content_hash']).name for e in self.entries[-self.keep_snapshots:]}
+        for snapshot in self.folder.glob("wreaths_*.json"):
+            if snapshot.name not in kept:
+                try:
+                    snapshot.unlink()
+                except OSError:
+                    pass
+
+
+def format_time(iso_time):
+    """Ledger timestamp for display, e.g. 03/14/2025 02:05 PM"""
+    try:
+        return datetime.fromisoformat(iso_time).strftime('%m/%d/%Y %I:%M %p')
+    except (TypeError, ValueError):
+        return str(iso_time)
@@ -1,130 +1,281 @@
 # File: python-admin/deploy_manager_pyside.py
 # Enhanced deploy manager for Netlify deployment
 
-import json
+import time
+import threading
 import requests
-import base64
 from pathlib import Path
-from PySide6.QtWidgets import QMessageBox, QProgressDialog, QApplication
+from PySide6.QtWidgets import QMessageBox, QProgressDialog, QDialog
 from PySide6.QtCore import QThread, Signal, Qt
 
+from instrumentation import span, traced
+from diagnostics import live_objects
+from netlify_client import (NetlifyClient, NetlifyError, CancelToken, DeployCancelled, plan_deploy,
+                            sha1_digest, DEFAULT_API_BASE)
+from deploy_ledger import DeployLedger, content_hash, format_time
+from change_tracker import changes_between
+from site_publisher import publish_site_files, payload_summary, OWNED_PREFIXES
+
+
+def build_site_files(wreaths_data, json_content=None, filter_categories=None, stats=None):
+    """{site path: bytes} of every file a deploy publishes"""
+    with span("deploy.publish"):
+        return publish_site_files(wreaths_data, json_content, filter_categories, stats)
+
+
+# Deploy states, in the order a deploy goes through them; a deploy ends in
+# one of the last five
+PREPARING = "preparing"
+CONNECTING = "connecting"
+LISTING = "listing files"
+CREATING = "creating"
+UPLOADING = "uploading"
+PUBLISHING = "publishing"
+READY = "ready"
+UP_TO_DATE = "up to date"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMED_OUT = "timed out"
+
+
 class NetlifyDeployThread(QThread):
-    """Thread for handling Netlify deployment"""
+    """Thread for handling Netlify deployment
+
+    Uses Netlify's digest deploy: the site's files are listed by SHA1, and
+    only files whose digest the live site doesn't have yet are uploaded.
+    Each step is a state reported through progress_event. cancel() stops
+    the deploy at the next check (within a fraction of a second, including
+    mid-request) and it then finishes normally in the CANCELLED state.
+
+    The site files are built and hashed on the thread. With
+    wait_for_go_ahead, the thread then emits prepared and waits for
+    proceed() (or cancel()) before it contacts Netlify.
+    """
     progress = Signal(str)  # Progress message
+    progress_event = Signal(dict)  # {state, message, done, total, elapsed}
+    prepared = Signal(str)  # Content hash of the built site files
     finished = Signal(bool, str)  # Success, message
     
-    def __init__(self, site_id, access_token, wreaths_data):
+    POLL_DELAYS = (1, 2, 4, 8)  # Seconds between deploy status checks, backing off...
+    POLL_MAX_DELAY = 10         # ...to at most this
+    PUBLISH_TIMEOUT = 120       # Seconds to wait for Netlify to publish after the uploads
+    
+    def __init__(self, site_id, access_token, wreaths_data, json_content=None, api_base=None,
+                 filter_categories=None, site_files=None, publish_stats=None, wait_for_go_ahead=False):
         super().__init__()
         self.site_id = site_id
         self.access_token = access_token
         self.wreaths_data = wreaths_data
+        self.json_content = json_content  # Pre-serialized wreaths.json, if available
+        self.api_base = api_base or DEFAULT_API_BASE
+        self.filter_categories = filter_categories  # For the per-filter catalog shards
+        self.site_files = site_files  # Files already built by build_site_files, if available
+        self.cancel_token = CancelToken()
+        self.wait_for_go_ahead = wait_for_go_ahead
+        self.go_ahead = threading.Event()
+        self.state = None
+        self.started_at = None
+        # Filled in as the deploy goes, for the deploy ledger
+        self.deploy_id = None
+        self.digests = {}
+        self.publish_stats = publish_stats if publish_stats is not None else {}
+        live_objects.track("threads", self)
+        
+    def cancel(self):
+        """Ask the deploy to stop; safe to call from any thread"""
+        self.cancel_token.cancel()
+        self.go_ahead.set()
+        
+    def proceed(self):
+        """Let a deploy waiting after prepared go on to Netlify"""
+        self.go_ahead.set()
+        
+    def set_state(self, state, message, done=0, total=0):
+        """Move to a new state and report it"""
+        self.state = state
+        self.progress.emit(message)
+        self.progress_event.emit({
+            "state": state,
+            "message": message,
+            "done": done,
+            "total": total,
+            "elapsed": time.perf_counter() - self.started_at if self.started_at else 0.0,
+        })
         
+    @classmethod
+    def poll_delays(cls):
+        """Seconds to wait before each status check: at once, then exponential backoff"""
+        yield 0
+        yield from cls.POLL_DELAYS
+        while True:
+            yield cls.POLL_MAX_DELAY
+        
+    @traced("deploy")
     def run(self):
         """Run the deployment process"""
+        self.started_at = time.perf_counter()
         try:
             print("🚀 DEPLOY THREAD STARTED")
-            # Step 1: Prepare JSON data
-            self.progress.emit("Preparing wreaths.json data...")
-            json_content = json.dumps(self.wreaths_data, indent=2)
-            print(f"📄 JSON prepared: {len(json_content)} characters")
+            success, message = self.deploy()
+        except DeployCancelled:
+            success, message = False, self.cancelled_message()
+        except NetlifyError as e:
+            success, message = False, f"❌ Deployment failed: {e}"
+        except requests.exceptions.Timeout:
+            success, message = False, "⏰ Connection timed out. Please check your internet connection."
+        except requests.exceptions.ConnectionError:
+            success, message = False, "🌐 Connection error. Please check your internet connection."
+        except Exception as e:
+            success, message = False, f"❌ Unexpected error: {str(e)}"
+        
+        if self.state not in (READY, UP_TO_DATE, TIMED_OUT):
+            self.set_state(CANCELLED if self.cancel_token.cancelled else FAILED, message.splitlines()[0])
+        self.finished.emit(success, message)
+        
+    def cancelled_message(self):
+        """What a cancel left behind, which depends on how far the deploy got"""
+        if self.state == PUBLISHING:
+            return ("🛑 Deployment cancelled while Netlify was publishing it.\n\n"
+                    "Every file had been sent, so Netlify may still finish and publish this deploy.")
+        return "🛑 Deployment cancelled. Your live website was not changed."
+        
+    def deploy(self):
+        """The deploy steps in order; returns (success, message)"""
+        cancel_token = self.cancel_token
+        
+        # Step 1: Prepare site files
+        self.set_state(PREPARING, "Preparing wreaths.json and catalog files...")
+        local_files = self.site_files
+        if local_files is None:
+            local_files = self.site_files = build_site_files(self.wreaths_data, self.json_content,
+                                                             self.filter_categories, self.publish_stats)
+        cancel_token.check()
+        with span("deploy.hash", files=len(local_files)):
+            digests = {path: sha1_digest(data) for path, data in local_files.items()}
+        print(f"📄 Files prepared: {len(local_files)} files, {sum(len(data) for data in local_files.values())} bytes")
+        self.prepared.emit(content_hash(digests))
+        if self.wait_for_go_ahead:
+            self.go_ahead.wait()
+        cancel_token.check()
+        
+        # Step 2: Get current site info
+        self.set_state(CONNECTING, "Connecting to Netlify...")
+        client = NetlifyClient(self.access_token, self.api_base, cancel_token)
+        try:
+            with span("deploy.connect"):
+                site_info = client.get_site(self.site_id)
+        except NetlifyError as e:
+            if e.status == 401:
+                return False, "❌ Invalid access token. Please check your Netlify settings."
+            if e.status == 404:
+                return False, "❌ Site not found. Please check your Site ID in settings."
+            return False, f"❌ Error accessing site: {e.status}"
+        except (requests.exceptions.RequestException, OSError) as e:
+            return False, f"❌ Connection failed: {str(e)}"
             
-            # Step 2: Get current site info
-            self.progress.emit("Connecting to Netlify...")
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
+        site_name = site_info.get('name', 'Unknown')
+        site_url_public = site_info.get('url', 'Unknown')
+        
+        # Step 3: Get current files, so the deploy keeps them and skips unchanged content
+        self.set_state(LISTING, f"Connected to site: {site_name}. Getting current site files...")
+        try:
+            with span("deploy.list_files"):
+                remote_files = client.list_files(self.site_id)
+        except NetlifyError as e:
+            return False, f"❌ Could not get current files: {e.status}"
+        
+        manifest, digests, changed = plan_deploy(local_files, remote_files, OWNED_PREFIXES, digests)
+        self.digests = digests
+        if not changed:
+            self.set_state(UP_TO_DATE, "Website already up to date")
+            return True, (f"✅ Website already up to date.\n\n📍 Your website: {site_url_public}\n"
+                          f"📄 wreaths.json with {len(self.wreaths_data)} wreaths is unchanged, nothing was uploaded")
+        
+        # Step 4: Create new deployment from the digest manifest
+        self.set_state(CREATING, f"Creating new deployment ({len(changed)} changed of {len(manifest)} files)...")
+        with span("deploy.create", files=len(manifest)):
+            deploy_info = client.create_deploy(self.site_id, manifest)
+        deploy_id = self.deploy_id = deploy_info.get('id')
+        required = set(deploy_info.get('required') or [])
+        
+        # Step 5: Upload only the content Netlify doesn't have
+        missing = required - set(digests.values())
+        if missing:
+            return False, (f"❌ Netlify asked for {len(missing)} site files this app doesn't publish. "
+                           "Please redeploy the full site once from Netlify.")
+        uploads = [(path, data) for path, data in local_files.items() if digests[path] in required]
+        for done, (path, data) in enumerate(uploads):
+            self.set_state(UPLOADING, f"Uploading {path.lstrip('/')} ({len(data) / 1024:.0f} KB)...",
+                           done, len(uploads))
+            with span("deploy.upload", path=path, bytes=len(data)):
+                client.upload_file(deploy_id, path, data)
+        
+        # Step 6: Wait for Netlify to publish, checking less often the longer it takes
+        self.set_state(PUBLISHING, "Deployment created, waiting for completion...")
+        deadline = time.monotonic() + self.PUBLISH_TIMEOUT
+        for delay in self.poll_delays():
+            if time.monotonic() + delay > deadline:
+                break
+            if cancel_token.wait(delay):
+                cancel_token.check()
             
-            # Check if site exists and we have access
-            site_url = f"https://api.netlify.com/api/v1/sites/{self.site_id}"
             try:
-                site_response = requests.get(site_url, headers=headers, timeout=10)
-            except Exception as e:
-                self.finished.emit(False, f"❌ Connection failed: {str(e)}")
-                return
-            
-            if site_response.status_code == 401:
-                self.finished.emit(False, "❌ Invalid access token. Please check your Netlify settings.")
-                return
-            elif site_response.status_code == 404:
-                self.finished.emit(False, "❌ Site not found. Please check your Site ID in settings.")
-                return
-            elif site_response.status_code != 200:
-                self.finished.emit(False, f"❌ Error accessing site: {site_response.status_code}")
-                return
-                
-            site_info = site_response.json()
-            site_name = site_info.get('name', 'Unknown')
-            site_url_public = site_info.get('url', 'Unknown')
-            
-            self.progress.emit(f"Connected to site: {site_name}")
-            
-            # Step 3: Get current files to preserve other files
-            self.progress.emit("Getting current site files...")
-            files_url = f"https://api.netlify.com/api/v1/sites/{self.site_id}/files"
-            files_response = requests.get(files_url, headers=headers, timeout=30)
-            
-            if files_response.status_code != 200:
-                self.finished.emit(False, f"❌ Could not get current files: {files_response.status_code}")
-                return
-            
-            # Step 4: Create new deployment with updated wreaths.json
-            self.progress.emit("Creating new deployment...")
-            
-            # Prepare files for deployment - just update wreaths.json
-            files_to_deploy = {
-                "wreaths.json": json_content
-            }
-            
-            # Create deployment
-            deploy_data = {
-                "files": files_to_deploy
-            }
-            
-            deploy_url = f"https://api.netlify.com/api/v1/sites/{self.site_id}/deploys"
-            deploy_response = requests.post(deploy_url, headers=headers, json=deploy_data, timeout=60)
-            
-            if deploy_response.status_code not in [200, 201]:
-                self.finished.emit(False, f"❌ Deployment failed: {deploy_response.status_code}\n{deploy_response.text}")
-                return
-                
-            deploy_info = deploy_response.json()
-            deploy_id = deploy_info.get('id')
-            
-            self.progress.emit("Deployment created, waiting for completion...")
-            
-            # Step 5: Wait for deployment to complete
-            import time
-            max_wait = 120  # 2 minutes max
-            wait_time = 0
-            
-            while wait_time < max_wait:
-                time.sleep(3)
-                wait_time += 3
-                
-                status_url = f"https://api.netlify.com/api/v1/deploys/{deploy_id}"
-                status_response = requests.get(status_url, headers=headers, timeout=30)
+                with span("deploy.poll"):
+                    status_info = client.get_deploy(deploy_id)
+            except NetlifyError:
+                self.set_state(PUBLISHING, "Checking deployment status...")
+                continue
                 
-                if status_response.status_code == 200:
-                    status_info = status_response.json()
-                    state = status_info.get('state', 'unknown')
-                    
-                    if state == 'ready':
-                        deploy_url_public = status_info.get('deploy_ssl_url', site_url_public)
-                        self.finished.emit(True, f"✅ Deployment successful!\n\n📍 Your website: {deploy_url_public}\n📄 Updated wreaths.json with {len(self.wreaths_data)} wreaths")
-                        return
-                    elif state == 'error':
-                        error_msg = status_info.get('error_message', 'Unknown error')
-                        self.finished.emit(False, f"❌ Deployment failed: {error_msg}")
-                        return
-                    else:
-                        self.progress.emit(f"Deploying... ({state})")
-                else:
-                    self.progress.emit("Checking deployment status...")
-            
-            # Timeout
-            self.finished.emit(False, "⏰ Deployment timed out. Please check Netlify dashboard.")
-            
+            state = status_info.get('state', 'unknown')
+            if state == 'ready':
+                deploy_url_public = status_info.get('deploy_ssl_url', site_url_public)
+                self.set_state(READY, "Deployment successful")
+                return True, (f"✅ Deployment successful!\n\n📍 Your website: {deploy_url_public}\n"
+                              f"📄 Updated wreaths.json with {len(self.wreaths_data)} wreaths\n"
+                              f"📦 {payload_summary(local_files, self.publish_stats)}\n"
+                              f"⬆ Uploaded {len(uploads)} file(s), {client.bytes_uploaded / 1024:.0f} KB")
+            if state == 'error':
+                return False, f"❌ Deployment failed: {status_info.get('error_message', 'Unknown error')}"
+            self.set_state(PUBLISHING, f"Deploying... ({state})")
+        
+        self.set_state(TIMED_OUT, "Deployment timed out")
+        return False, "⏰ Deployment timed out. Please check Netlify dashboard."
+
+class NetlifyRestoreThread(QThread):
+    """Thread that publishes an earlier deploy again (a rollback)
+
+    cancel() gives up on the restore request at once, as for a deploy.
+    """
+    progress = Signal(str)  # Progress message
+    finished = Signal(bool, str)  # Success, message
+    
+    def __init__(self, site_id, access_token, deploy_id, api_base=None):
+        super().__init__()
+        self.site_id = site_id
+        self.access_token = access_token
+        self.deploy_id = deploy_id
+        self.api_base = api_base or DEFAULT_API_BASE
+        self.cancel_token = CancelToken()
+        live_objects.track("threads", self)
+        
+    def cancel(self):
+        """Ask the rollback to stop; safe to call from any thread"""
+        self.cancel_token.cancel()
+        
+    @traced("deploy.restore")
+    def run(self):
+        try:
+            self.progress.emit(f"Restoring deploy {self.deploy_id}...")
+            client = NetlifyClient(self.access_token, self.api_base, self.cancel_token)
+            deploy_info = client.restore_deploy(self.site_id, self.deploy_id)
+            site_url = deploy_info.get('deploy_ssl_url') or deploy_info.get('ssl_url') or deploy_info.get('url', '')
+            self.finished.emit(True, f"✅ Rollback complete!\n\n📍 Your website: {site_url}\n"
+                                     f"↩ Deploy {self.deploy_id} is live again (nothing was uploaded)")
+        except DeployCancelled:
+            self.finished.emit(False, "🛑 Rollback cancelled.\n\n"
+                                      "If Netlify had already received the request, the earlier deploy may still go live.")
+        except NetlifyError as e:
+            self.finished.emit(False, f"❌ Rollback failed: {e}")
         except requests.exceptions.Timeout:
             self.finished.emit(False, "⏰ Connection timed out. Please check your internet connection.")
         except requests.exceptions.ConnectionError:
@@ -138,6 +289,10 @@ class DeployManager:
         self.wreaths_data = wreaths_data
         self.parent = parent
         
+        # Deploy history lives in the project folder
+        project_folder = getattr(parent, 'project_folder', None)
+        self.ledger = DeployLedger(Path(project_folder) / "deploys") if project_folder else None
+        
     def deploy(self):
         """Deploy wreaths.json to Netlify"""
         # Check if Netlify settings are configured
@@ -193,9 +348,14 @@ class DeployManager:
             return
         
         # Confirm deployment
+        self.site_id = site_id
+        self.last_deploy = self.ledger.last(site_id) if self.ledger else None
+        self.change_summary = self.changes_since_deploy(self.last_deploy)
+        change_summary = f"Since last deploy: {self.change_summary}\n" if self.change_summary else ""
         reply = QMessageBox.question(
             self.parent, "Deploy to Netlify",
             f"Deploy {len(self.wreaths_data)} wreaths to your website?\n\n"
+            f"{change_summary}"
             f"Site ID: {site_id[:10]}...\n"
             "This will update wreaths.json on your live website.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
@@ -213,40 +373,188 @@ class DeployManager:
         self.progress_dialog.setMinimumDuration(0)
         self.progress_dialog.show()
         
-        # Start deployment thread
-        self.deploy_thread = NetlifyDeployThread(site_id, access_token, self.wreaths_data)
-        self.deploy_thread.progress.connect(self.update_progress)
+        # Start deployment thread; it builds the site files, then waits while
+        # deployment_prepared compares them with the last deploy
+        json_content = self.parent.catalog_json() if hasattr(self.parent, 'catalog_json') else None
+        self.deploy_declined = False
+        self.deploy_thread = NetlifyDeployThread(
+            site_id, access_token, self.wreaths_data, json_content,
+            self.settings.get('netlify_api_base', DEFAULT_API_BASE), getattr(self.parent, 'filter_categories', None),
+            wait_for_go_ahead=True
+        )
+        self.deploy_thread.progress_event.connect(self.show_progress_event)
+        self.deploy_thread.prepared.connect(self.deployment_prepared)
         self.deploy_thread.finished.connect(self.deployment_finished)
         self.progress_dialog.canceled.connect(self.cancel_deployment)
         
         self.deploy_thread.start()
         
+    def deployment_prepared(self, site_hash):
+        """Go on with a deploy once its files are built, asking first if nothing changed"""
+        deploy_thread = self.deploy_thread
+        if deploy_thread.cancel_token.cancelled:
+            return
+        self.json_content = deploy_thread.site_files["/wreaths.json"].decode('utf-8')
+        last_deploy = self.last_deploy
+        
+        if last_deploy and last_deploy['content_hash'] == site_hash:
+            reply = QMessageBox.question(
+                self.parent, "Website Up to Date",
+                f"Nothing has changed since the last deploy on {format_time(last_deploy['time'])}\n"
+                f"({last_deploy['wreath_count']} wreaths, deploy {last_deploy['deploy_id']}).\n\n"
+                "Deploy anyway?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                # Stop quietly, the user chose not to deploy
+                self.deploy_declined = True
+                deploy_thread.cancel()
+                return
+        
+        deploy_thread.proceed()
+        
+    def changes_since_deploy(self, last_deploy):
+        """Summary of changes since the last deploy, from its ledger snapshot when one is kept"""
+        snapshot = self.ledger.load_snapshot(last_deploy) if last_deploy else None
+        if snapshot is not None:
+            summary = changes_between(snapshot, self.wreaths_data).summary()
+            return f"{summary} (last deployed {format_time(last_deploy['time'])})"
+        if hasattr(self.parent, 'deploy_change_summary'):
+            return self.parent.deploy_change_summary()
+        return ""
+        
     def update_progress(self, message):
         """Update progress dialog with status message"""
         if hasattr(self, 'progress_dialog'):
             self.progress_dialog.setLabelText(message)
-            QApplication.processEvents()
+            
+    def show_progress_event(self, event):
+        """Show a deploy state change: the message, plus a bar while files upload"""
+        if not hasattr(self, 'progress_dialog') or self.progress_dialog.wasCanceled():
+            return
+        self.progress_dialog.setLabelText(f"{event['message']}\n({event['elapsed']:.0f} s)")
+        if event['total']:
+            self.progress_dialog.setRange(0, event['total'])
+            self.progress_dialog.setValue(event['done'])
+        else:
+            self.progress_dialog.setRange(0, 0)
             
     def cancel_deployment(self):
-        """Cancel the deployment"""
+        """Cancel the deployment; the thread stops at its next check and reports back"""
         if hasattr(self, 'deploy_thread') and self.deploy_thread.isRunning():
-            self.deploy_thread.quit()
-            if not self.deploy_thread.wait(3000):  # Wait 3 seconds
-                self.deploy_thread.terminate()  # Force terminate if needed
-                self.deploy_thread.wait(1000)
+            print("🛑 Cancelling deployment...")
+            self.deploy_thread.cancel()
+            
+    def cancel_rollback(self):
+        """Cancel a rollback; the thread gives up on its request and reports back"""
+        if hasattr(self, 'restore_thread') and self.restore_thread.isRunning():
+            print("🛑 Cancelling rollback...")
+            self.restore_thread.cancel()
+            
+    def shutdown(self):
+        """Cancel a running deploy or rollback and wait for its thread to stop (when the app closes)"""
+        for name in ('deploy_thread', 'restore_thread'):
+            thread = getattr(self, name, None)
+            if thread is not None and thread.isRunning():
+                thread.cancel()
+                thread.wait()
         
     def deployment_finished(self, success, message):
         """Handle deployment completion"""
-        # Clean up progress dialog
+        # Clean up progress dialog (closing it would otherwise count as a cancel)
         if hasattr(self, 'progress_dialog'):
+            self.progress_dialog.canceled.disconnect(self.cancel_deployment)
             self.progress_dialog.close()
             
-        # Clean up thread
+        # The thread has emitted its last signal; let it return from run()
         if hasattr(self, 'deploy_thread'):
-            self.deploy_thread.quit()
-            self.deploy_thread.wait(5000)  # Wait up to 5 seconds
+            self.deploy_thread.wait(5000)
             
-        if success:
+        if getattr(self, 'deploy_declined', False):
+            return
+        if getattr(getattr(self, 'deploy_thread', None), 'state', None) == CANCELLED:
+            QMessageBox.information(self.parent, "Deployment Cancelled", message)
+        elif success:
+            deploy_thread = getattr(self, 'deploy_thread', None)
+            if self.ledger and deploy_thread is not None and deploy_thread.deploy_id:
+                try:
+                    self.ledger.record(self.site_id, deploy_thread.deploy_id, deploy_thread.digests,
+                                       len(self.wreaths_data), self.change_summary, self.json_content)
+                except OSError as e:
+                    print(f"Could not update deploy history: {e}")
+            if hasattr(self.parent, 'on_deploy_succeeded'):
+                self.parent.on_deploy_succeeded()
             QMessageBox.information(self.parent, "Deployment Complete", message)
         else:
-            QMessageBox.critical(self.parent, "Deployment Failed", message)
\ No newline at end of file
+            QMessageBox.critical(self.parent, "Deployment Failed", message)
+            
+    def show_history(self):
+        """Show past deploys and roll back to one the user picks"""
+        site_id = self.settings.get('netlify_site_id', '').strip()
+        history = self.ledger.history(site_id) if self.ledger and site_id else []
+        if not history:
+            QMessageBox.information(self.parent, "Deploy History",
+                                    "No deploys have been recorded from this project folder yet.")
+            return
+        
+        from deploy_history_dialog_pyside import DeployHistoryDialog
+        dialog = DeployHistoryDialog(history, self.parent)
+        if dialog.exec() == QDialog.Accepted and dialog.selected_entry:
+            self.rollback(dialog.selected_entry)
+            
+    def rollback(self, entry):
+        """Make an earlier deploy live again; Netlify re-publishes it without any upload"""
+        site_id = entry['site_id']
+        access_token = self.settings.get('netlify_access_token', '').strip()
+        if not access_token:
+            QMessageBox.warning(self.parent, "Netlify Settings Missing",
+                                "A Netlify Access Token is required. Please add it in Settings.")
+            return
+        
+        reply = QMessageBox.question(
+            self.parent, "Roll Back Website",
+            f"Make the deploy from {format_time(entry['time'])} live again?\n\n"
+            f"The website will show its {entry['wreath_count']} wreaths. "
+            "Your local wreaths.json is not changed.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        self.rollback_entry = entry
+        self.progress_dialog = QProgressDialog("Restoring deploy...", "Cancel", 0, 0, self.parent)
+        self.progress_dialog.setWindowTitle("Rolling Back Website")
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_dialog.show()
+        
+        self.restore_thread = NetlifyRestoreThread(
+            site_id, access_token, entry['deploy_id'],
+            self.settings.get('netlify_api_base', DEFAULT_API_BASE)
+        )
+        self.restore_thread.progress.connect(self.update_progress)
+        self.restore_thread.finished.connect(self.rollback_finished)
+        self.progress_dialog.canceled.connect(self.cancel_rollback)
+        self.restore_thread.start()
+        
+    def rollback_finished(self, success, message):
+        """Record a finished rollback in the deploy history"""
+        # Closing the dialog would otherwise count as a cancel
+        if hasattr(self, 'progress_dialog'):
+            self.progress_dialog.canceled.disconnect(self.cancel_rollback)
+            self.progress_dialog.close()
+        self.restore_thread.wait(5000)
+        
+        if success:
+            entry = self.rollback_entry
+            try:
+                self.ledger.record(entry['site_id'], entry['deploy_id'], entry['files'], entry['wreath_count'],
+                                   f"Rolled back to the deploy of {format_time(entry['time'])}", kind='rollback')
+            except OSError as e:
+                print(f"Could not update deploy history: {e}")
+            QMessageBox.information(self.parent, "Rollback Complete", message)
+        elif self.restore_thread.cancel_token.cancelled:
+            QMessageBox.information(self.parent, "Rollback Cancelled", message)
+        else:
+            QMessageBox.critical(self.parent, "Rollback Failed", message)
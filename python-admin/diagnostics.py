@@ -0,0 +1,221 @@
+# File: python-admin/diagnostics.py
+# Live object counters, tracemalloc snapshots and a growth watchdog for finding leaks
+
+import os
+import gc
+import threading
+import tracemalloc
+import weakref
+from collections import deque
+from datetime import datetime
+
+try:
+    from shiboken6 import isValid
+except ImportError:
+    def isValid(obj):
+        return True
+
+
+def pixmap_bytes(pixmap):
+    """Approximate memory held by a QPixmap"""
+    if pixmap is None or pixmap.isNull():
+        return 0
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+def current_rss_bytes():
+    """Resident memory of this process, or None if it can't be read"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class LiveObjects:
+    """Weakly tracks Qt objects by category so live counts can be read at any time
+
+    Only weak references are kept, so tracking never extends an object's
+    life. An object counts as live while its Python wrapper exists and the
+    C++ object behind it has not been deleted.
+    """
+
+    def __init__(self):
+        self._objects = {}  # category -> WeakSet
+        self._created = {}  # category -> number ever tracked
+        self._lock = threading.Lock()
+
+    def track(self, category, obj):
+        with self._lock:
+            objects = self._objects.get(category)
+            if objects is None:
+                objects = self._objects[category] = weakref.WeakSet()
+            objects.add(obj)
+            self._created[category] = self._created.get(category, 0) + 1
+        return obj
+
+    def live(self, category):
+        """Objects of a category that still exist"""
+        with self._lock:
+            objects = list(self._objects.get(category, ()))
+        return [obj for obj in objects if isValid(obj)]
+
+    def counts(self):
+        """{category: (live, created)}"""
+        with self._lock:
+            categories = list(self._objects)
+        return {category: (len(self.live(category)), self._created.get(category, 0)) for category in categories}
+
+
+# Shared registry for the app
+live_objects = LiveObjects()
+
+
+def collect_counters(table_widget=None):
+    """Counts of threads, cell widgets and pixmap memory right now
+
+    With the table given, cell widgets that are alive but no longer in the
+    table are reported separately; those are the ones that leak.
+    """
+    threads = live_objects.live("threads")
+    image_widgets = live_objects.live("image widgets")
+    action_widgets = live_objects.live("action widgets")
+    thumbnails = live_objects.live("viewer thumbnails")
+
+    counters = {
+        "threads alive": len(threads),
+        "threads running": sum(1 for thread in threads if thread.isRunning()),
+        "python threads": threading.active_count(),
+        "image widgets": len(image_widgets),
+        "action widgets": len(action_widgets),
+        "viewer thumbnails": len(thumbnails),
+        "pixmap bytes": sum(pixmap_bytes(widget.pixmap()) for widget in image_widgets + thumbnails),
+        "python objects": len(gc.get_objects()),
+        "rss bytes": current_rss_bytes(),
+    }
+
+    if table_widget is not None:
+        in_table = set()
+        for row in range(table_widget.rowCount()):
+            for column in (0, table_widget.columnCount() - 1):
+                widget = table_widget.cellWidget(row, column)
+                if widget is not None:
+                    in_table.add(widget)
+        detached = [widget for widget in image_widgets + action_widgets if widget not in in_table]
+        counters["cell widgets in table"] = len(in_table)
+        counters["detached cell widgets"] = len(detached)
+        counters["detached pixmap bytes"] = sum(
+            pixmap_bytes(widget.pixmap()) for widget in detached if hasattr(widget, 'pixmap'))
+    return counters
+
+
+def live_counters(table_rows=None):
+    """The cheap subset of collect_counters, read from live_objects alone
+
+    Skips the garbage-collector walk, the table walk and pixmap sizes, so it
+    can run after every table refresh. Given the number of rendered table
+    rows (one image and one action widget each), cell widgets beyond those
+    are counted as detached.
+    """
+    counters = {
+        "threads alive": len(live_objects.live("threads")),
+        "image widgets": len(live_objects.live("image widgets")),
+        "action widgets": len(live_objects.live("action widgets")),
+        "viewer thumbnails": len(live_objects.live("viewer thumbnails")),
+    }
+    if table_rows is not None:
+        counters["detached cell widgets"] = counters["image widgets"] + counters["action widgets"] - 2 * table_rows
+    return counters
+
+
+class MemorySnapshots:
+    """tracemalloc snapshots taken on demand, each compared with the one before"""
+
+    def __init__(self, frames=10, keep=5):
+        self.frames = frames
+        self.snapshots = deque(maxlen=keep)  # (label, time, snapshot)
+
+    @property
+    def tracing(self):
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.snapshots.clear()
+
+    def take(self, label=None, limit=15):
+        """Take a snapshot and describe the top allocations (or growth since the last one)"""
+        self.start()
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        label = label or datetime.now().strftime("%H:%M:%S")
+        lines = [f"Snapshot {label}: {current / 1024 / 1024:.1f} MB traced (peak {peak / 1024 / 1024:.1f} MB)"]
+
+        if self.snapshots:
+            previous_label, _, previous = self.snapshots[-1]
+            lines.append(f"Largest growth since {previous_label}:")
+            for stat in snapshot.compare_to(previous, 'lineno')[:limit]:
+                lines.append(f"  {stat}")
+        else:
+            lines.append("Largest allocations:")
+            for stat in snapshot.statistics('lineno')[:limit]:
+                lines.append(f"  {stat}")
+
+        self.snapshots.append((label, datetime.now(), snapshot))
+        return "\n".join(lines)
+
+
+class GrowthWatchdog:
+    """Warns when counters rise on every one of several refreshes in a row
+
+    A count that goes up and down is normal; one that only ever goes up
+    across refreshes that should leave the app in the same state is a leak.
+    """
+
+    # Counters watched, with the smallest total rise worth a warning
+    WATCHED = {
+        "threads alive": 4,
+        "detached cell widgets": 10,
+        "viewer thumbnails": 10,
+    }
+
+    def __init__(self, samples=5):
+        self.history = deque(maxlen=samples)
+        self.warned = set()
+
+    def sample(self, counters):
+        """Add one sample; returns warnings for counters that keep growing"""
+        self.history.append(counters)
+        if len(self.history) < self.history.maxlen:
+            return []
+
+        warnings = []
+        for name, minimum in self.WATCHED.items():
+            values = [sample.get(name) for sample in self.history]
+            if None in values:
+                continue
+            growing = all(later > earlier for earlier, later in zip(values, values[1:]))
+            if growing and values[-1] - values[0] >= minimum:
+                if name not in self.warned:
+                    self.warned.add(name)
+                    warnings.append(
+                        f"{name} grew on each of the last {len(values) - 1} refreshes "
+                        f"({values[0]} → {values[-1]})"
+                    )
+            else:
+                self.warned.discard(name)
+        return warnings
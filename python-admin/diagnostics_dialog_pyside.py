@@ -0,0 +1,166 @@
+# File: python-admin/diagnostics_dialog_pyside.py
+# Diagnostics windows: live counters, tracemalloc snapshots, leak warnings and UI stalls
+
+import gc
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                            QPushButton, QTextEdit, QGroupBox, QGridLayout,
+                            QDialogButtonBox)
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont
+
+from diagnostics import collect_counters
+from stall_monitor import rank_stalls, format_ranking
+
+
+def format_count(name, value):
+    if value is None:
+        return "n/a"
+    if name.endswith("bytes"):
+        return f"{value / 1024 / 1024:.1f} MB"
+    return str(value)
+
+
+class DiagnosticsDialog(QDialog):
+    """Non-modal window that refreshes the live counters every second"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent_app = parent
+
+        self.setWindowTitle("Memory Diagnostics")
+        self.resize(700, 600)
+
+        self.init_ui()
+        self.refresh_counters()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(1000)
+        self.refresh_timer.timeout.connect(self.refresh_counters)
+        self.refresh_timer.start()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        # Live counters
+        counters_group = QGroupBox("Live Objects")
+        self.counters_layout = QGridLayout(counters_group)
+        self.counter_labels = {}
+        layout.addWidget(counters_group)
+
+        # Leak warnings from the watchdog
+        self.warnings_label = QLabel()
+        self.warnings_label.setWordWrap(True)
+        self.warnings_label.setStyleSheet("color: #b00020;")
+        layout.addWidget(self.warnings_label)
+
+        # tracemalloc snapshots
+        snapshot_group = QGroupBox("Python Allocations (tracemalloc)")
+        snapshot_layout = QVBoxLayout(snapshot_group)
+
+        button_row = QHBoxLayout()
+        self.snapshot_btn = QPushButton("Take Snapshot")
+        self.snapshot_btn.setToolTip("Starts tracing on first use; later snapshots show growth since the previous one")
+        self.snapshot_btn.clicked.connect(self.take_snapshot)
+        button_row.addWidget(self.snapshot_btn)
+
+        self.stop_btn = QPushButton("Stop Tracing")
+        self.stop_btn.clicked.connect(self.stop_tracing)
+        button_row.addWidget(self.stop_btn)
+
+        gc_btn = QPushButton("Run Garbage Collection")
+        gc_btn.clicked.connect(self.collect_garbage)
+        button_row.addWidget(gc_btn)
+        button_row.addStretch()
+        snapshot_layout.addLayout(button_row)
+
+        self.snapshot_output = QTextEdit()
+        self.snapshot_output.setReadOnly(True)
+        self.snapshot_output.setFont(QFont("Courier New", 9))
+        self.snapshot_output.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        snapshot_layout.addWidget(self.snapshot_output)
+        layout.addWidget(snapshot_group)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        button_box.rejected.connect(self.close)
+        layout.addWidget(button_box)
+
+        self.update_tracing_buttons()
+
+    def refresh_counters(self):
+        """Re-read the counters and the watchdog's warnings"""
+        counters = collect_counters(self.parent_app.table_widget)
+        for name, value in counters.items():
+            if name not in self.counter_labels:
+                row = len(self.counter_labels)
+                self.counters_layout.addWidget(QLabel(f"{name.capitalize()}:"), row // 2, (row % 2) * 2)
+                value_label = QLabel()
+                value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+                self.counters_layout.addWidget(value_label, row // 2, (row % 2) * 2 + 1)
+                self.counter_labels[name] = value_label
+            self.counter_labels[name].setText(format_count(name, value))
+
+        warnings = self.parent_app.leak_warnings
+        self.warnings_label.setText("\n".join(f"⚠ {warning}" for warning in warnings))
+        self.warnings_label.setVisible(bool(warnings))
+
+    def take_snapshot(self):
+        self.snapshot_output.append(self.parent_app.memory_snapshots.take() + "\n")
+        self.update_tracing_buttons()
+
+    def stop_tracing(self):
+        self.parent_app.memory_snapshots.stop()
+        self.snapshot_output.append("Tracing stopped.\n")
+        self.update_tracing_buttons()
+
+    def collect_garbage(self):
+        collected = gc.collect()
+        self.snapshot_output.append(f"Garbage collection freed {collected} objects.\n")
+        self.refresh_counters()
+
+    def update_tracing_buttons(self):
+        tracing = self.parent_app.memory_snapshots.tracing
+        self.snapshot_btn.setText("Take Snapshot" if tracing else "Start Tracing && Take Snapshot")
+        self.stop_btn.setEnabled(tracing)
+
+    def closeEvent(self, event):
+        self.refresh_timer.stop()
+        super().closeEvent(event)
+
+
+class StallReportDialog(QDialog):
+    """This session's UI stalls, worst first, with the stack of each group's longest one"""
+
+    def __init__(self, stalls, log_file=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("UI Stall Report")
+        self.resize(900, 550)
+
+        layout = QVBoxLayout(self)
+
+        summary = f"{len(stalls)} stalls this session"
+        if log_file:
+            summary += f"\nAll sessions are logged to {log_file}\n(rank them with: python stall_monitor.py \"{log_file}\")"
+        layout.addWidget(QLabel(summary))
+
+        report = QTextEdit()
+        report.setReadOnly(True)
+        report.setFont(QFont("Courier New", 9))
+        report.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        report.setPlainText(self.format_report(stalls) if stalls else "No stalls recorded yet.")
+        layout.addWidget(report)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    @staticmethod
+    def format_report(stalls):
+        ranking = rank_stalls(stalls)
+        lines = [format_ranking(ranking), ""]
+        for group in ranking[:10]:
+            worst = max((s for s in stalls if s["operation"] == group["operation"] and s["location"] == group["location"]),
+                        key=lambda s: s["duration_ms"])
+            lines.append(f"--- {group['operation']} @ {group['location']}: longest {worst['duration_ms']:.0f} ms at {worst['time']}")
+            lines.extend(f"    {frame}" for frame in worst["stack"][-12:])
+            lines.append("")
+        return "\n".join(lines)
@@ -0,0 +1,196 @@
+# File: python-admin/hashtag_engine.py
+# Batch hashtag processing for the whole wreath catalog
+
+import re
+import hashlib
+
+# Compiled once and shared by every extraction
+HASHTAG_PATTERN = re.compile(r'#(\w+)')
+
+
+def dedupe_tags(tags):
+    """Remove duplicate tags while keeping their first-seen order"""
+    return list(dict.fromkeys(tags))
+
+
+def normalize_existing_hashtags(hashtags):
+    """Turn a wreath's stored hashtags (list or comma string) into a list"""
+    if isinstance(hashtags, str):
+        return [tag.strip() for tag in hashtags.split(',') if tag.strip()]
+    if isinstance(hashtags, list):
+        return [tag for tag in hashtags if isinstance(tag, str) and tag]
+    return []
+
+
+def extract_hashtags(text):
+    """Extract unique lowercase hashtags from a block of text"""
+    if not text:
+        return []
+    return dedupe_tags(HASHTAG_PATTERN.findall(text.lower()))
+
+
+def description_digest(description):
+    """Content hash used to detect descriptions that changed"""
+    return hashlib.md5(description.encode('utf-8', 'surrogatepass')).digest()
+
+
+class HashtagEngine:
+    """Processes hashtags for many wreaths at once
+
+    Extraction results are remembered per wreath id together with a hash of the
+    description they came from, so reloading or re-importing a catalog only
+    re-runs the regex for descriptions that actually changed. Every tag goes
+    through a shared vocabulary so identical tags are a single string object.
+    """
+
+    def __init__(self):
+        self._vocabulary = {}
+        self._extracted = {}  # wreath id -> (description digest, extracted tags)
+
+    @property
+    def vocabulary(self):
+        """All distinct tags seen so far"""
+        return self._vocabulary.keys()
+
+    def intern(self, tag):
+        """Return the shared copy of a tag string"""
+        return self._vocabulary.setdefault(tag, tag)
+
+    def extract_for(self, wreath):
+        """Extract hashtags from a wreath's description, reusing cached results"""
+        description = wreath.get('description', '') or ''
+        if not description:
+            return []
+
+        wreath_id = wreath.get('id')
+        digest = description_digest(description)
+        cached = self._extracted.get(wreath_id) if wreath_id else None
+        if cached and cached[0] == digest:
+            return cached[1]
+
+        tags = [self.intern(tag) for tag in extract_hashtags(description)]
+        if wreath_id:
+            self._extracted[wreath_id] = (digest, tags)
+        return tags
+
+    def process_wreath(self, wreath):
+        """Merge description hashtags into a wreath's hashtag list
+
+        Returns the number of hashtags found in the description.
+        """
+        extracted = self.extract_for(wreath)
+        existing = normalize_existing_hashtags(wreath.get('hashtags', []))
+        merged = dict.fromkeys(self.intern(tag) for tag in existing)
+        merged.update(dict.fromkeys(extracted))
+        wreath['hashtags'] = list(merged)
+        return len(extracted)
+
+    def process_catalog(self, wreaths):
+        """Process hashtags for every wreath in a single pass
+
+        Returns the total number of hashtags found in descriptions.
+        """
+        process_wreath = self.process_wreath
+        return sum(process_wreath(wreath) for wreath in wreaths)
+
+    def forget(self, wreath_id):
+        """Drop cached extraction results for a deleted wreath"""
+        self._extracted.pop(wreath_id, None)
+
+    def clear(self):
+        """Forget all cached results (e.g. when switching project folders)"""
+        self._extracted.clear()
+        self._vocabulary.clear()
+
+
+class HashtagIndex:
+    """Inverted index from hashtag to the ids of the wreaths that use it
+
+    Kept up to date one wreath at a time, so edits, imports and deletes never
+    need a rescan of the catalog.
+    """
+
+    def __init__(self):
+        self._postings = {}    # tag -> set of wreath ids
+        self._tags_by_id = {}  # wreath id -> tags currently indexed for it
+
+    def __contains__(self, wreath_id):
+        return wreath_id in self._tags_by_id
+
+    def __len__(self):
+        return len(self._tags_by_id)
+
+    def add(self, wreath):
+        """Index a wreath, replacing whatever was indexed for its id"""
+        wreath_id = wreath.get('id')
+        if not wreath_id:
+            return
+        if wreath_id in self._tags_by_id:
+            self.remove(wreath_id)
+
+        tags = frozenset(tag.lower() for tag in normalize_existing_hashtags(wreath.get('hashtags', [])))
+        self._tags_by_id[wreath_id] = tags
+        postings = self._postings
+        for tag in tags:
+            ids = postings.get(tag)
+            if ids is None:
+                postings[tag] = {wreath_id}
+            else:
+                ids.add(wreath_id)
+
+    # Re-indexing an edited wreath is the same operation
+    update = add
+
+    def remove(self, wreath_id):
+        """Remove a wreath from the index"""
+        tags = self._tags_by_id.pop(wreath_id, ())
+        for tag in tags:
+            ids = self._postings.get(tag)
+            if ids is not None:
+                ids.discard(wreath_id)
+                if not ids:
+                    del self._postings[tag]
+
+    def rebuild(self, wreaths):
+        """Index a whole catalog from scratch"""
+        self._postings.clear()
+        self._tags_by_id.clear()
+        for wreath in wreaths:
+            self.add(wreath)
+
+    def ids_for(self, tag):
+        """Ids of wreaths tagged with a hashtag"""
+        return self._postings.get(tag.lower(), frozenset())
+
+    def ids_for_any(self, tags):
+        """Ids of wreaths tagged with at least one of the hashtags"""
+        result = set()
+        for tag in tags:
+            result |= self.ids_for(tag)
+        return result
+
+
+def load_filter_categories(data):
+    """Validate filter-config.json data and return its categories
+
+    Each category is a dict with a name and subcategories, and each
+    subcategory has a name and a list of hashtags (as on the website).
+    """
+    categories = []
+    if not isinstance(data, list):
+        return categories
+
+    for category in data:
+        if not isinstance(category, dict) or not category.get('name'):
+            continue
+        subcategories = []
+        for subcategory in category.get('subcategories', []):
+            if not isinstance(subcategory, dict) or not subcategory.get('name'):
+                continue
+            hashtags = [tag.strip().lstrip('#').lower() for tag in subcategory.get('hashtags', [])
+                        if isinstance(tag, str) and tag.strip()]
+            subcategories.append({'name': subcategory['name'], 'hashtags': hashtags})
+        if subcategories:
+            categories.append({'name': category['name'], 'subcategories': subcategories})
+
+    return categories
@@ -10,6 +10,8 @@ from PySide6.QtCore import Qt, QThread, Signal, QSize
 from PySide6.QtGui import QPixmap
 import requests
 
+from diagnostics import live_objects
+
 class ImageDownloadThread(QThread):
     """Thread for downloading images without blocking UI"""
     imageLoaded = Signal(str, QPixmap)  # url, pixmap
@@ -19,6 +21,7 @@ class ImageDownloadThread(QThread):
         super().__init__()
         self.url = url
         self.cache_folder = cache_folder
+        live_objects.track("threads", self)
     
     def get_cache_filename(self, url):
         """Generate cache filename from URL hash"""
@@ -73,6 +76,7 @@ class SimpleImageThumbnail(QLabel):
         self.index = index
         self.parent_dialog = parent
         self.cache_folder = parent.cache_folder if parent else None
+        live_objects.track("viewer thumbnails", self)
         
         # Set size for thumbnails
         self.setFixedSize(300, 300)
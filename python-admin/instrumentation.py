@@ -0,0 +1,119 @@
+# File: python-admin/instrumentation.py
+# Lightweight timing spans for hot paths, with Chrome trace export
+
+import os
+import json
+import time
+import threading
+import functools
+from collections import deque
+from contextlib import contextmanager
+
+
+class Tracer:
+    """Collects named timing spans from any thread
+
+    Spans are kept in a bounded buffer, so tracing can stay on for a whole
+    editing session. export_chrome_trace() writes them in the Trace Event
+    format that chrome://tracing and Perfetto open directly.
+    """
+
+    def __init__(self, max_events=200000, recent_per_name=20):
+        self.enabled = True
+        self._events = deque(maxlen=max_events)  # (name, start_us, duration_us, thread id, args)
+        self._recent = {}                         # name -> deque of recent durations (ms)
+        self._recent_per_name = recent_per_name
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._stacks = {}                         # thread id -> names of open spans
+
+    @contextmanager
+    def span(self, name, **args):
+        """Time the enclosed block as a span called name"""
+        if not self.enabled:
+            yield
+            return
+        stack = self._stack()
+        stack.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            stack.pop()
+            self.record(name, started, ended, args)
+
+    def traced(self, name):
+        """Decorator form of span() for whole functions"""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name, started, ended, args=None):
+        """Add a span measured elsewhere (perf_counter timestamps)"""
+        if not self.enabled:
+            return
+        event = (name, (started - self._origin) * 1e6, (ended - started) * 1e6, threading.get_ident(), args or None)
+        with self._lock:
+            self._events.append(event)
+            recent = self._recent.get(name)
+            if recent is None:
+                recent = self._recent[name] = deque(maxlen=self._recent_per_name)
+            recent.append((ended - started) * 1000)
+
+    def _stack(self):
+        thread_id = threading.get_ident()
+        stack = self._stacks.get(thread_id)
+        if stack is None:
+            stack = self._stacks[thread_id] = []
+        return stack
+
+    def active_span(self, thread_id=None):
+        """Innermost span open on a thread (default: the calling thread), or None"""
+        stack = self._stacks.get(threading.get_ident() if thread_id is None else thread_id)
+        try:
+            return stack[-1] if stack else None
+        except IndexError:
+            return None  # The span closed while another thread was looking
+
+    def recent_latencies(self, names=None):
+        """{name: (last ms, mean ms)} for recently recorded spans"""
+        with self._lock:
+            items = [(name, list(values)) for name, values in self._recent.items()
+                     if values and (names is None or name in names)]
+        return {name: (values[-1], sum(values) / len(values)) for name, values in items}
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self._recent.clear()
+
+    def chrome_trace(self):
+        """Spans as a Chrome Trace Event dict"""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+        trace_events = []
+        for name, start_us, duration_us, thread_id, args in events:
+            event = {"name": name, "cat": name.split('.')[0], "ph": "X",
+                     "ts": round(start_us, 1), "dur": round(duration_us, 1), "pid": pid, "tid": thread_id}
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, file_path):
+        """Write the collected spans to a Chrome trace JSON file"""
+        with open(file_path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+        return len(self._events)
+
+
+# Shared tracer for the app
+tracer = Tracer()
+span = tracer.span
+traced = tracer.traced
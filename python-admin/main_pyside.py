@@ -2,17 +2,20 @@
 # Twinfolks Door Decor - Wreath Management System
 # FIXED: Settings persistence for project folder location + Working Sorting
 
+# Started first so the profile covers every import below
+from startup_profiler import startup_profile
+
 import sys
 import os
 import json
-import requests
+import time
 from pathlib import Path
 from datetime import datetime
-import shutil
 import uuid
-import re  # For hashtag extraction
 import hashlib
-import chardet  # For encoding detection
+startup_profile.mark("import standard library")
+# requests, chardet, shutil and the dialog modules are imported where they
+# are used, so they stay off the startup path
 
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                             QWidget, QPushButton, QTableWidget, QTableWidgetItem, 
@@ -22,12 +25,19 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayo
                             QMenu, QSplitter, QGroupBox, QGridLayout, QComboBox,
                             QTabWidget, QAbstractItemView, QFrame)
 from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSize, QStandardPaths
-from PySide6.QtGui import QPixmap, QIcon, QAction, QFont, QColor, QPalette
+from PySide6.QtGui import QPixmap, QImage, QIcon, QAction, QFont, QColor, QPalette, QBrush
+startup_profile.mark("import PySide6")
 
-from image_viewer_pyside import ImageViewerDialog
-from settings_dialog_pyside import SettingsDialog
-from wreath_editor_pyside import WreathEditorDialog
-from deploy_manager_pyside import DeployManager
+from hashtag_engine import HashtagEngine, HashtagIndex, extract_hashtags, load_filter_categories
+from search_index import SearchIndex
+from sort_keys import SortKeyCache, SORT_PRESETS, SORT_FIELDS
+from settings_store import SettingsStore, atomic_write_text
+from change_tracker import ChangeTracker, CatalogSerializer, diff_fields
+from wreath_record import Wreath, to_json_value
+from instrumentation import tracer, span, traced
+from diagnostics import live_objects, live_counters, MemorySnapshots, GrowthWatchdog
+from stall_monitor import StallMonitor
+startup_profile.mark("import app modules")
 
 class AppLocationManager:
     """Manages the app's current project folder location in a persistent way"""
@@ -83,6 +93,7 @@ class FileEncodingHelper:
     def detect_encoding(file_path):
         """Detect the encoding of a file"""
         try:
+            import chardet  # For encoding detection
             with open(file_path, 'rb') as file:
                 raw_data = file.read()
                 result = chardet.detect(raw_data)
@@ -98,6 +109,22 @@ class FileEncodingHelper:
         """
         file_path = Path(file_path)
         
+        # Fast path: almost every file is UTF-8 (with or without a BOM), and
+        # reading it directly avoids importing chardet and scanning the bytes
+        try:
+            with open(file_path, 'r', encoding='utf-8-sig') as file:
+                content = file.read()
+        except UnicodeDecodeError:
+            content = None
+        except Exception as e:
+            return False, None, None, f"Could not read file: {str(e)}"
+        
+        if content is not None:
+            try:
+                return True, json.loads(content), 'utf-8', None
+            except json.JSONDecodeError as e:
+                return False, None, 'utf-8', f"JSON parsing error with utf-8: {str(e)}"
+        
         # List of encodings to try
         encodings_to_try = [
             'utf-8',
@@ -136,63 +163,49 @@ class FileEncodingHelper:
 class HashtagExtractor:
     """Extract and process hashtags from wreath descriptions"""
     
+    # Engine shared by the whole app so cached extractions survive reloads
+    shared_engine = HashtagEngine()
+    
     @staticmethod
     def extract_hashtags_from_text(text):
         """Extract hashtags from text description"""
-        if not text:
-            return []
-        
-        # Find all hashtags (words that start with #)
-        hashtag_pattern = r'#(\w+)'
-        matches = re.findall(hashtag_pattern, text.lower())
-        
-        # Clean and deduplicate
-        hashtags = []
-        for tag in matches:
-            tag = tag.strip()
-            if tag and tag not in hashtags:
-                hashtags.append(tag)
-        
-        return hashtags
+        return extract_hashtags(text)
     
     @staticmethod
-    def process_wreath_hashtags(wreath):
+    def process_wreath_hashtags(wreath, engine=None):
         """Process hashtags for a single wreath from its description"""
-        description = wreath.get('description', '')
-        
-        # Extract hashtags from description
-        extracted_hashtags = HashtagExtractor.extract_hashtags_from_text(description)
-        
-        # Get existing hashtags
-        existing_hashtags = wreath.get('hashtags', [])
-        if isinstance(existing_hashtags, str):
-            # Convert string to list
-            existing_hashtags = [tag.strip() for tag in existing_hashtags.split(',') if tag.strip()]
-        elif not isinstance(existing_hashtags, list):
-            existing_hashtags = []
-        
-        # Combine and deduplicate
-        all_hashtags = existing_hashtags.copy()
-        for tag in extracted_hashtags:
-            if tag not in all_hashtags:
-                all_hashtags.append(tag)
-        
-        # Update wreath
-        wreath['hashtags'] = all_hashtags
-        
-        return len(extracted_hashtags)  # Return count of newly extracted hashtags
+        engine = engine or HashtagExtractor.shared_engine
+        return engine.process_wreath(wreath)  # Return count of newly extracted hashtags
 
 class ImageDownloadThread(QThread):
     """Thread for downloading images without blocking UI"""
-    image_downloaded = Signal(str, QPixmap)  # url, pixmap
+    image_downloaded = Signal(str, QImage)  # url, image
     
     # Class-level cache of failed URLs to avoid retrying
     _failed_urls = set()
     
+    # Threads not yet finished, so the app can wait for them on exit
+    _active = set()
+    
     def __init__(self, url, cache_folder=None):
-        super().__init__()
+        # Owned by the application rather than the widget, so a table refresh
+        # that replaces the widget never destroys a thread that is still running
+        super().__init__(QApplication.instance())
         self.url = url
         self.cache_folder = cache_folder
+        ImageDownloadThread._active.add(self)
+        live_objects.track("threads", self)
+        self.finished.connect(self.on_finished)
+        
+    def on_finished(self):
+        ImageDownloadThread._active.discard(self)
+        self.deleteLater()
+        
+    @classmethod
+    def wait_for_active(cls, msecs=6000):
+        """Let running downloads finish before the application object goes away"""
+        for thread in list(cls._active):
+            thread.wait(msecs)
     
     def get_cache_filename(self, url):
         """Generate cache filename from URL hash"""
@@ -207,30 +220,38 @@ class ImageDownloadThread(QThread):
                 return
             
             # Check cache first
+            # QImage is safe off the GUI thread; the widget converts it to a QPixmap
             cache_file = self.get_cache_filename(self.url)
-            pixmap = QPixmap()
+            image = QImage()
             
             if cache_file and os.path.exists(cache_file):
                 # Load from cache
-                if pixmap.load(cache_file):
-                    scaled_pixmap = pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    self.image_downloaded.emit(self.url, scaled_pixmap)
+                with span("image.decode", source="cache"):
+                    loaded = image.load(cache_file)
+                    if loaded:
+                        scaled_image = image.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                if loaded:
+                    self.image_downloaded.emit(self.url, scaled_image)
                     return
             
-            # Download from URL
-            response = requests.get(self.url, timeout=5)
-            response.raise_for_status()
+            # Download from URL (cache hits never need requests)
+            import requests
+            with span("image.fetch"):
+                response = requests.get(self.url, timeout=5)
+                response.raise_for_status()
             
-            pixmap.loadFromData(response.content)
+            with span("image.decode", source="network"):
+                image.loadFromData(response.content)
             
-            if not pixmap.isNull():
+            if not image.isNull():
                 # Save to cache if cache folder exists
                 if cache_file and self.cache_folder and os.path.exists(self.cache_folder):
-                    pixmap.save(cache_file, "JPG")
+                    image.save(cache_file, "JPG")
                 
                 # Scale to 80x80 for table display
-                scaled_pixmap = pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.image_downloaded.emit(self.url, scaled_pixmap)
+                with span("image.decode", source="scale"):
+                    scaled_image = image.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                self.image_downloaded.emit(self.url, scaled_image)
                 
         except Exception as e:
             # Add to failed URLs cache to avoid retrying
@@ -241,6 +262,80 @@ class ImageDownloadThread(QThread):
             elif len(ImageDownloadThread._failed_urls) == 6:
                 print(f"Suppressing further image download error messages...")
 
+def prepare_loaded_wreaths(records, seen_ids, hashtag_engine, normalized=None):
+    """Turn raw wreaths.json dicts into normalized Wreath records
+
+    Fills in missing fields, makes ids unique across calls sharing seen_ids
+    and merges description hashtags. If a normalized dict is passed, the
+    raw record of every wreath this changed is added to it under the
+    wreath's final id. Safe to run off the GUI thread.
+    """
+    records = [record for record in records if isinstance(record, dict)]
+    wreaths = [Wreath.from_dict(record) for record in records]
+    for wreath in wreaths:
+        if 'featured' not in wreath:
+            wreath['featured'] = False
+        if not wreath.get('dateCreated'):
+            # Auto-set the date for existing records
+            wreath['dateCreated'] = '1900-01-01'
+        if not wreath.get('id') or wreath['id'] in seen_ids:
+            wreath['id'] = str(uuid.uuid4())
+        seen_ids.add(wreath['id'])
+    
+    # Process hashtags from descriptions in one pass over the batch
+    hashtag_engine.process_catalog(wreaths)
+    
+    if normalized is not None:
+        for record, wreath in zip(records, wreaths):
+            if diff_fields(record, wreath):
+                normalized[wreath['id']] = record
+    return wreaths
+
+class CatalogLoadThread(QThread):
+    """Thread that reads and normalizes wreaths.json without blocking the UI"""
+    chunk_loaded = Signal(object)       # list of Wreath records, in file order
+    load_failed = Signal(bool, str, str)  # critical, title, message
+    
+    # Records handed to the UI per signal
+    CHUNK_SIZE = 250
+    
+    def __init__(self, wreaths_file, hashtag_engine, parent=None):
+        super().__init__(parent)
+        live_objects.track("threads", self)
+        self.wreaths_file = wreaths_file
+        self.hashtag_engine = hashtag_engine
+        self.normalized = {}  # wreath id -> raw record, for wreaths the load changed
+        self.finished.connect(self.deleteLater)
+        
+    def run(self):
+        if not self.wreaths_file.exists():
+            return
+        
+        # Use robust file reading
+        with span("catalog.read"):
+            success, data, encoding_used, error_msg = FileEncodingHelper.read_json_file_robust(self.wreaths_file)
+        if not success:
+            self.load_failed.emit(
+                True, "Data Load Error",
+                f"Could not load wreaths.json:\n{error_msg}\n\nStarting with empty data."
+            )
+            return
+        if not isinstance(data, list):
+            self.load_failed.emit(
+                False, "Data Format Warning",
+                "Your wreaths.json file doesn't contain a list of wreaths.\nStarting with empty data."
+            )
+            return
+        
+        seen_ids = set()
+        for start in range(0, len(data), self.CHUNK_SIZE):
+            if self.isInterruptionRequested():
+                return
+            with span("catalog.prepare", rows=min(self.CHUNK_SIZE, len(data) - start)):
+                chunk = prepare_loaded_wreaths(data[start:start + self.CHUNK_SIZE], seen_ids, self.hashtag_engine,
+                                               self.normalized)
+            self.chunk_loaded.emit(chunk)
+
 class WreathImageWidget(QLabel):
     """Custom widget to display wreath images in table"""
     
@@ -251,6 +346,7 @@ class WreathImageWidget(QLabel):
         self.setFixedSize(80, 80)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setStyleSheet("border: 1px solid #ccc; background-color: #f5f5f5;")
+        live_objects.track("image widgets", self)
         
         if image_url:
             self.setText("Loading...")
@@ -260,12 +356,51 @@ class WreathImageWidget(QLabel):
         else:
             self.setText("No Image")
             
-    def set_image(self, url, pixmap):
+    def set_image(self, url, image):
         """Set the downloaded image"""
         if url == self.image_url:
-            self.setPixmap(pixmap)
+            self.setPixmap(QPixmap.fromImage(image))
             self.setText("")
 
+class DescriptionItem(QTableWidgetItem):
+    """Description cell that reads its text from the wreath only when Qt asks
+
+    No copy of the description is stored in the item: the truncated display
+    text and the full tooltip are produced from the wreath on demand.
+    """
+
+    PREVIEW_LENGTH = 100
+
+    def __init__(self, wreath):
+        super().__init__()
+        self.wreath = wreath
+
+    def data(self, role):
+        if role == Qt.ItemDataRole.DisplayRole:
+            description = self.wreath.get('description', '') or ''
+            if len(description) > self.PREVIEW_LENGTH:
+                return description[:self.PREVIEW_LENGTH] + "..."
+            return description
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.wreath.get('description', '') or None
+        return super().data(role)
+
+
+class RowOrderItem(QTableWidgetItem):
+    """Placeholder item that sorts a table row to a given position
+
+    Sorting the table model moves whole rows, cell widgets included, so
+    rows can be reordered without rebuilding their images and buttons.
+    """
+
+    def __init__(self, position):
+        super().__init__()
+        self.position = position
+
+    def __lt__(self, other):
+        return self.position < other.position
+
+
 class WreathTableWidget(QTableWidget):
     """Custom table widget for wreaths"""
     
@@ -304,12 +439,16 @@ class WreathTableWidget(QTableWidget):
         self.setColumnWidth(7, 100)  # Date Created
         self.setColumnWidth(8, 160)  # Actions
         
-        # We'll connect the signal from the main manager instead
+        # Header clicks sort through the main manager (Shift+click adds a key)
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(False)
         
         # Set row height to accommodate images
         self.verticalHeader().setDefaultSectionSize(90)
  
 class TwinfolksWreathManager(QMainWindow):
+    catalog_loaded = Signal()  # Emitted when a catalog load has finished
+    
     def __init__(self):
         super().__init__()
         
@@ -326,28 +465,65 @@ class TwinfolksWreathManager(QMainWindow):
         self.wreaths_data = []
         self.filtered_wreaths_data = []  # For filtered display
         self.settings = {}
+        self.settings_store = SettingsStore(parent=self)
         self.changes_made = False
+        self.change_tracker = ChangeTracker()
+        self.catalog_serializer = CatalogSerializer()
+        self.hashtag_engine = HashtagExtractor.shared_engine
+        self.hashtag_index = HashtagIndex()
+        self.search_index = SearchIndex()
+        self.wreaths_by_id = {}
         
         # Filter state
         self.active_filters = {"show_all": True, "featured": False, "sold": False, "available": False}
-        
-        # Load data
+        self.filter_categories = []  # Category facets from filter-config.json
+        self.active_facets = set()   # (category name, subcategory name) pairs
+        self.facet_buttons = {}
+        self.search_text = ""
+        
+        # Sort state: (field, descending) pairs, most significant first
+        self.sort_key_cache = SortKeyCache()
+        self.sort_spec = SORT_PRESETS["Featured (Default)"][:]
+        
+        # Leak watchdog: counters are sampled once a table refresh has settled
+        self.memory_snapshots = MemorySnapshots()
+        self.leak_watchdog = GrowthWatchdog()
+        self.leak_warnings = []
+        self.diagnostics_dialog = None
+        
+        # Background catalog loading
+        self.catalog_loader = None
+        self.catalog_loading = False
+        self.editing_controls = []
+        
+        # Load settings and filter config (small files)
         self.load_settings()
-        self.load_wreaths()
+        self.load_filter_config()
+        startup_profile.mark("settings and filter config")
+        
+        # Event-loop lag watchdog, started once the event loop is running
+        self.stall_monitor = StallMonitor(
+            self.settings.get('stall_threshold_ms', 200), self.stall_log_file(), self
+        )
+        self.stall_monitor.stall_detected.connect(self.on_ui_stall)
+        QTimer.singleShot(0, self.stall_monitor.start)
         
         # Setup UI
         self.init_ui()
-        self.populate_table()
         
         # Load saved column widths
         self.load_column_widths()
         
         # Update window title with current folder
         self.setWindowTitle(f"Twinfolks Wreath Manager - {self.project_folder}")
+        startup_profile.mark("build UI")
+        
+        # The catalog streams in on a worker while the window is already showing
+        self.start_catalog_load()
         
     def ensure_project_structure(self):
         """Ensure required directories exist"""
-        directories = ['backups', 'imports', 'exports', 'encoding_backups']
+        directories = ['backups', 'imports', 'exports', 'encoding_backups', 'logs', 'deploys']
         for directory in directories:
             (self.project_folder / directory).mkdir(exist_ok=True)
             
@@ -364,6 +540,8 @@ class TwinfolksWreathManager(QMainWindow):
                 f.write("- imports/ (JSON files to import)\n")
                 f.write("- exports/ (exported files)\n")
                 f.write("- encoding_backups/ (problematic file backups)\n")
+                f.write("- logs/ (UI freeze reports)\n")
+                f.write("- deploys/ (website deploy history)\n")
         
     def setup_cache_folder(self):
         """Create and setup image cache folder"""
@@ -389,6 +567,7 @@ class TwinfolksWreathManager(QMainWindow):
         self.create_toolbar(layout)
         self.create_main_table(layout)
         self.create_status_bar()
+        self.perf_overlay_action.setChecked(self.settings.get('show_performance_overlay', False))
         
     def create_menu_bar(self):
         """Create the menu bar"""
@@ -400,6 +579,7 @@ class TwinfolksWreathManager(QMainWindow):
         import_action = QAction('Import Wreaths...', self)
         import_action.triggered.connect(self.import_wreaths)
         file_menu.addAction(import_action)
+        self.editing_controls.append(import_action)
         
         export_action = QAction('Export Wreaths...', self)
         export_action.triggered.connect(self.export_wreaths)
@@ -407,9 +587,17 @@ class TwinfolksWreathManager(QMainWindow):
         
         file_menu.addSeparator()
         
+        deploy_history_action = QAction('Deploy History...', self)
+        deploy_history_action.triggered.connect(self.show_deploy_history)
+        file_menu.addAction(deploy_history_action)
+        self.editing_controls.append(deploy_history_action)
+        
+        file_menu.addSeparator()
+        
         settings_action = QAction('Settings...', self)
         settings_action.triggered.connect(self.open_settings)
         file_menu.addAction(settings_action)
+        self.editing_controls.append(settings_action)
         
         file_menu.addSeparator()
         
@@ -417,6 +605,26 @@ class TwinfolksWreathManager(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
+        # View menu
+        view_menu = menubar.addMenu('View')
+        
+        self.perf_overlay_action = QAction('Performance Overlay', self)
+        self.perf_overlay_action.setCheckable(True)
+        self.perf_overlay_action.toggled.connect(self.set_performance_overlay)
+        view_menu.addAction(self.perf_overlay_action)
+        
+        export_trace_action = QAction('Export Performance Trace...', self)
+        export_trace_action.triggered.connect(self.export_performance_trace)
+        view_menu.addAction(export_trace_action)
+        
+        diagnostics_action = QAction('Memory Diagnostics...', self)
+        diagnostics_action.triggered.connect(self.open_diagnostics)
+        view_menu.addAction(diagnostics_action)
+        
+        stall_report_action = QAction('UI Stall Report...', self)
+        stall_report_action.triggered.connect(self.show_stall_report)
+        view_menu.addAction(stall_report_action)
+        
     def create_toolbar(self, layout):
         """Create the toolbar with buttons and status"""
         toolbar = QHBoxLayout()
@@ -436,6 +644,9 @@ class TwinfolksWreathManager(QMainWindow):
         deploy_btn.clicked.connect(self.deploy_to_netlify)
         toolbar.addWidget(deploy_btn)
         
+        # Disabled until the catalog has finished loading
+        self.editing_controls += [add_btn, save_btn, deploy_btn]
+        
         # Changes indicator
         self.changes_label = QLabel("No unsaved changes")
         self.changes_label.setStyleSheet("color: #16a34a; font-weight: bold;")
@@ -449,6 +660,18 @@ class TwinfolksWreathManager(QMainWindow):
         # Filter and Sort controls
         controls_layout = QVBoxLayout()
         
+        # Search box
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(QLabel("Search:"))
+        
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search titles, descriptions and hashtags...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.on_search_changed)
+        search_layout.addWidget(self.search_edit)
+        
+        controls_layout.addLayout(search_layout)
+        
         # Filter toggle buttons
         filter_layout = QHBoxLayout()
         filter_layout.addWidget(QLabel("Filter:"))
@@ -477,6 +700,11 @@ class TwinfolksWreathManager(QMainWindow):
         filter_layout.addStretch()
         controls_layout.addLayout(filter_layout)
         
+        # Category facets from filter-config.json (rebuilt when the config is reloaded)
+        self.facet_layout = QVBoxLayout()
+        controls_layout.addLayout(self.facet_layout)
+        self.build_facet_buttons()
+        
         # Sort controls
         sort_layout = QHBoxLayout()
         
@@ -502,166 +730,293 @@ class TwinfolksWreathManager(QMainWindow):
         # Main table
         self.table_widget = WreathTableWidget()
         
+        # Rows are filled in chunks between event-loop turns
+        self.pending_rows = []
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.timeout.connect(self.render_next_chunk)
+        
+        self.leak_check_timer = QTimer(self)
+        self.leak_check_timer.setSingleShot(True)
+        self.leak_check_timer.setInterval(2000)
+        self.leak_check_timer.timeout.connect(self.check_for_leaks)
+        
         # Connect column resize signal for persistence
         header = self.table_widget.horizontalHeader()
         header.sectionResized.connect(self.on_column_resized)
+        header.sectionClicked.connect(self.on_header_clicked)
         
         layout.addWidget(self.table_widget)
         
+    # Sortable columns and the sort field each one uses
+    SORT_COLUMNS = {1: 'title', 2: 'sold', 3: 'featured', 4: 'price', 7: 'date'}
+    
     def apply_sort(self, sort_text):
         """Apply sorting to wreaths data and refresh table"""
-        print(f"Sorting by: {sort_text}")  # Debug line
-        
-        # Prevent rapid sorting changes that can cause thread issues
-        if hasattr(self, '_sort_timer'):
-            self._sort_timer.stop()
-        
-        self._sort_timer = QTimer()
-        self._sort_timer.setSingleShot(True)
-        self._sort_timer.timeout.connect(lambda: self._do_sort(sort_text))
-        self._sort_timer.start(1000)  # 1000ms delay
+        if sort_text in SORT_PRESETS:
+            self._do_sort(sort_text)
         
     def _do_sort(self, sort_text):
         """Actually perform the sorting"""
-        if sort_text == "Featured (Default)":
-            # Featured items first, then others
-            self.wreaths_data.sort(key=lambda w: (not w.get('featured', False), w.get('title', '').lower()))
-        elif sort_text == "Title A-Z":
-            # Alphabetical, ignore punctuation
-            self.wreaths_data.sort(key=lambda w: re.sub(r'[^\w\s]', '', w.get('title', '')).lower())
-        elif sort_text == "Title Z-A":
-            # Reverse alphabetical, ignore punctuation  
-            self.wreaths_data.sort(key=lambda w: re.sub(r'[^\w\s]', '', w.get('title', '')).lower(), reverse=True)
-        elif sort_text == "Price Low to High":
-            # $0 at top, then low to high
-            self.wreaths_data.sort(key=lambda w: (w.get('localPrice', 0) or w.get('price', 0) or 0))
-        elif sort_text == "Price High to Low":
-            # High to low, $0 at bottom
-            self.wreaths_data.sort(key=lambda w: -(w.get('localPrice', 0) or w.get('price', 0) or 0))
-        elif sort_text == "Date Created (Oldest First)":
-            # Sort by date created, oldest first (1900 dates will be at top)
-            def date_sort_key(w):
-                date_str = w.get('dateCreated', '1900-01-01')
-                try:
-                    from datetime import datetime
-                    return datetime.strptime(date_str, '%Y-%m-%d')
-                except:
-                    return datetime(1900, 1, 1)  # Fallback for invalid dates
-            self.wreaths_data.sort(key=date_sort_key)
-        elif sort_text == "Date Created (Newest First)":
-            # Sort by date created, newest first 
-            def date_sort_key(w):
-                date_str = w.get('dateCreated', '1900-01-01')
-                try:
-                    from datetime import datetime
-                    return datetime.strptime(date_str, '%Y-%m-%d')
-                except:
-                    return datetime(1900, 1, 1)  # Fallback for invalid dates
-            self.wreaths_data.sort(key=date_sort_key, reverse=True)
+        self.sort_spec = SORT_PRESETS[sort_text][:]
+        self.sort_wreaths()
         
-        self.populate_table()
+    def on_header_clicked(self, column):
+        """Sort by a column header; Shift+click adds it as another sort key"""
+        field = self.SORT_COLUMNS.get(column)
+        if not field:
+            return
+        
+        fields = [f for f, descending in self.sort_spec]
+        add_key = QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier
+        
+        if field in fields and (add_key or fields[0] == field):
+            # Clicking an existing key flips its direction
+            index = fields.index(field)
+            self.sort_spec[index] = (field, not self.sort_spec[index][1])
+        elif add_key:
+            self.sort_spec.append((field, field in ('featured', 'sold')))
+        else:
+            # Sold and featured items first by default, everything else ascending
+            self.sort_spec = [(field, field in ('featured', 'sold'))]
+        
+        # Show the matching preset in the combo, if there is one
+        self.sort_combo.blockSignals(True)
+        preset = next((text for text, spec in SORT_PRESETS.items() if spec == self.sort_spec), None)
+        if preset:
+            self.sort_combo.setCurrentText(preset)
+        else:
+            if self.sort_combo.findText("Custom (column headers)") < 0:
+                self.sort_combo.addItem("Custom (column headers)")
+            self.sort_combo.setCurrentText("Custom (column headers)")
+        self.sort_combo.blockSignals(False)
+        
+        self.sort_wreaths()
+        
+    @traced("sort")
+    def sort_wreaths(self):
+        """Sort the catalog by the current sort spec using cached keys"""
+        self.sort_key_cache.sort(self.wreaths_data, self.sort_spec)
+        self.update_sort_indicator()
+        self.apply_filters()
+        
+    def update_sort_indicator(self):
+        """Show the primary sort column in the header and the full spec as a tooltip"""
+        header = self.table_widget.horizontalHeader()
+        field, descending = self.sort_spec[0]
+        columns = {f: c for c, f in self.SORT_COLUMNS.items()}
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(
+            columns[field],
+            Qt.SortOrder.DescendingOrder if descending else Qt.SortOrder.AscendingOrder
+        )
+        header.setToolTip("Sorted by " + ", ".join(
+            f"{f} {'▼' if d else '▲'}" for f, d in self.sort_spec
+        ) + "\nClick a column to sort, Shift+click to add a sort key")
         
     def create_status_bar(self):
         """Create status bar"""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        
+        # Recent hot-path timings, shown from the View menu
+        self.perf_overlay_label = QLabel()
+        self.perf_overlay_label.setStyleSheet("color: #666; font-family: monospace;")
+        self.perf_overlay_label.hide()
+        self.status_bar.addPermanentWidget(self.perf_overlay_label)
+        self.perf_overlay_timer = QTimer(self)
+        self.perf_overlay_timer.setInterval(500)
+        self.perf_overlay_timer.timeout.connect(self.update_performance_overlay)
+        
         self.update_status()
         
     def update_status(self):
         """Update status bar"""
         count = len(self.wreaths_data)
-        sold_count = len([w for w in self.wreaths_data if w.get('sold', False)])
+        sold_count = sum(1 for w in self.wreaths_data if w.sold)
         available_count = count - sold_count
         
         status_text = f"Total: {count} | Available: {available_count} | Sold: {sold_count} | Folder: {self.project_folder}"
+        if self.catalog_loading:
+            status_text = f"Loading catalog... {status_text}"
         self.status_bar.showMessage(status_text)
         
+    # (label, span name) pairs shown in the performance overlay
+    OVERLAY_SPANS = [
+        ("read", "catalog.read"), ("populate", "table.populate"), ("render", "table.render_slice"),
+        ("sort", "sort"), ("filter", "filter"), ("fetch", "image.fetch"), ("decode", "image.decode"),
+        ("save", "save"), ("backup", "backup"), ("deploy", "deploy"),
+    ]
+    
+    def set_performance_overlay(self, shown):
+        """Show or hide recent operation timings in the status bar"""
+        self.perf_overlay_label.setVisible(shown)
+        if shown:
+            self.update_performance_overlay()
+            self.perf_overlay_timer.start()
+        else:
+            self.perf_overlay_timer.stop()
+        if self.settings.get('show_performance_overlay', False) != shown:
+            self.settings['show_performance_overlay'] = shown
+            self.settings_store.mark_dirty()
+            
+    def update_performance_overlay(self):
+        """Refresh the overlay with the latest span timings"""
+        latencies = tracer.recent_latencies({name for label, name in self.OVERLAY_SPANS})
+        shown = [(label, latencies[name]) for label, name in self.OVERLAY_SPANS if name in latencies]
+        parts = [f"{label} {last:.0f}ms" for label, (last, mean) in shown]
+        stalls = self.stall_monitor.stalls
+        if stalls:
+            parts.append(f"stalls {len(stalls)} (max {max(s['duration_ms'] for s in stalls):.0f}ms)")
+        self.perf_overlay_label.setText(" | ".join(parts) or "No timings yet")
+        self.perf_overlay_label.setToolTip("Last / average of recent runs\n" + "\n".join(
+            f"{label}: {last:.1f} ms / {mean:.1f} ms" for label, (last, mean) in shown
+        ))
+        
+    def export_performance_trace(self):
+        """Save the recorded timing spans as a Chrome trace file"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, 'Export Performance Trace',
+            str(self.project_folder / "exports" / f"performance_trace_{timestamp}.json"),
+            'Trace Files (*.json)'
+        )
+        
+        if file_path:
+            try:
+                count = tracer.export_chrome_trace(file_path)
+                QMessageBox.information(
+                    self, "Export Complete",
+                    f"{count} timing spans exported to:\n{file_path}\n\n"
+                    "Open the file in chrome://tracing or ui.perfetto.dev."
+                )
+            except Exception as e:
+                QMessageBox.critical(self, "Export Error", f"Could not export trace: {e}")
+        
+    def check_for_leaks(self):
+        """Sample the live counters and warn about any that keep growing
+
+        Only the cheap counters are sampled here; the full set (with the
+        object count and table walk) is left to Memory Diagnostics.
+        """
+        if self.pending_rows:
+            self.leak_check_timer.start()  # Still rendering; wait until it settles
+            return
+        for warning in self.leak_watchdog.sample(live_counters(self.table_widget.rowCount())):
+            print(f"⚠ Possible leak: {warning}")
+            self.leak_warnings = (self.leak_warnings + [warning])[-10:]
+            self.status_bar.showMessage(f"⚠ Possible leak: {warning} (View > Memory Diagnostics)", 15000)
+            
+    def open_diagnostics(self):
+        """Show the memory diagnostics window"""
+        from diagnostics_dialog_pyside import DiagnosticsDialog
+        if self.diagnostics_dialog is None:
+            self.diagnostics_dialog = DiagnosticsDialog(self)
+            self.diagnostics_dialog.finished.connect(self.on_diagnostics_closed)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+        self.diagnostics_dialog.activateWindow()
+        
+    def on_diagnostics_closed(self):
+        self.diagnostics_dialog.deleteLater()
+        self.diagnostics_dialog = None
+        
+    def stall_log_file(self):
+        return self.project_folder / "logs" / "ui_stalls.jsonl"
+        
+    def on_ui_stall(self, stall):
+        """Point long freezes out in the status bar"""
+        if stall['duration_ms'] >= 1000:
+            self.status_bar.showMessage(
+                f"⚠ UI froze for {stall['duration_ms'] / 1000:.1f} s during {stall['operation']} (View > UI Stall Report)",
+                10000
+            )
+            
+    def show_stall_report(self):
+        """Show this session's stalls ranked by total freeze time"""
+        from diagnostics_dialog_pyside import StallReportDialog
+        StallReportDialog(list(self.stall_monitor.stalls), self.stall_monitor.log_file, self).exec()
+        
     def populate_table(self):
         """Populate the table with wreath data"""
-        self.table_widget.setRowCount(len(self.wreaths_data))
+        # Everything is displayed now, so the filtered view is the full list
+        self.filtered_wreaths_data = self.wreaths_data[:]
+        self.populate_filtered_table()
+        self.update_facet_counts()
         
-        for row, wreath in enumerate(self.wreaths_data):
-            # Image
+    def render_row(self, row, wreath, update_widgets=True):
+        """Fill one table row from a wreath
+
+        The image and action cell widgets are only rebuilt when asked, so
+        re-rendering an edited row never reloads its image.
+        """
+        # Image
+        if update_widgets or self.table_widget.cellWidget(row, 0) is None:
             image_widget = WreathImageWidget(wreath.get('images', [None])[0] if wreath.get('images') else None, str(self.cache_folder))
             self.table_widget.setCellWidget(row, 0, image_widget)
+        
+        # Title
+        title_item = QTableWidgetItem(wreath.get('title', 'Untitled'))
+        self.table_widget.setItem(row, 1, title_item)
+        
+        # Sold
+        sold_item = QTableWidgetItem("✓" if wreath.get('sold', False) else "")
+        sold_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.table_widget.setItem(row, 2, sold_item)
+        
+        # Featured
+        featured_item = QTableWidgetItem("⭐" if wreath.get('featured', False) else "")
+        featured_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.table_widget.setItem(row, 3, featured_item)
+        
+        # Price
+        price = self.sort_key_cache.keys_for(wreath)[SORT_FIELDS.index('price')]
+        price_item = QTableWidgetItem(f"${price:.2f}")
+        price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self.table_widget.setItem(row, 4, price_item)
+        
+        # Hashtags
+        hashtags = wreath.get('hashtags', [])
+        if isinstance(hashtags, list):
+            hashtags_text = ', '.join([f"#{tag}" for tag in hashtags[:3]])  # Show first 3
+            if len(hashtags) > 3:
+                hashtags_text += f" (+{len(hashtags) - 3} more)"
+        else:
+            hashtags_text = str(hashtags)
+        hashtags_item = QTableWidgetItem(hashtags_text)
+        self.table_widget.setItem(row, 5, hashtags_item)
+        
+        # Description (truncated text and full tooltip are served on demand)
+        self.table_widget.setItem(row, 6, DescriptionItem(wreath))
+        
+        # Date Created
+        # Format as MM/DD/YYYY
+        formatted_date = self.sort_key_cache.keys_for(wreath)[SORT_FIELDS.index('date')].strftime('%m/%d/%Y')
             
-            # Title
-            title_item = QTableWidgetItem(wreath.get('title', 'Untitled'))
-            self.table_widget.setItem(row, 1, title_item)
-            
-            # Sold
-            sold_item = QTableWidgetItem("✓" if wreath.get('sold', False) else "")
-            sold_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table_widget.setItem(row, 2, sold_item)
-            
-            # Featured
-            featured_item = QTableWidgetItem("⭐" if wreath.get('featured', False) else "")
-            featured_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table_widget.setItem(row, 3, featured_item)
-            
-            # Price
-            price = wreath.get('localPrice', 0) or wreath.get('price', 0)
-            price_item = QTableWidgetItem(f"${price:.2f}" if price else "$0.00")
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table_widget.setItem(row, 4, price_item)
-            
-            # Hashtags
-            hashtags = wreath.get('hashtags', [])
-            if isinstance(hashtags, list):
-                hashtags_text = ', '.join([f"#{tag}" for tag in hashtags[:3]])  # Show first 3
-                if len(hashtags) > 3:
-                    hashtags_text += f" (+{len(hashtags) - 3} more)"
-            else:
-                hashtags_text = str(hashtags)
-            hashtags_item = QTableWidgetItem(hashtags_text)
-            self.table_widget.setItem(row, 5, hashtags_item)
-            
-            # Description (NEW COLUMN)
-            description = wreath.get('description', '')
-            # Truncate long descriptions
-            display_description = description[:100] + "..." if len(description) > 100 else description
-            description_item = QTableWidgetItem(display_description)
-            description_item.setToolTip(description)  # Full description in tooltip
-            self.table_widget.setItem(row, 6, description_item)
-            
-            # Date Created
-            date_created = wreath.get('dateCreated', '1900-01-01')
-            if not date_created or date_created == '':
-                date_created = '1900-01-01'
-                # Auto-set the date in the data for existing records
-                wreath['dateCreated'] = date_created
-            
-            # Format as MM/DD/YYYY
-            try:
-                from datetime import datetime
-                date_obj = datetime.strptime(date_created, '%Y-%m-%d')
-                formatted_date = date_obj.strftime('%m/%d/%Y')
-            except:
-                formatted_date = '01/01/1900'  # Fallback
-                
-            date_item = QTableWidgetItem(formatted_date)
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Highlight 1900 dates to draw attention
-            if formatted_date == '01/01/1900':
-                from PySide6.QtGui import QBrush, QColor
-                date_item.setBackground(QBrush(QColor("#ffeb3b")))  # Yellow background
-                date_item.setForeground(QBrush(QColor("#d84315")))  # Red text
-                date_item.setToolTip("This date needs to be updated! Click Edit to set the real creation date.")
-            
-            self.table_widget.setItem(row, 7, date_item)
-            
-            # Actions
-            actions_widget = QWidget()
+        date_item = QTableWidgetItem(formatted_date)
+        date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Highlight 1900 dates to draw attention
+        if formatted_date == '01/01/1900':
+            date_item.setBackground(QBrush(QColor("#ffeb3b")))  # Yellow background
+            date_item.setForeground(QBrush(QColor("#d84315")))  # Red text
+            date_item.setToolTip("This date needs to be updated! Click Edit to set the real creation date.")
+        
+        self.table_widget.setItem(row, 7, date_item)
+        
+        # Actions - buttons look the wreath up by id, so rows can move freely
+        if update_widgets or self.table_widget.cellWidget(row, 8) is None:
+            wreath_id = wreath.get('id')
+            actions_widget = live_objects.track("action widgets", QWidget())
             actions_layout = QHBoxLayout(actions_widget)
             actions_layout.setContentsMargins(2, 2, 2, 2)
             
             edit_btn = QPushButton("Edit")
-            edit_btn.clicked.connect(lambda checked=False, r=row: self.edit_wreath(r))
+            edit_btn.clicked.connect(lambda checked=False, w=wreath_id: self.edit_wreath(w))
             actions_layout.addWidget(edit_btn)
             
             images_btn = QPushButton("Images")
-            images_btn.clicked.connect(lambda checked=False, r=row: self.view_images(r))
+            images_btn.clicked.connect(lambda checked=False, w=wreath_id: self.view_images(w))
             actions_layout.addWidget(images_btn)
             
             # Delete button
@@ -669,15 +1024,11 @@ class TwinfolksWreathManager(QMainWindow):
             delete_btn.setToolTip("Delete this wreath")
             delete_btn.setStyleSheet("QPushButton { color: red; font-weight: bold; font-size: 14px; }")
             delete_btn.setMaximumWidth(25)
-            delete_btn.clicked.connect(lambda checked=False, r=row: self.delete_wreath(r))
+            delete_btn.clicked.connect(lambda checked=False, w=wreath_id: self.delete_wreath(w))
             actions_layout.addWidget(delete_btn)
             
+            actions_widget.setEnabled(not self.catalog_loading)
             self.table_widget.setCellWidget(row, 8, actions_widget)
-        # Initialize filtered data on first load
-        if not hasattr(self, 'filtered_wreaths_data'):
-            self.filtered_wreaths_data = self.wreaths_data[:]
-
-        self.update_status()
         
     def load_settings(self):
         """Load settings from JSON file with robust encoding handling"""
@@ -692,6 +1043,7 @@ class TwinfolksWreathManager(QMainWindow):
                 'netlify_site_id': '',
                 'netlify_access_token': ''
             }
+            self.settings_store.replace(settings_file, self.settings)
             return
             
         # Use robust file reading
@@ -715,13 +1067,15 @@ class TwinfolksWreathManager(QMainWindow):
                     self, "Settings Warning", 
                     f"Could not load settings.json:\n{error_msg}\n\nUsing default settings."
                 )
+        
+        self.settings_store.replace(settings_file, self.settings)
             
     def save_settings(self):
-        """Save settings to JSON file"""
+        """Save settings to JSON file right away"""
         settings_file = self.project_folder / "settings.json"
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            self.settings_store.replace(settings_file, self.settings)
+            self.settings_store.save_now()
             print(f"Settings saved to: {settings_file}")  # Debug line
         except Exception as e:
             QMessageBox.warning(self, "Settings Warning", f"Could not save settings: {e}")
@@ -732,7 +1086,8 @@ class TwinfolksWreathManager(QMainWindow):
             self.settings['column_widths'] = {}
         
         self.settings['column_widths'][str(column_index)] = width
-        self.save_settings()
+        # Written once dragging stops, not on every resize event
+        self.settings_store.mark_dirty()
         
     def load_column_widths(self):
         """Load and apply saved column widths"""
@@ -761,7 +1116,6 @@ class TwinfolksWreathManager(QMainWindow):
             
             # Save the width
             self.save_column_width(logical_index, new_size)
-            print(f"Saved column {logical_index} width: {new_size}")  # Debug line
 
     def restore_default_column_widths(self):
         """Restore column widths to defaults"""
@@ -818,194 +1172,434 @@ class TwinfolksWreathManager(QMainWindow):
         # Apply the filtering
         self.apply_filters()
         
+    @traced("filter")
     def apply_filters(self):
         """Apply current filters to the wreath data"""
-        if self.active_filters["show_all"]:
-            # Show all wreaths
-            self.filtered_wreaths_data = self.wreaths_data[:]
-        else:
-            # Filter based on active filters
-            self.filtered_wreaths_data = []
-            
-            for wreath in self.wreaths_data:
-                include_wreath = True
-                
-                # Check featured filter
-                if self.active_filters["featured"]:
-                    if not wreath.get('featured', False):
-                        include_wreath = False
-                
-                # Check sold filter
-                if self.active_filters["sold"]:
-                    if not wreath.get('sold', False):
-                        include_wreath = False
-                
-                # Check available filter
-                if self.active_filters["available"]:
-                    if wreath.get('sold', False):  # If sold, then not available
-                        include_wreath = False
-                
-                if include_wreath:
-                    self.filtered_wreaths_data.append(wreath)
+        self.filtered_wreaths_data = self.filtered_view()
+        self.update_facet_counts()
         
         # Update the table display
         self.populate_filtered_table()
+        
+    def filtered_view(self):
+        """The wreaths passing the current filters, facets and search, in display order"""
+        facet_ids = self.get_facet_matching_ids()
+        
+        if self.search_text.strip():
+            # Ranked search results, narrowed by the other filters
+            return [
+                self.wreaths_by_id[wreath_id] for wreath_id in self.search_index.search(self.search_text)
+                if wreath_id in self.wreaths_by_id
+                and self.wreath_matches_filters(self.wreaths_by_id[wreath_id], facet_ids)
+            ]
+        if self.active_filters["show_all"] and facet_ids is None:
+            # Show all wreaths
+            return self.wreaths_data[:]
+        # Filter based on active filters
+        return [
+            wreath for wreath in self.wreaths_data
+            if self.wreath_matches_filters(wreath, facet_ids)
+        ]
+        
+    def wreath_matches_filters(self, wreath, facet_ids=None):
+        """Check a single wreath against the status filters and selected facets"""
+        # Check featured filter
+        if self.active_filters["featured"] and not wreath.featured:
+            return False
+        
+        # Check sold filter
+        if self.active_filters["sold"] and not wreath.sold:
+            return False
+        
+        # Check available filter
+        if self.active_filters["available"] and wreath.sold:  # If sold, then not available
+            return False
+        
+        # Check category facets
+        if facet_ids is not None and wreath.id not in facet_ids:
+            return False
+        
+        return True
+
+    def on_search_changed(self, text):
+        """Update results as the user types"""
+        self.search_text = text
+        self.apply_filters()
+
+    def load_filter_config(self):
+        """Load category facets from filter-config.json"""
+        self.filter_categories = []
+        self.active_facets.clear()
+        
+        candidates = []
+        if self.settings.get('filter_config_path'):
+            candidates.append(Path(self.settings['filter_config_path']))
+        candidates.append(self.project_folder / "filter-config.json")
+        # The website folder next to python-admin when running from the repo
+        candidates.append(Path(__file__).resolve().parent.parent / "website" / "filter-config.json")
+        
+        for config_file in candidates:
+            if not config_file.exists():
+                continue
+            success, data, encoding_used, error_msg = FileEncodingHelper.read_json_file_robust(config_file)
+            if success:
+                self.filter_categories = load_filter_categories(data)
+                return
+            print(f"Could not load {config_file}: {error_msg}")
+            
+    def build_facet_buttons(self):
+        """Create a row of checkable facet buttons for each filter category"""
+        # Remove any existing facet rows
+        while self.facet_layout.count():
+            row_layout = self.facet_layout.takeAt(0).layout()
+            while row_layout and row_layout.count():
+                child = row_layout.takeAt(0)
+                if child.widget():
+                    child.widget().deleteLater()
+        self.facet_buttons = {}
+        
+        for category in self.filter_categories:
+            row_layout = QHBoxLayout()
+            row_layout.addWidget(QLabel(f"{category['name']}:"))
+            
+            for subcategory in category['subcategories']:
+                key = (category['name'], subcategory['name'])
+                button = QPushButton(subcategory['name'])
+                button.setCheckable(True)
+                button.setToolTip(", ".join(f"#{tag}" for tag in subcategory['hashtags']))
+                button.clicked.connect(lambda checked, k=key: self.on_facet_clicked(k, checked))
+                row_layout.addWidget(button)
+                self.facet_buttons[key] = button
+                
+            row_layout.addStretch()
+            self.facet_layout.addLayout(row_layout)
+            
+    def on_facet_clicked(self, key, checked):
+        """Toggle a category facet"""
+        if checked:
+            self.active_facets.add(key)
+        else:
+            self.active_facets.discard(key)
+        self.apply_filters()
+        
+    def get_facet_ids(self, key):
+        """Ids of wreaths in one facet (any of its hashtags)"""
+        category_name, subcategory_name = key
+        for category in self.filter_categories:
+            if category['name'] != category_name:
+                continue
+            for subcategory in category['subcategories']:
+                if subcategory['name'] == subcategory_name:
+                    return self.hashtag_index.ids_for_any(subcategory['hashtags'])
+        return set()
+        
+    def get_facet_matching_ids(self):
+        """Intersect the selected facets; None when no facet is selected"""
+        if not self.active_facets:
+            return None
+        
+        facet_sets = sorted((self.get_facet_ids(key) for key in self.active_facets), key=len)
+        matching_ids = set(facet_sets[0])
+        for ids in facet_sets[1:]:
+            matching_ids &= ids
+        return matching_ids
+        
+    def update_facet_counts(self):
+        """Show how many of the currently displayed wreaths fall in each facet"""
+        if not self.facet_buttons:
+            return
+        
+        displayed_ids = {wreath.get('id') for wreath in self.filtered_wreaths_data}
+        for key, button in self.facet_buttons.items():
+            count = len(self.get_facet_ids(key) & displayed_ids)
+            button.setText(f"{key[1]} ({count})")
+            button.setChecked(key in self.active_facets)
+
+    def rebuild_indexes(self):
+        """Rebuild the in-memory indexes for the whole catalog"""
+        self.wreaths_by_id = {wreath['id']: wreath for wreath in self.wreaths_data}
+        self.sort_key_cache.clear()
+        self.hashtag_index.rebuild(self.wreaths_data)
+        self.search_index.rebuild(self.wreaths_data)
+        
+    def index_wreath(self, wreath):
+        """Add or refresh a single wreath in the indexes"""
+        self.sort_key_cache.invalidate(wreath['id'])
+        self.wreaths_by_id[wreath['id']] = wreath
+        self.hashtag_index.update(wreath)
+        self.search_index.update(wreath)
+        
+    def unindex_wreath(self, wreath):
+        """Remove a single wreath from the indexes"""
+        self.wreaths_by_id.pop(wreath.get('id'), None)
+        self.sort_key_cache.invalidate(wreath.get('id'))
+        self.hashtag_index.remove(wreath.get('id'))
+        self.search_index.remove(wreath.get('id'))
+        self.hashtag_engine.forget(wreath.get('id'))
 
+    # Longest stretch of row rendering before handing control back to Qt
+    RENDER_SLICE_SECONDS = 0.008
+    
+    @traced("table.populate")
     def populate_filtered_table(self):
-        """Populate table with filtered data"""
+        """Populate table with filtered data
+
+        Rows are rendered in short time slices between event-loop turns, with
+        the rows in view first. Starting a new populate cancels any render
+        that is still in progress.
+        """
+        self.render_timer.stop()
+        self.table_widget.clearContents()
         self.table_widget.setRowCount(len(self.filtered_wreaths_data))
         
-        for row, wreath in enumerate(self.filtered_wreaths_data):
-            # Image
-            image_widget = WreathImageWidget(wreath.get('images', [None])[0] if wreath.get('images') else None, str(self.cache_folder))
-            self.table_widget.setCellWidget(row, 0, image_widget)
-            
-            # Title
-            title_item = QTableWidgetItem(wreath.get('title', 'Untitled'))
-            self.table_widget.setItem(row, 1, title_item)
-            
-            # Sold
-            sold_item = QTableWidgetItem("✓" if wreath.get('sold', False) else "")
-            sold_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table_widget.setItem(row, 2, sold_item)
-            
-            # Featured
-            featured_item = QTableWidgetItem("⭐" if wreath.get('featured', False) else "")
-            featured_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table_widget.setItem(row, 3, featured_item)
-            
-            # Price
-            price = wreath.get('localPrice', 0) or wreath.get('price', 0)
-            price_item = QTableWidgetItem(f"${price:.2f}" if price else "$0.00")
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table_widget.setItem(row, 4, price_item)
-            
-            # Hashtags
-            hashtags = wreath.get('hashtags', [])
-            if isinstance(hashtags, list):
-                hashtags_text = ', '.join([f"#{tag}" for tag in hashtags[:3]])  # Show first 3
-                if len(hashtags) > 3:
-                    hashtags_text += f" (+{len(hashtags) - 3} more)"
-            else:
-                hashtags_text = str(hashtags)
-            hashtags_item = QTableWidgetItem(hashtags_text)
-            self.table_widget.setItem(row, 5, hashtags_item)
-            
-            # Description
-            description = wreath.get('description', '')
-            display_description = description[:100] + "..." if len(description) > 100 else description
-            description_item = QTableWidgetItem(display_description)
-            description_item.setToolTip(description)
-            self.table_widget.setItem(row, 6, description_item)
-            
-            # Date Created
-            date_created = wreath.get('dateCreated', '1900-01-01')
-            if not date_created or date_created == '':
-                date_created = '1900-01-01'
-                wreath['dateCreated'] = date_created
-            
-            try:
-                from datetime import datetime
-                date_obj = datetime.strptime(date_created, '%Y-%m-%d')
-                formatted_date = date_obj.strftime('%m/%d/%Y')
-            except:
-                formatted_date = '01/01/1900'
-                
-            date_item = QTableWidgetItem(formatted_date)
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            if formatted_date == '01/01/1900':
-                from PySide6.QtGui import QBrush, QColor
-                date_item.setBackground(QBrush(QColor("#ffeb3b")))
-                date_item.setForeground(QBrush(QColor("#d84315")))
-                date_item.setToolTip("This date needs to be updated! Click Edit to set the real creation date.")
-            
-            self.table_widget.setItem(row, 7, date_item)
-            
-            # Actions - we need to find the original row index in wreaths_data
-            original_row = self.wreaths_data.index(wreath)
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(2, 2, 2, 2)
-            
-            edit_btn = QPushButton("Edit")
-            edit_btn.clicked.connect(lambda checked=False, r=original_row: self.edit_wreath(r))
-            actions_layout.addWidget(edit_btn)
-            
-            images_btn = QPushButton("Images")
-            images_btn.clicked.connect(lambda checked=False, r=original_row: self.view_images(r))
-            actions_layout.addWidget(images_btn)
-            
-            delete_btn = QPushButton("✗")
-            delete_btn.setToolTip("Delete this wreath")
-            delete_btn.setStyleSheet("QPushButton { color: red; font-weight: bold; font-size: 14px; }")
-            delete_btn.setMaximumWidth(25)
-            delete_btn.clicked.connect(lambda checked=False, r=original_row: self.delete_wreath(r))
-            actions_layout.addWidget(delete_btn)
-            
-            self.table_widget.setCellWidget(row, 8, actions_widget)
+        # Visible rows first, then everything else in order
+        row_count = len(self.filtered_wreaths_data)
+        first_visible = max(self.table_widget.rowAt(0), 0)
+        visible_count = self.table_widget.viewport().height() // self.table_widget.verticalHeader().defaultSectionSize() + 1
+        last_visible = min(first_visible + visible_count, row_count)
+        self.pending_rows = list(range(first_visible, last_visible))
+        self.pending_rows += [row for row in range(row_count) if row < first_visible or row >= last_visible]
+        self.pending_rows.reverse()  # Pop from the end
         
+        self.render_next_chunk()
         self.update_status()
+        self.leak_check_timer.start()
+        
+    @traced("table.render_slice")
+    def render_next_chunk(self):
+        """Render queued rows until the time slice runs out"""
+        deadline = time.perf_counter() + self.RENDER_SLICE_SECONDS
+        rows = self.filtered_wreaths_data
+        while self.pending_rows and time.perf_counter() < deadline:
+            row = self.pending_rows.pop()
+            if row < len(rows):
+                self.render_row(row, rows[row])
+        
+        if self.pending_rows:
+            self.render_timer.start(0)
+            
+    def reorder_table(self, wreaths):
+        """Show the same rows in a new order without re-rendering them
 
-    def load_wreaths(self):
-        """Load wreaths from JSON file with robust encoding handling"""
-        wreaths_file = self.project_folder / "wreaths.json"
+        The table model is sorted on each row's new position, so existing
+        image and action widgets move with their rows instead of being
+        rebuilt. Rows still waiting to render keep their place in the queue.
+        """
+        positions = {id(wreath): row for row, wreath in enumerate(wreaths)}
+        old_rows = self.filtered_wreaths_data
+        for row, wreath in enumerate(old_rows):
+            self.table_widget.setItem(row, 0, RowOrderItem(positions[id(wreath)]))
+        self.table_widget.sortItems(0)
+        for row in range(len(wreaths)):
+            self.table_widget.takeItem(row, 0)
+        
+        self.pending_rows = [positions[id(old_rows[row])] for row in self.pending_rows if row < len(old_rows)]
+        self.filtered_wreaths_data = wreaths
+        
+    def flush_table_render(self):
+        """Finish an in-progress render right away"""
+        self.render_timer.stop()
+        rows = self.filtered_wreaths_data
+        while self.pending_rows:
+            row = self.pending_rows.pop()
+            if row < len(rows):
+                self.render_row(row, rows[row])
+
+    def unqueue_row(self, row, removed=False):
+        """Take a row out of the render queue, shifting later rows up if it was removed"""
+        if removed:
+            self.pending_rows = [queued - (queued > row) for queued in self.pending_rows if queued != row]
+        elif row in self.pending_rows:
+            self.pending_rows.remove(row)
+
+    def displayed_row(self, wreath):
+        """Table row currently showing a wreath, or -1 if it is filtered out"""
+        for row, displayed in enumerate(self.filtered_wreaths_data):
+            if displayed is wreath:
+                return row
+        return -1
+        
+    def wreath_matches_current_view(self, wreath):
+        """Check one wreath against the filters, facets and search in effect"""
+        if self.search_text.strip() and wreath.get('id') not in set(self.search_index.search(self.search_text)):
+            return False
+        return self.wreath_matches_filters(wreath, self.get_facet_matching_ids())
+        
+    def refresh_wreath_row(self, wreath):
+        """Update the table for a single added or edited wreath
+
+        A render still in progress carries on; only the rows queued after
+        an inserted or removed row change places in its queue.
+        """
+        row = self.displayed_row(wreath)
+        matches = self.wreath_matches_current_view(wreath)
+        
+        if row >= 0 and not matches:
+            # No longer passes the filters
+            self.table_widget.removeRow(row)
+            del self.filtered_wreaths_data[row]
+            self.unqueue_row(row, removed=True)
+        elif row >= 0:
+            # Rendered now, even if its turn in the queue hasn't come yet
+            self.unqueue_row(row)
+            self.render_row(row, wreath, update_widgets=False)
+        elif matches:
+            # Newly visible wreaths go at the bottom until the next sort
+            row = self.table_widget.rowCount()
+            self.table_widget.insertRow(row)
+            self.filtered_wreaths_data.append(wreath)
+            self.render_row(row, wreath)
+        
+        self.update_facet_counts()
+        self.update_status()
         
-        if not wreaths_file.exists():
-            self.wreaths_data = []
+    def remove_wreath_row(self, wreath):
+        """Remove a deleted wreath's row, if it is displayed"""
+        row = self.displayed_row(wreath)
+        if row >= 0:
+            self.table_widget.removeRow(row)
+            del self.filtered_wreaths_data[row]
+            self.unqueue_row(row, removed=True)
+        
+        self.update_facet_counts()
+        self.update_status()
+
+    def start_catalog_load(self):
+        """Load wreaths.json on a worker thread, streaming rows into the table"""
+        self.stop_catalog_load()
+        
+        # A freshly loaded catalog is the new baseline for change tracking
+        self.change_tracker.reset()
+        self.catalog_serializer.clear()
+        self.update_changes_label()
+        self.wreaths_data = []
+        self.rebuild_indexes()
+        self.set_catalog_loading(True)
+        self.populate_table()
+        
+        loader = CatalogLoadThread(self.project_folder / "wreaths.json", self.hashtag_engine, self)
+        # Bound methods of the window, so the slots run on the GUI thread
+        loader.chunk_loaded.connect(self.on_catalog_chunk)
+        loader.load_failed.connect(self.on_catalog_load_failed)
+        loader.finished.connect(self.on_catalog_loaded)
+        self.catalog_loader = loader
+        loader.start()
+        
+    def stop_catalog_load(self):
+        """Cancel a catalog load that is still running"""
+        loader, self.catalog_loader = self.catalog_loader, None
+        if loader is not None and loader.isRunning():
+            loader.requestInterruption()
+            loader.wait()
+            
+    def set_catalog_loading(self, loading):
+        """Enable or disable editing while the catalog loads"""
+        self.catalog_loading = loading
+        for control in self.editing_controls:
+            control.setEnabled(not loading)
+        
+    @traced("catalog.chunk")
+    def on_catalog_chunk(self, chunk):
+        """Add a batch of loaded wreaths and queue the matching rows for rendering"""
+        # Ignore signals from a load that was cancelled
+        if self.sender() is not self.catalog_loader:
             return
-            
-        # Use robust file reading
-        success, data, encoding_used, error_msg = FileEncodingHelper.read_json_file_robust(wreaths_file)
         
-        if success:
-            if isinstance(data, list):
-                self.wreaths_data = data
-                
-                # Ensure all wreaths have required fields and process hashtags
-                for wreath in self.wreaths_data:
-                    if 'featured' not in wreath:
-                        wreath['featured'] = False
-                    if 'id' not in wreath:
-                        wreath['id'] = str(uuid.uuid4())
-                    
-                    # UPDATED: Process hashtags from description (Priority #2)
-                    HashtagExtractor.process_wreath_hashtags(wreath)
-                        
-            else:
-                self.wreaths_data = []
-                QMessageBox.warning(
-                    self, "Data Format Warning", 
-                    "Your wreaths.json file doesn't contain a list of wreaths.\nStarting with empty data."
-                )
+        self.wreaths_data.extend(chunk)
+        for wreath in chunk:
+            self.index_wreath(wreath)
+        
+        # Show the batch right away if it passes the current filters
+        search_ids = set(self.search_index.search(self.search_text)) if self.search_text.strip() else None
+        facet_ids = self.get_facet_matching_ids()
+        visible = [wreath for wreath in chunk
+                   if (search_ids is None or wreath.id in search_ids) and self.wreath_matches_filters(wreath, facet_ids)]
+        self.sort_key_cache.sort(visible, self.sort_spec)
+        
+        first_row = len(self.filtered_wreaths_data)
+        self.filtered_wreaths_data.extend(visible)
+        self.table_widget.setRowCount(len(self.filtered_wreaths_data))
+        # Rows are popped from the end, so new rows go to the front of the queue
+        self.pending_rows[:0] = range(len(self.filtered_wreaths_data) - 1, first_row - 1, -1)
+        if not self.render_timer.isActive():
+            self.render_next_chunk()
+        self.update_status()
+        if not startup_profile.has("first rows"):
+            startup_profile.mark("first rows")
+        
+    def on_catalog_load_failed(self, critical, title, message):
+        """Report a catalog that could not be read"""
+        # Ignore signals from a load that was cancelled
+        if self.sender() is not self.catalog_loader:
+            return
+        if critical:
+            QMessageBox.critical(self, title, message)
         else:
-            self.wreaths_data = []
-            QMessageBox.critical(
-                self, "Data Load Error", 
-                f"Could not load wreaths.json:\n{error_msg}\n\nStarting with empty data."
-            )
+            QMessageBox.warning(self, title, message)
             
+    def on_catalog_loaded(self):
+        """Sort and enable editing once the whole catalog is in"""
+        # Ignore signals from a load that was cancelled
+        if self.sender() is not self.catalog_loader:
+            return
+        loader, self.catalog_loader = self.catalog_loader, None
+        self.set_catalog_loading(False)
+        
+        # Ids, defaults and hashtags filled in by the load are unsaved changes
+        # (otherwise generated ids would differ on every launch)
+        for wreath_id, record in loader.normalized.items():
+            self.change_tracker.before_change(wreath_id, record)
+        
+        # Batches were sorted as they arrived; put the streamed rows in their
+        # final order without rebuilding them (and refetching thumbnails)
+        self.sort_key_cache.sort(self.wreaths_data, self.sort_spec)
+        self.update_sort_indicator()
+        wreaths = self.filtered_view()
+        if {id(wreath) for wreath in wreaths} == {id(wreath) for wreath in self.filtered_wreaths_data}:
+            self.reorder_table(wreaths)
+        else:
+            self.filtered_wreaths_data = wreaths
+            self.populate_filtered_table()
+        self.update_facet_counts()
+        self.update_changes_label()
+        self.catalog_loaded.emit()
+        
+    def catalog_json(self):
+        """The catalog as wreaths.json text, re-serializing only changed wreaths"""
+        self.catalog_serializer.invalidate(self.change_tracker.touched_ids('save'))
+        return self.catalog_serializer.serialize(self.wreaths_data)
+        
+    @traced("save")
     def save_wreaths(self):
         """Save wreaths data to JSON file"""
         wreaths_file = self.project_folder / "wreaths.json"
+        changes = self.change_tracker.changes(self.wreaths_by_id, 'save')
+        
+        # Nothing to write (or back up) if no wreath changed since the last save
+        if not changes and wreaths_file.exists():
+            self.update_changes_label()
+            QMessageBox.information(self, "Save Complete", "No changes to save.")
+            return
         
         # Create backup if auto-backup is enabled
         if self.settings.get('auto_backup', True):
             self.create_backup()
             
         try:
-            with open(wreaths_file, 'w') as f:
-                json.dump(self.wreaths_data, f, indent=2)
+            atomic_write_text(wreaths_file, self.catalog_json())
             
-            self.changes_made = False
-            self.changes_label.setText("No unsaved changes")
-            self.changes_label.setStyleSheet("color: #16a34a; font-weight: bold;")
+            self.change_tracker.reset('save')
+            self.update_changes_label()
             
-            QMessageBox.information(self, "Save Complete", f"Wreaths saved to:\n{wreaths_file}")
+            QMessageBox.information(
+                self, "Save Complete",
+                f"Wreaths saved to:\n{wreaths_file}\n\n{changes.summary()}"
+            )
             
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Could not save wreaths: {e}")
             
+    @traced("backup")
     def create_backup(self):
         """Create a backup of the current wreaths file"""
         wreaths_file = self.project_folder / "wreaths.json"
@@ -1018,6 +1612,7 @@ class TwinfolksWreathManager(QMainWindow):
         backup_file = backup_dir / f"wreaths_backup_{timestamp}.json"
         
         try:
+            import shutil
             shutil.copy2(wreaths_file, backup_file)
             
             # Clean up old backups
@@ -1031,109 +1626,109 @@ class TwinfolksWreathManager(QMainWindow):
         except Exception as e:
             print(f"Backup creation failed: {e}")
             
+    def before_wreath_change(self, wreath_id, wreath=None):
+        """Record a wreath's state before it is edited, added (None) or deleted"""
+        self.change_tracker.before_change(wreath_id, wreath)
+        
     def mark_changes_made(self):
         """Mark that changes have been made"""
-        if not self.changes_made:
-            self.changes_made = True
-            self.changes_label.setText("Unsaved changes")
+        self.update_changes_label()
+        
+    def update_changes_label(self):
+        """Show how many wreaths changed since the last save"""
+        changes = self.change_tracker.changes(self.wreaths_by_id, 'save')
+        self.changes_made = bool(changes)
+        if changes:
+            self.changes_label.setText(f"Unsaved changes: {changes.summary()}")
             self.changes_label.setStyleSheet("color: #dc2626; font-weight: bold;")
+        else:
+            self.changes_label.setText("No unsaved changes")
+            self.changes_label.setStyleSheet("color: #16a34a; font-weight: bold;")
+            
+    def deploy_change_summary(self):
+        """Summary of wreaths changed since the last deploy in this session"""
+        return self.change_tracker.changes(self.wreaths_by_id, 'deploy').summary()
+        
+    def on_deploy_succeeded(self):
+        """Start a new deploy baseline after a successful deploy"""
+        self.change_tracker.reset('deploy')
             
     def add_new_wreath(self):
         """Add a new wreath"""
+        from wreath_editor_pyside import WreathEditorDialog
         dialog = WreathEditorDialog(parent=self)
         if dialog.exec() == QDialog.Accepted:
-            new_wreath = dialog.get_wreath_data()
+            new_wreath = Wreath.from_dict(dialog.get_wreath_data())
+            self.before_wreath_change(new_wreath['id'])
             self.wreaths_data.append(new_wreath)
-            self.apply_filters()
-            self.mark_changes_made()
-
-    def delete_wreath(self, row):
-        """Delete a wreath with confirmation"""
-        if row >= len(self.wreaths_data):
-            return
-            
-        wreath = self.wreaths_data[row]
-        title = wreath.get('title', 'Untitled')
-        
-        # Confirmation dialog
-        reply = QMessageBox.question(
-            self, 
-            "Confirm Delete",
-            f"Are you sure you want to delete '{title}'?\n\nThis cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No  # Default to No for safety
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            # Remove from data
-            del self.wreaths_data[row]
-            
-            # Refresh table
-            self.apply_filters()
-            
-            # Mark changes
+            self.index_wreath(new_wreath)
+            self.refresh_wreath_row(new_wreath)
             self.mark_changes_made()
-            
-            # Show success message
-            QMessageBox.information(self, "Deleted", f"'{title}' has been deleted.")
 
-    def edit_wreath(self, row):
+    def edit_wreath(self, wreath_id):
         """Edit an existing wreath"""
-        if row >= len(self.wreaths_data):
+        wreath = self.wreaths_by_id.get(wreath_id)
+        if wreath is None:
             return
             
-        wreath = self.wreaths_data[row]
+        from wreath_editor_pyside import WreathEditorDialog
         dialog = WreathEditorDialog(wreath, self)
         if dialog.exec() == QDialog.Accepted:
             updated_wreath = dialog.get_wreath_data()
-            self.wreaths_data[row] = updated_wreath
-            self.apply_filters()
+            self.before_wreath_change(wreath_id, wreath)
+            # Update in place so every list holding this wreath stays current
+            wreath.clear()
+            wreath.update(updated_wreath)
+            self.index_wreath(wreath)
+            self.refresh_wreath_row(wreath)
             self.mark_changes_made()
             
-    def view_images(self, row):
+    def view_images(self, wreath_id):
         """View/edit images for a wreath"""
-        if row >= len(self.wreaths_data):
+        wreath = self.wreaths_by_id.get(wreath_id)
+        if wreath is None:
             return
         
-        wreath = self.wreaths_data[row]
         images = wreath.get('images', [])
     
         # Store the original first image for comparison
         original_first_image = images[0] if images else None
     
+        from image_viewer_pyside import ImageViewerDialog
         dialog = ImageViewerDialog(images, self, str(self.cache_folder))
         if dialog.exec() == QDialog.Accepted:
             updated_images = dialog.get_images()
-            self.wreaths_data[row]['images'] = updated_images
+            self.before_wreath_change(wreath_id, wreath)
+            wreath['images'] = updated_images
             
             # Get the new first image
             new_first_image = updated_images[0] if updated_images else None
             
             # Only update the image if the first image changed
             if original_first_image != new_first_image:
-                self.update_row_image(row)
-                print(f"Updated image for row {row}: {original_first_image} -> {new_first_image}")
+                self.update_row_image(wreath)
+                print(f"Updated image for {wreath_id}: {original_first_image} -> {new_first_image}")
             
             self.mark_changes_made()
             
-    def update_row_image(self, row):
-        """Update only the image widget for a specific row"""
-        if row >= len(self.wreaths_data) or row >= self.table_widget.rowCount():
+    def update_row_image(self, wreath):
+        """Update only the image widget for a wreath's row"""
+        row = self.displayed_row(wreath)
+        if row < 0:
             return
         
-        wreath = self.wreaths_data[row]
         first_image = wreath.get('images', [None])[0] if wreath.get('images') else None
     
         # Create new image widget with cache folder
-        image_widget = WreathImageWidget(first_image, self.cache_folder)
+        image_widget = WreathImageWidget(first_image, str(self.cache_folder))
         self.table_widget.setCellWidget(row, 0, image_widget)
     
-    def delete_wreath(self, row):
+    def delete_wreath(self, wreath_id):
         """Delete a wreath with confirmation"""
-        if row >= len(self.wreaths_data):
+        wreath = self.wreaths_by_id.get(wreath_id)
+        if wreath is None:
             return
             
-        wreath = self.wreaths_data[row]
         title = wreath.get('title', 'Untitled')
         
         reply = QMessageBox.question(
@@ -1144,8 +1739,13 @@ class TwinfolksWreathManager(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            del self.wreaths_data[row]
-            self.populate_table()
+            self.before_wreath_change(wreath_id, wreath)
+            self.unindex_wreath(wreath)
+            for index, candidate in enumerate(self.wreaths_data):
+                if candidate is wreath:
+                    del self.wreaths_data[index]
+                    break
+            self.remove_wreath_row(wreath)
             self.mark_changes_made()
             
     def import_wreaths(self):
@@ -1172,33 +1772,41 @@ class TwinfolksWreathManager(QMainWindow):
                 
                 if isinstance(data, list):
                     # List of wreaths
-                    wreaths_to_import = [w for w in data if self.validate_wreath_data(w)]
+                    wreaths_to_import = [Wreath.from_dict(w) for w in data if self.validate_wreath_data(w)]
                 elif isinstance(data, dict):
                     # Single wreath or wrapped format
                     if self.validate_wreath_data(data):
-                        wreaths_to_import = [data]
+                        wreaths_to_import = [Wreath.from_dict(data)]
                     elif 'wreaths' in data and isinstance(data['wreaths'], list):
-                        wreaths_to_import = [w for w in data['wreaths'] if self.validate_wreath_data(w)]
+                        wreaths_to_import = [Wreath.from_dict(w) for w in data['wreaths'] if self.validate_wreath_data(w)]
                 
                 # Import valid wreaths
+                batch_ids = set()
                 for wreath in wreaths_to_import:
-                    # Ensure required fields
-                    if 'id' not in wreath:
+                    # Ensure required fields (ids must stay unique)
+                    if not wreath.get('id') or wreath['id'] in self.wreaths_by_id or wreath['id'] in batch_ids:
                         wreath['id'] = str(uuid.uuid4())
+                    batch_ids.add(wreath['id'])
                     if 'featured' not in wreath:
                         wreath['featured'] = False
+                    if not wreath.get('dateCreated'):
+                        wreath['dateCreated'] = '1900-01-01'
                     
-                    # UPDATED: Process hashtags from description (Priority #2)
-                    HashtagExtractor.process_wreath_hashtags(wreath)
-                    
+                    self.before_wreath_change(wreath['id'])
                     self.wreaths_data.append(wreath)
                     imported_count += 1
+                
+                # Process hashtags for this file's wreaths in one batch
+                self.hashtag_engine.process_catalog(wreaths_to_import)
+                for wreath in wreaths_to_import:
+                    self.index_wreath(wreath)
             else:
                 # Save problematic file to encoding_backups
                 backup_dir = self.project_folder / "encoding_backups"
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_file = backup_dir / f"failed_import_{timestamp}_{Path(file_path).name}"
                 try:
+                    import shutil
                     shutil.copy2(file_path, backup_file)
                 except Exception:
                     pass  # Backup failed, but continue
@@ -1206,7 +1814,7 @@ class TwinfolksWreathManager(QMainWindow):
                 error_files.append(f"{Path(file_path).name}: {error_msg}")
         
         if imported_count > 0:
-            self.populate_table()
+            self.apply_filters()
             self.mark_changes_made()
             
             message = f"Successfully imported {imported_count} wreath(s)."
@@ -1239,13 +1847,14 @@ class TwinfolksWreathManager(QMainWindow):
         if file_path:
             try:
                 with open(file_path, 'w') as f:
-                    json.dump(self.wreaths_data, f, indent=2)
+                    json.dump(self.wreaths_data, f, indent=2, default=to_json_value)
                 QMessageBox.information(self, "Export Complete", f"Wreaths exported to:\n{file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Export Error", f"Could not export wreaths: {e}")
                 
     def open_settings(self):
         """Open settings dialog and handle folder changes"""
+        from settings_dialog_pyside import SettingsDialog
         dialog = SettingsDialog(self.settings, self)
         if dialog.exec() == QDialog.Accepted:
             new_settings = dialog.get_settings()
@@ -1261,14 +1870,20 @@ class TwinfolksWreathManager(QMainWindow):
                 # Update project folder and reload everything
                 self.project_folder = Path(new_folder)
                 self.ensure_project_structure()
+                self.stall_monitor.log_file = self.stall_log_file()
                 
                 # Update window title
                 self.setWindowTitle(f"Twinfolks Wreath Manager - {self.project_folder}")
                 
                 # Reload data from new location
                 self.load_settings()
-                self.load_wreaths()
-                self.populate_table()
+                self.load_filter_config()
+                self.build_facet_buttons()
+                
+                # Cached hashtags of the old folder's wreaths would only pile up
+                self.stop_catalog_load()
+                self.hashtag_engine.clear()
+                self.start_catalog_load()
                 
                 QMessageBox.information(
                     self, "Folder Changed", 
@@ -1286,6 +1901,9 @@ class TwinfolksWreathManager(QMainWindow):
                 
     def closeEvent(self, event):
         """Handle application close event"""
+        # Write any settings still waiting on the idle timer
+        self.settings_store.flush()
+        
         if self.changes_made:
             reply = QMessageBox.question(
                 self, 'Unsaved Changes',
@@ -1303,6 +1921,12 @@ class TwinfolksWreathManager(QMainWindow):
                 event.ignore()
         else:
             event.accept()
+        
+        if event.isAccepted():
+            self.stop_catalog_load()
+            self.stall_monitor.stop()
+            if getattr(self, 'deploy_manager', None) is not None:
+                self.deploy_manager.shutdown()
 
     def deploy_to_netlify(self):
         """Deploy wreaths.json to Netlify website"""
@@ -1320,16 +1944,43 @@ class TwinfolksWreathManager(QMainWindow):
                 return
         
         # Create deploy manager and deploy
-        deploy_manager = DeployManager(self.settings, self.wreaths_data, self)
-        deploy_manager.deploy()
+        from deploy_manager_pyside import DeployManager
+        self.deploy_manager = DeployManager(self.settings, self.wreaths_data, self)
+        self.deploy_manager.deploy()
+
+    def show_deploy_history(self):
+        """Show past deploys, with rollback"""
+        from deploy_manager_pyside import DeployManager
+        self.deploy_manager = DeployManager(self.settings, self.wreaths_data, self)
+        self.deploy_manager.show_history()
 
 def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Twinfolks Wreath Manager")
     app.setApplicationVersion("1.0")
+    startup_profile.mark("QApplication")
     
     window = TwinfolksWreathManager()
     window.show()
+    startup_profile.mark("window shown")
+    
+    # --startup-profile[=report.json]: report per-phase timings once the
+    # catalog is in, then exit (the JSON file is for windowed builds)
+    profile_args = [arg for arg in sys.argv if arg.split('=', 1)[0] == '--startup-profile']
+    if profile_args:
+        report_path = profile_args[0].partition('=')[2]
+        def finish_startup_profile():
+            startup_profile.mark("catalog loaded")
+            print(startup_profile.report())
+            if report_path:
+                with open(report_path, 'w') as f:
+                    json.dump(startup_profile.as_dict(), f, indent=2)
+            app.quit()
+        window.catalog_loaded.connect(finish_startup_profile)
+    
+    # Settings changes still waiting on the idle timer are written on exit
+    app.aboutToQuit.connect(window.settings_store.flush)
+    app.aboutToQuit.connect(ImageDownloadThread.wait_for_active)
     
     sys.exit(app.exec())
 
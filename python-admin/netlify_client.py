@@ -0,0 +1,178 @@
+# File: python-admin/netlify_client.py
+# Small Netlify API client for digest deploys that upload only changed files
+
+import hashlib
+import threading
+import requests
+
+DEFAULT_API_BASE = "https://api.netlify.com/api/v1"
+
+# Seconds allowed for each kind of call: (connect, read)
+TIMEOUTS = {
+    "site": (5, 10),
+    "list_files": (5, 30),
+    "create_deploy": (5, 60),
+    "upload": (5, 120),
+    "poll": (5, 15),
+    "restore": (5, 30),
+}
+
+UPLOAD_CHUNK = 64 * 1024  # Cancellation is checked between chunks of an upload
+
+
+def sha1_digest(data):
+    """Netlify identifies file content by its SHA1 hex digest"""
+    return hashlib.sha1(data).hexdigest()
+
+
+class NetlifyError(Exception):
+    """An API call that failed, with the HTTP status if there was a response"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class DeployCancelled(Exception):
+    """Raised inside a deploy once its CancelToken has been cancelled"""
+
+
+class CancelToken:
+    """Thread-safe cancellation flag shared by a deploy and the window that started it"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        """Raise DeployCancelled if cancelled"""
+        if self._event.is_set():
+            raise DeployCancelled("Deploy cancelled")
+
+    def wait(self, seconds):
+        """Sleep up to seconds, waking at once on cancel; True if cancelled"""
+        return self._event.wait(seconds)
+
+
+class CancellableBody:
+    """Request body that reads its data in chunks and stops once cancelled"""
+
+    def __init__(self, data, cancel_token):
+        self.data = data
+        self.position = 0
+        self.cancel_token = cancel_token
+
+    def __len__(self):
+        return len(self.data)
+
+    def read(self, size=-1):
+        self.cancel_token.check()
+        size = UPLOAD_CHUNK if size is None or size < 0 else min(size, UPLOAD_CHUNK)
+        chunk = self.data[self.position:self.position + size]
+        self.position += len(chunk)
+        return chunk
+
+
+class NetlifyClient:
+    """The few Netlify endpoints the deploy needs
+
+    api_base can point at a local stand-in server (benchmarks/fake_netlify.py)
+    instead of api.netlify.com.
+
+    With a cancel_token, each call runs on a short-lived helper thread that
+    the caller waits on in small steps, so cancelling returns within a
+    fraction of a second even mid-request. Nothing is killed: an abandoned
+    upload stops at its next chunk, and other calls end at their timeout.
+    """
+
+    def __init__(self, access_token, api_base=None, cancel_token=None):
+        self.api_base = (api_base or DEFAULT_API_BASE).rstrip('/')
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {access_token}'
+        self.cancel_token = cancel_token
+        self.bytes_uploaded = 0
+
+    def _request(self, method, path, expected=(200,), step="site", **kwargs):
+        if self.cancel_token is not None:
+            self.cancel_token.check()
+            response = self._cancellable(self.session.request, method, f"{self.api_base}{path}",
+                                         timeout=TIMEOUTS[step], **kwargs)
+        else:
+            response = self.session.request(method, f"{self.api_base}{path}", timeout=TIMEOUTS[step], **kwargs)
+        if response.status_code not in expected:
+            raise NetlifyError(f"{method} {path} returned {response.status_code}: {response.text[:300]}",
+                               response.status_code)
+        return response
+
+    def _cancellable(self, function, *args, **kwargs):
+        """Run a blocking call on a helper thread, giving up on it if the deploy is cancelled"""
+        outcome = {}
+        done = threading.Event()
+
+        def call():
+            try:
+                outcome['result'] = function(*args, **kwargs)
+            except BaseException as e:
+                outcome['error'] = e
+            finally:
+                done.set()
+
+        threading.Thread(target=call, name="netlify-request", daemon=True).start()
+        while not done.wait(0.05):
+            self.cancel_token.check()
+        self.cancel_token.check()
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome['result']
+
+    def get_site(self, site_id):
+        return self._request('GET', f"/sites/{site_id}", step="site").json()
+
+    def list_files(self, site_id):
+        """{path: sha1} of the files in the site's current deploy"""
+        files = self._request('GET', f"/sites/{site_id}/files", step="list_files").json()
+        return {f['path']: f['sha'] for f in files if f.get('path') and f.get('sha')}
+
+    def create_deploy(self, site_id, manifest):
+        """Start a deploy from a {path: sha1} manifest; the response lists required digests"""
+        return self._request('POST', f"/sites/{site_id}/deploys", expected=(200, 201),
+                             json={"files": manifest}, step="create_deploy").json()
+
+    def upload_file(self, deploy_id, path, data):
+        body = CancellableBody(data, self.cancel_token) if self.cancel_token is not None else data
+        self._request('PUT', f"/deploys/{deploy_id}/files/{path.lstrip('/')}", expected=(200, 201),
+                      data=body, headers={'Content-Type': 'application/octet-stream'}, step="upload")
+        self.bytes_uploaded += len(data)
+
+    def get_deploy(self, deploy_id):
+        return self._request('GET', f"/deploys/{deploy_id}", step="poll").json()
+
+    def restore_deploy(self, site_id, deploy_id):
+        """Publish an earlier deploy again; Netlify still has its files, so nothing is uploaded"""
+        return self._request('POST', f"/sites/{site_id}/deploys/{deploy_id}/restore",
+                             expected=(200, 201), step="restore").json()
+
+
+def plan_deploy(local_files, remote_files, owned_prefixes=(), digests=None):
+    """Work out a digest deploy of local_files ({path: bytes}) over the live site
+
+    Every live file is kept by its current digest, so the deploy never drops
+    the rest of the site, except live files under owned_prefixes that
+    local_files no longer has (e.g. superseded content-hashed shards).
+    Pass digests if the local files have already been hashed.
+    Returns (manifest, local digests, changed paths).
+    """
+    if digests is None:
+        digests = {path: sha1_digest(data) for path, data in local_files.items()}
+    manifest = {path: sha for path, sha in remote_files.items()
+                if path in digests or not path.startswith(tuple(owned_prefixes))}
+    manifest.update(digests)
+    changed = [path for path, digest in digests.items() if remote_files.get(path) != digest]
+    changed += [path for path in remote_files if path not in manifest]
+    return manifest, digests, changed
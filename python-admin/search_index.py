@@ -0,0 +1,169 @@
+# File: python-admin/search_index.py
+# Tokenized inverted index for searching wreaths by title, description and hashtags
+
+import re
+from bisect import bisect_left, insort
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# How much a match in each field counts towards a wreath's score
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'hashtags': 2.0,
+    'description': 1.0,
+}
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens"""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def wreath_term_weights(wreath):
+    """Weighted terms for a wreath, summed across its searchable fields"""
+    weights = {}
+    hashtags = wreath.get('hashtags', [])
+    if isinstance(hashtags, list):
+        hashtags = ' '.join(tag for tag in hashtags if isinstance(tag, str))
+
+    fields = {
+        'title': wreath.get('title', ''),
+        'hashtags': hashtags,
+        'description': wreath.get('description', ''),
+    }
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        # Each field counts once per term so long descriptions don't outrank titles
+        for term in set(tokenize(text if isinstance(text, str) else str(text))):
+            weights[term] = weights.get(term, 0.0) + weight
+    return weights
+
+
+class SearchIndex:
+    """Inverted index with prefix matching and ranked results
+
+    Terms are kept in a sorted list so every term starting with a typed prefix
+    is found with a binary search instead of a scan over the catalog.
+    """
+
+    def __init__(self):
+        self._postings = {}      # term -> {wreath id: weight}
+        self._terms = []         # sorted list of all indexed terms
+        self._terms_by_id = {}   # wreath id -> {term: weight}
+
+    def __len__(self):
+        return len(self._terms_by_id)
+
+    def add(self, wreath):
+        """Index a wreath, replacing whatever was indexed for its id"""
+        wreath_id = wreath.get('id')
+        if not wreath_id:
+            return
+        if wreath_id in self._terms_by_id:
+            self.remove(wreath_id)
+
+        term_weights = wreath_term_weights(wreath)
+        self._terms_by_id[wreath_id] = term_weights
+        for term, weight in term_weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._terms, term)
+            postings[wreath_id] = weight
+
+    # Re-indexing an edited wreath is the same operation
+    update = add
+
+    def remove(self, wreath_id):
+        """Remove a wreath from the index"""
+        term_weights = self._terms_by_id.pop(wreath_id, {})
+        for term in term_weights:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(wreath_id, None)
+            if not postings:
+                del self._postings[term]
+                position = bisect_left(self._terms, term)
+                if position < len(self._terms) and self._terms[position] == term:
+                    del self._terms[position]
+
+    def rebuild(self, wreaths):
+        """Index a whole catalog from scratch"""
+        self._postings.clear()
+        self._terms_by_id.clear()
+        for wreath in wreaths:
+            wreath_id = wreath.get('id')
+            if not wreath_id:
+                continue
+            term_weights = wreath_term_weights(wreath)
+            self._terms_by_id[wreath_id] = term_weights
+            for term, weight in term_weights.items():
+                self._postings.setdefault(term, {})[wreath_id] = weight
+        self._terms = sorted(self._postings)
+
+    def terms_with_prefix(self, prefix):
+        """All indexed terms starting with a prefix"""
+        terms = self._terms
+        position = bisect_left(terms, prefix)
+        matches = []
+        while position < len(terms) and terms[position].startswith(prefix):
+            matches.append(terms[position])
+            position += 1
+        return matches
+
+    def search(self, query):
+        """Return wreath ids matching every query word, best matches first
+
+        Each query word matches any term it is a prefix of; exact term
+        matches score higher than prefix-only matches.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        combined = None
+        for token in tokens:
+            token_scores = {}
+            for term in self.terms_with_prefix(token):
+                boost = 1.0 if term == token else 0.5
+                for wreath_id, weight in self._postings[term].items():
+                    score = weight * boost
+                    if score > token_scores.get(wreath_id, 0.0):
+                        token_scores[wreath_id] = score
+
+            if combined is None:
+                combined = token_scores
+            else:
+                combined = {wreath_id: score + token_scores[wreath_id]
+                            for wreath_id, score in combined.items() if wreath_id in token_scores}
+            if not combined:
+                return []
+
+        return sorted(combined, key=combined.get, reverse=True)
+
+
+def compact_index(wreaths):
+    """The catalog's index as compact JSON-ready data for the storefront
+
+    Wreaths are numbered by their position in the list; the storefront
+    gets the matching id list separately. terms is sorted, so a prefix is
+    found with a binary search, and postings[i] lists the ordinals of the
+    wreaths containing terms[i] as gaps from the previous ordinal, which
+    keeps the numbers short.
+    """
+    index = SearchIndex()
+    index.rebuild(wreaths)
+    ordinals = {wreath.get('id'): ordinal for ordinal, wreath in enumerate(wreaths) if wreath.get('id')}
+
+    postings = []
+    for term in index._terms:
+        previous = 0
+        gaps = []
+        for ordinal in sorted(ordinals[wreath_id] for wreath_id in index._postings[term]):
+            gaps.append(ordinal - previous)
+            previous = ordinal
+        postings.append(gaps)
+    return {"version": 1, "terms": index._terms, "postings": postings}
@@ -0,0 +1,100 @@
+# File: python-admin/settings_store.py
+# In-memory settings with coalesced, atomic writes to settings.json
+
+import os
+import json
+import tempfile
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer
+
+
+def file_mode(file_path):
+    """Permission bits for writing file_path: its current ones, or 0o666 less the umask"""
+    try:
+        return os.stat(file_path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write_text(file_path, text, encoding='utf-8'):
+    """Write a file so readers only ever see the old or the new contents
+
+    The text goes to a temporary file in the same folder, which then
+    replaces the target in a single rename. The file keeps its permissions
+    (a new one gets the usual umask-based ones, not mkstemp's 0600).
+    """
+    file_path = Path(file_path)
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, file_mode(file_path))
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(file_path, data, indent=2):
+    """Atomically write data as JSON"""
+    atomic_write_text(file_path, json.dumps(data, indent=indent))
+
+
+class SettingsStore(QObject):
+    """Keeps settings in memory and writes them out once things go quiet
+
+    Frequent changes such as column drags only mark the settings dirty; a
+    short idle timer then writes settings.json once. Call flush() at shutdown
+    and save_now() for explicit saves.
+    """
+
+    def __init__(self, settings_file=None, data=None, idle_ms=500, parent=None):
+        super().__init__(parent)
+        self.settings_file = Path(settings_file) if settings_file else None
+        self.data = data if data is not None else {}
+        self.dirty = False
+        self.write_count = 0
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(idle_ms)
+        self._idle_timer.timeout.connect(self.flush)
+
+    def replace(self, settings_file, data):
+        """Point the store at a (possibly different) settings file and dict"""
+        self.flush()
+        self.settings_file = Path(settings_file)
+        self.data = data
+        self.dirty = False
+
+    def mark_dirty(self):
+        """Schedule a write; repeated calls keep pushing the write back"""
+        self.dirty = True
+        self._idle_timer.start()
+
+    def save_now(self):
+        """Write immediately, raising on failure"""
+        self._idle_timer.stop()
+        atomic_write_json(self.settings_file, self.data)
+        self.dirty = False
+        self.write_count += 1
+
+    def flush(self):
+        """Write pending changes, if any. Returns True if a write happened."""
+        self._idle_timer.stop()
+        if not self.dirty or not self.settings_file:
+            return False
+        try:
+            self.save_now()
+        except Exception as e:
+            print(f"Could not save settings: {e}")
+            return False
+        return True
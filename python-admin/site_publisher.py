@@ -0,0 +1,192 @@
+# File: python-admin/site_publisher.py
+# Builds the files a deploy publishes: a sharded, content-hashed storefront catalog, minified
+
+import gzip
+import base64
+import json
+import hashlib
+import time
+
+from wreath_record import to_json_value
+from search_index import compact_index
+from instrumentation import span
+
+# The fields website/js/wreaths.js reads; everything else is admin-only.
+# Descriptions are only needed in the detail modal and for search, so the
+# page fetches them separately after the grid is showing.
+STOREFRONT_FIELDS = ("id", "title", "localPrice", "sold", "featured",
+                     "hashtags", "dateAdded", "images")
+
+# The storefront reads catalog/index.json, which names content-hashed shards
+CATALOG_DIR = "/catalog/"
+INDEX_FILE = CATALOG_DIR + "index.json"
+FIRST_PAGE_SIZE = 24   # Cards on the first screen
+PAGE_SIZE = 100        # Records per page shard
+
+# Site paths the publisher owns: live files under these that a deploy no
+# longer publishes (old shards, the earlier single-file catalog) are removed
+OWNED_PREFIXES = (CATALOG_DIR, "/catalog.json", "/descriptions.json")
+
+# Fields a first-screen card needs (hashtags too, so filters work on it)
+SUMMARY_FIELDS = ("id", "title", "localPrice", "sold", "featured", "hashtags", "dateAdded")
+
+
+def project_wreath(wreath):
+    """The storefront's view of a wreath
+
+    False flags and empty values are left out (the page treats a missing
+    field the same way) and whole-dollar prices are written as integers.
+    """
+    projected = {}
+    for field in STOREFRONT_FIELDS:
+        value = wreath.get(field)
+        if value is None or value is False or value == "" or value == []:
+            continue
+        if field == "localPrice" and isinstance(value, float) and value.is_integer():
+            value = int(value)
+        projected[field] = value
+    return projected
+
+
+def minified_json(data):
+    """Compact UTF-8 JSON bytes"""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=to_json_value).encode('utf-8')
+
+
+def gzipped_size(data):
+    """Bytes data takes gzipped, roughly what Netlify's own compression sends"""
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def storefront_order(wreaths):
+    """Wreaths in the storefront's default order: featured first, then newest added"""
+    by_date = sorted(wreaths, key=lambda w: w.get('dateAdded') or '', reverse=True)
+    return sorted(by_date, key=lambda w: not w.get('featured'))
+
+
+def summarize_wreath(projected):
+    """A first-screen card: summary fields plus the first image only"""
+    summary = {field: projected[field] for field in SUMMARY_FIELDS if field in projected}
+    if projected.get('images'):
+        summary['images'] = projected['images'][:1]
+    return summary
+
+
+def category_ordinals(projected_wreaths, filter_categories):
+    """{'Category|Subcategory': [wreath positions]} using the website's filter rule
+    (a wreath belongs if it has any of the subcategory's hashtags)"""
+    wreath_tags = [{tag.lower() for tag in wreath.get('hashtags', [])} for wreath in projected_wreaths]
+    members = {}
+    for category in filter_categories or []:
+        for subcategory in category['subcategories']:
+            hashtags = set(subcategory['hashtags'])
+            members[f"{category['name']}|{subcategory['name']}"] = [
+                ordinal for ordinal, tags in enumerate(wreath_tags) if tags & hashtags
+            ]
+    return members
+
+
+def compile_facets(filter_categories, members, wreath_count):
+    """{'Category|Subcategory': {hashtags, count, bits}} for the storefront's filters
+
+    bits is a base64 bitset over wreath positions (bit n & 7 of byte n >> 3
+    is wreath n), so combining filters is a bitwise AND. The hashtags let the
+    page check the facet was compiled from the same filter definition it has.
+    """
+    facets = {}
+    for category in filter_categories or []:
+        for subcategory in category['subcategories']:
+            key = f"{category['name']}|{subcategory['name']}"
+            bits = bytearray((wreath_count + 7) // 8)
+            for ordinal in members[key]:
+                bits[ordinal >> 3] |= 1 << (ordinal & 7)
+            facets[key] = {"hashtags": subcategory['hashtags'], "count": len(members[key]),
+                           "bits": base64.b64encode(bytes(bits)).decode('ascii')}
+    return facets
+
+
+def hashed_path(kind, data):
+    """Content-hashed shard path, e.g. /catalog/page-000-1a2b3c4d5e6f.json"""
+    return f"{CATALOG_DIR}{kind}-{hashlib.sha1(data).hexdigest()[:12]}.json"
+
+
+def publish_site_files(wreaths, json_content=None, filter_categories=None, stats=None):
+    """{site path: bytes} for a deploy
+
+    /wreaths.json stays the full pretty-printed catalog for the web admin
+    pages. The storefront first loads catalog/index.json and the small
+    first-page file it names; page shards, per-subcategory shards and
+    facet bitsets, descriptions and the search index follow on demand.
+    Every shard name carries its content hash. Netlify compresses responses
+    itself, so no .gz copies are published. If a stats dict is given, the
+    search index build time is stored in it.
+    """
+    if json_content is None:
+        json_content = json.dumps(wreaths, indent=2, default=to_json_value)
+    ordered = storefront_order(wreaths)
+    projected = [project_wreath(wreath) for wreath in ordered]
+    files = {"/wreaths.json": json_content.encode('utf-8')}
+
+    def add_shard(kind, content):
+        data = minified_json(content)
+        path = hashed_path(kind, data)
+        files[path] = data
+        return path.lstrip('/')
+
+    first = add_shard("first", [summarize_wreath(wreath) for wreath in projected[:FIRST_PAGE_SIZE]])
+    pages = [add_shard(f"page-{number:03d}", projected[start:start + PAGE_SIZE])
+             for number, start in enumerate(range(0, len(projected), PAGE_SIZE))]
+    members = category_ordinals(projected, filter_categories)
+    categories = {key: add_shard("category", [projected[ordinal] for ordinal in ordinals])
+                  for key, ordinals in members.items()}
+    descriptions = add_shard("descriptions", {wreath.get('id'): wreath.get('description')
+                                              for wreath in wreaths if wreath.get('description')})
+
+    # Search and facets number wreaths by their position in the storefront order
+    ids = add_shard("ids", [wreath.get('id') for wreath in projected])
+    facets = add_shard("facets", compile_facets(filter_categories, members, len(projected)))
+
+    # Search covers titles, hashtags and descriptions, so it's built from the full records
+    started = time.perf_counter()
+    with span("deploy.search_index"):
+        search = add_shard("search", compact_index(ordered))
+    if stats is not None:
+        stats['search_index_ms'] = (time.perf_counter() - started) * 1000
+
+    files[INDEX_FILE] = minified_json({
+        "version": 1,
+        "total": len(projected),
+        "featured": sum(1 for wreath in projected if wreath.get('featured')),
+        "first": first,
+        "pages": pages,
+        "categories": categories,
+        "facetCounts": {key: len(ordinals) for key, ordinals in members.items()},
+        "descriptions": descriptions,
+        "ids": ids,
+        "facets": facets,
+        "search": search,
+    })
+    return files
+
+
+def payload_summary(site_files, stats=None):
+    """Lines comparing the storefront's first-paint payload with the full wreaths.json
+    and describing the search index"""
+    full = len(site_files["/wreaths.json"])
+    index = json.loads(site_files[INDEX_FILE])
+    first_paint = [INDEX_FILE, "/" + index["first"]]
+    raw = sum(len(site_files[path]) for path in first_paint)
+    compressed = sum(gzipped_size(site_files[path]) for path in first_paint)
+    shards = sum(1 for path in site_files if path.startswith(CATALOG_DIR))
+    return (f"Storefront first paint {raw / 1024:.1f} KB ({compressed / 1024:.1f} KB gzipped) "
+            f"instead of the full {full / 1024:.0f} KB wreaths.json; {shards} catalog files"
+            f"{search_summary(site_files, stats)}")
+
+
+def search_summary(site_files, stats=None):
+    """Search index size (and build time, when known) as a line for payload_summary"""
+    search_path = "/" + json.loads(site_files[INDEX_FILE])["search"]
+    search = json.loads(site_files[search_path])
+    build_time = f", built in {stats['search_index_ms']:.0f} ms" if stats and 'search_index_ms' in stats else ""
+    return (f"\n🔎 Search index: {len(search['terms'])} terms, {len(site_files[search_path]) / 1024:.1f} KB "
+            f"({gzipped_size(site_files[search_path]) / 1024:.1f} KB gzipped){build_time}")
@@ -0,0 +1,98 @@
+# File: python-admin/sort_keys.py
+# Precomputed, cached sort keys for the wreath table
+
+import re
+from datetime import datetime
+
+TITLE_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+FALLBACK_DATE = datetime(1900, 1, 1)
+
+# Sort fields a wreath can be ordered by
+SORT_FIELDS = ('title', 'price', 'date', 'featured', 'sold')
+
+# Sort combo presets as (field, descending) pairs, most significant first
+SORT_PRESETS = {
+    "Featured (Default)": [('featured', True), ('title', False)],
+    "Title A-Z": [('title', False)],
+    "Title Z-A": [('title', True)],
+    "Price Low to High": [('price', False)],
+    "Price High to Low": [('price', True)],
+    "Date Created (Oldest First)": [('date', False)],
+    "Date Created (Newest First)": [('date', True)],
+}
+
+
+def normalize_title(title):
+    """Lowercase title without punctuation, for alphabetical sorting"""
+    return TITLE_PUNCTUATION_PATTERN.sub('', title or '').lower()
+
+
+def effective_price(wreath):
+    """The price shown for a wreath (localPrice, falling back to price)"""
+    price = wreath.get('localPrice', 0) or wreath.get('price', 0) or 0
+    try:
+        return float(price)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def parse_date_created(date_str):
+    """Parse a YYYY-MM-DD creation date, falling back to 1900-01-01"""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    except (TypeError, ValueError):
+        return FALLBACK_DATE
+
+
+def compute_sort_keys(wreath):
+    """All sort keys for one wreath, in SORT_FIELDS order"""
+    # Wreath records carry their price and date already normalized
+    price = getattr(wreath, 'price_value', None)
+    created = getattr(wreath, 'created', None)
+    return (
+        normalize_title(wreath.get('title', '')),
+        effective_price(wreath) if price is None else price,
+        parse_date_created(wreath.get('dateCreated', '1900-01-01')) if created is None else created,
+        bool(wreath.get('featured', False)),
+        bool(wreath.get('sold', False)),
+    )
+
+
+class SortKeyCache:
+    """Sort keys computed once per wreath and reused by every sort
+
+    Entries are keyed by wreath id and only dropped when that wreath is edited
+    or deleted, so re-sorting never re-runs the regex or date parsing.
+    """
+
+    def __init__(self):
+        self._keys = {}  # wreath id -> tuple in SORT_FIELDS order
+
+    def keys_for(self, wreath):
+        """Cached sort keys for a wreath"""
+        wreath_id = wreath.get('id')
+        keys = self._keys.get(wreath_id)
+        if keys is None:
+            keys = compute_sort_keys(wreath)
+            if wreath_id:
+                self._keys[wreath_id] = keys
+        return keys
+
+    def invalidate(self, wreath_id):
+        """Forget the keys of an edited or deleted wreath"""
+        self._keys.pop(wreath_id, None)
+
+    def clear(self):
+        """Forget every cached key"""
+        self._keys.clear()
+
+    def sort(self, wreaths, sort_spec):
+        """Sort wreaths in place by a list of (field, descending) pairs
+
+        Python's sort is stable, so sorting by the least significant key
+        first and the most significant last gives a multi-key ordering.
+        """
+        keys_for = self.keys_for
+        for field, descending in reversed(sort_spec):
+            position = SORT_FIELDS.index(field)
+            wreaths.sort(key=lambda wreath: keys_for(wreath)[position], reverse=descending)
@@ -0,0 +1,185 @@
+# File: python-admin/stall_monitor.py
+# Event-loop lag watchdog that records what the GUI thread was doing during a freeze
+#
+# Usage (rank the stalls logged across sessions):
+#     python stall_monitor.py [project_folder/logs/ui_stalls.jsonl ...]
+
+import os
+import sys
+import json
+import time
+import threading
+import traceback
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from instrumentation import tracer
+
+ADMIN_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def describe_stack(frame, limit=20):
+    """Innermost-last list of 'file:line in function' strings for a frame"""
+    return [
+        f"{os.path.relpath(entry.filename, ADMIN_DIR) if entry.filename.startswith(ADMIN_DIR) else entry.filename}"
+        f":{entry.lineno} in {entry.name}"
+        for entry in traceback.extract_stack(frame, limit=limit)
+    ]
+
+
+def app_location(stack):
+    """Innermost frame in the admin's own code, which is where a fix would go"""
+    for line in reversed(stack):
+        if not os.path.isabs(line.split(':', 1)[0]):
+            return line
+    return stack[-1] if stack else "unknown"
+
+
+class StallMonitor(QObject):
+    """Measures how late a GUI-thread heartbeat timer fires
+
+    A watcher thread notices when the heartbeat is overdue and takes the
+    GUI thread's Python stack while the freeze is still happening, together
+    with the innermost timing span open on that thread. When the heartbeat
+    finally runs, stalls over the threshold are logged with that capture.
+    """
+    stall_detected = Signal(object)  # stall record dict
+
+    HEARTBEAT_MS = 50
+
+    def __init__(self, threshold_ms=200, log_file=None, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.log_file = Path(log_file) if log_file else None
+        self.stalls = deque(maxlen=500)
+
+        self._gui_thread_id = threading.get_ident()
+        self._lock = threading.Lock()
+        self._last_beat = time.perf_counter()
+        self._capture = None  # (stack, operation) for the stall in progress
+        self._stopped = threading.Event()
+        self._watcher = None
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(self.HEARTBEAT_MS)
+        self._heartbeat.timeout.connect(self._beat)
+
+    def start(self):
+        with self._lock:
+            self._last_beat = time.perf_counter()
+            self._capture = None
+        self._heartbeat.start()
+        if self._watcher is None or not self._watcher.is_alive():
+            self._stopped.clear()
+            self._watcher = threading.Thread(target=self._watch, name="StallMonitor", daemon=True)
+            self._watcher.start()
+
+    def stop(self):
+        self._heartbeat.stop()
+        self._stopped.set()
+
+    def _watch(self):
+        """Watcher thread: capture the GUI stack once per overdue heartbeat"""
+        overdue = self.threshold + self.HEARTBEAT_MS / 1000
+        while not self._stopped.wait(self.threshold / 4):
+            with self._lock:
+                if self._capture is not None:
+                    continue
+                last_beat = self._last_beat
+            if time.perf_counter() - last_beat < overdue:
+                continue
+
+            frame = sys._current_frames().get(self._gui_thread_id)
+            stack = describe_stack(frame) if frame is not None else []
+            operation = tracer.active_span(self._gui_thread_id)
+            del frame
+            with self._lock:
+                if self._last_beat == last_beat:  # Still the same stall
+                    self._capture = (stack, operation)
+
+    def _beat(self):
+        """GUI thread: measure how late this heartbeat is"""
+        now = time.perf_counter()
+        with self._lock:
+            expected = self._last_beat + self.HEARTBEAT_MS / 1000
+            capture = self._capture
+            self._last_beat = now
+            self._capture = None
+
+        lag = now - expected
+        if lag >= self.threshold:
+            self._report(expected, now, capture)
+
+    def _report(self, started, ended, capture):
+        stack, operation = capture or ([], None)
+        stall = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "duration_ms": round((ended - started) * 1000, 1),
+            "operation": operation or "unknown",
+            "location": app_location(stack),
+            "stack": stack,
+        }
+        self.stalls.append(stall)
+        tracer.record("ui.stall", started, ended, {"operation": stall["operation"], "location": stall["location"]})
+        print(f"⚠ UI stall {stall['duration_ms']:.0f} ms during {stall['operation']} at {stall['location']}")
+
+        if self.log_file:
+            try:
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.log_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(stall) + "\n")
+            except OSError as e:
+                print(f"Could not write stall log: {e}")
+
+        self.stall_detected.emit(stall)
+
+
+def rank_stalls(stalls):
+    """Group stalls by operation and code location, worst total freeze time first"""
+    groups = {}
+    for stall in stalls:
+        key = (stall.get("operation", "unknown"), stall.get("location", "unknown"))
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {"operation": key[0], "location": key[1],
+                                   "count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        group["count"] += 1
+        group["total_ms"] += stall["duration_ms"]
+        group["max_ms"] = max(group["max_ms"], stall["duration_ms"])
+    return sorted(groups.values(), key=lambda group: group["total_ms"], reverse=True)
+
+
+def load_stall_log(file_path):
+    """Stall records from a ui_stalls.jsonl file, skipping damaged lines"""
+    stalls = []
+    with open(file_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                stalls.append(json.loads(line))
+            except ValueError:
+                continue
+    return stalls
+
+
+def format_ranking(ranking, limit=30):
+    lines = [f"{'Total ms':>10} {'Count':>6} {'Max ms':>8}  Operation / location"]
+    for group in ranking[:limit]:
+        lines.append(f"{group['total_ms']:>10.0f} {group['count']:>6} {group['max_ms']:>8.0f}  "
+                     f"{group['operation']} @ {group['location']}")
+    return "\n".join(lines)
+
+
+def main():
+    files = sys.argv[1:] or ["logs/ui_stalls.jsonl"]
+    stalls = []
+    for file_path in files:
+        stalls.extend(load_stall_log(file_path))
+    print(f"{len(stalls)} stalls from {len(files)} log file(s)\n")
+    print(format_ranking(rank_stalls(stalls)))
+
+
+if __name__ == "__main__":
+    main()
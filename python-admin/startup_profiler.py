@@ -0,0 +1,48 @@
+# File: python-admin/startup_profiler.py
+# Phase timings for app startup (run main_pyside.py --startup-profile)
+
+import time
+
+
+class StartupProfiler:
+    """Records how long each startup phase took
+
+    The clock starts when this module is first imported, which main_pyside.py
+    does before any of its other imports.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases = []  # (phase name, seconds in phase, seconds since start)
+
+    def mark(self, phase):
+        """End the current phase and give it a name"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last, now - self.started))
+        self._last = now
+
+    def has(self, phase):
+        """Whether a phase has been marked"""
+        return any(name == phase for name, _, _ in self.phases)
+
+    def as_dict(self):
+        """Phase timings in milliseconds, for JSON reports"""
+        return {
+            'phases': [
+                {'phase': name, 'ms': round(duration * 1000, 2), 'at_ms': round(elapsed * 1000, 2)}
+                for name, duration, elapsed in self.phases
+            ],
+            'total_ms': round(self.phases[-1][2] * 1000, 2) if self.phases else 0.0,
+        }
+
+    def report(self):
+        """Human-readable table of the phases"""
+        lines = ["Startup profile", f"{'Phase':<28}{'ms':>10}{'at ms':>10}"]
+        for name, duration, elapsed in self.phases:
+            lines.append(f"{name:<28}{duration * 1000:>10.1f}{elapsed * 1000:>10.1f}")
+        return "\n".join(lines)
+
+
+# Shared profiler for the running app
+startup_profile = StartupProfiler()
@@ -0,0 +1,176 @@
+# File: python-admin/wreath_record.py
+# Compact in-memory record for a single wreath
+
+import copy
+from collections.abc import MutableMapping
+
+from sort_keys import effective_price, parse_date_created
+
+# Fields every wreaths.json record may have, each stored in its own slot
+FIELDS = (
+    'id', 'title', 'localPrice', 'price', 'sold', 'featured', 'hashtags',
+    'category', 'dateAdded', 'dateCreated', 'description', 'platforms', 'images',
+)
+FIELD_SET = frozenset(FIELDS)
+
+# Fields the normalized price and date are derived from
+PRICE_FIELDS = frozenset(('localPrice', 'price'))
+DATE_FIELDS = frozenset(('dateCreated',))
+
+
+class _Missing:
+    """Marks a field that is absent from the record (falsy, like a missing .get)"""
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return '<missing>'
+
+
+MISSING = _Missing()
+
+# Shared key-order tuples, so records with the same layout share one tuple
+_KEY_ORDERS = {}
+
+
+def _intern_keys(keys):
+    """Return the shared copy of a key-order tuple"""
+    keys = tuple(keys)
+    return _KEY_ORDERS.setdefault(keys, keys)
+
+
+class Wreath(MutableMapping):
+    """A wreath record with one slot per known field
+
+    Behaves like the dict loaded from wreaths.json (get, [], in, keys, update
+    and so on) while using far less memory per record. Unknown keys are kept
+    in a small side dict and the original key order is remembered, so
+    to_dict() gives back exactly the dict that was loaded. The effective price
+    and creation date are normalized once, whenever their fields change.
+    """
+
+    __slots__ = FIELDS + ('_keys', '_extra', 'price_value', 'created')
+
+    def __init__(self, data=None):
+        for field in FIELDS:
+            setattr(self, field, MISSING)
+        self._keys = ()
+        self._extra = None
+        if data:
+            keys = []
+            for key, value in data.items():
+                if key in FIELD_SET:
+                    setattr(self, key, value)
+                else:
+                    if self._extra is None:
+                        self._extra = {}
+                    self._extra[key] = value
+                keys.append(key)
+            self._keys = _intern_keys(keys)
+        self._normalize_price()
+        self._normalize_date()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a wreaths.json dict"""
+        return cls(data)
+
+    def to_dict(self):
+        """The record as a plain dict, in its original key order"""
+        return {key: self[key] for key in self._keys}
+
+    def _normalize_price(self):
+        self.price_value = effective_price(self)
+
+    def _normalize_date(self):
+        self.created = parse_date_created(self.get('dateCreated', '1900-01-01'))
+
+    # Mapping interface
+
+    def __getitem__(self, key):
+        if key in FIELD_SET:
+            value = getattr(self, key)
+            if value is not MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in FIELD_SET:
+            value = getattr(self, key)
+            return default if value is MISSING else value
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __contains__(self, key):
+        if key in FIELD_SET:
+            return getattr(self, key) is not MISSING
+        return self._extra is not None and key in self._extra
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._keys = _intern_keys(self._keys + (key,))
+        if key in FIELD_SET:
+            setattr(self, key, value)
+            if key in PRICE_FIELDS:
+                self._normalize_price()
+            elif key in DATE_FIELDS:
+                self._normalize_date()
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._keys = _intern_keys(k for k in self._keys if k != key)
+        if key in FIELD_SET:
+            setattr(self, key, MISSING)
+            if key in PRICE_FIELDS:
+                self._normalize_price()
+            elif key in DATE_FIELDS:
+                self._normalize_date()
+        else:
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self):
+        for field in FIELDS:
+            setattr(self, field, MISSING)
+        self._keys = ()
+        self._extra = None
+        self._normalize_price()
+        self._normalize_date()
+
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        return Wreath(self)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return Wreath(copy.deepcopy(self.to_dict(), memo))
+
+    def __repr__(self):
+        return f"Wreath({self.to_dict()!r})"
+
+
+def to_json_value(obj):
+    """json.dump(s) default= hook that writes Wreath records as plain dicts"""
+    if isinstance(obj, Wreath):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
@@ -5,9 +5,22 @@ let wreathsData = [];
 let filterConfig = [];
 let currentWreath = null;
 let currentImageIndex = 0;
-let activeFilters = new Set();
+let activeFilters = new Map();  // Filter id -> 'Category|Subcategory' facet key
 let currentSort = 'featured';
 let currentSearchTerm = '';
+let descriptionsLoading = null;  // Promise while descriptions are being fetched
+let descriptionsById = null;
+let catalogIndex = null;         // catalog/index.json, naming the catalog's shard files
+let catalogComplete = false;     // Every wreath loaded, not just the first screen
+let catalogLoading = null;       // Promise while the catalog pages are being fetched
+const loadedCategories = new Set();
+let searchIndex = null;          // Prebuilt search index named by the catalog index
+let searchIndexLoading = null;
+let lastSearch = { term: null, ids: null };
+let catalogIdsLoading = null;    // Wreath ids by position, shared by the search index and facets
+let facetBits = null;            // Facet key -> Uint8Array membership bitset
+let ordinalById = null;
+const facetCountElements = new Map();
 
 // DOM elements
 const wreathGrid = document.getElementById('wreathGrid');
@@ -61,6 +74,13 @@ document.addEventListener('DOMContentLoaded', function() {
         buildFilterUI();
         displayWreaths();
         updateItemCount();
+        
+        // The first screen is showing; fetch the rest of the catalog
+        loadFullCatalog().then(() => {
+            displayWreaths();
+            updateItemCount();
+        });
+        loadFacets().then(updateFacetCounts);
     }).catch(error => {
         console.error('Error initializing app:', error);
         loadingMessage.innerHTML = '<p class="text-red-500">Error loading data. Please try again later.</p>';
@@ -69,26 +89,306 @@ document.addEventListener('DOMContentLoaded', function() {
     setupEventListeners();
 });
 
+// Fetch a JSON file, failing on HTTP errors
+async function fetchJson(path, options) {
+    const response = await fetch(path, options);
+    if (!response.ok) {
+        throw new Error(`Failed to load ${path}: ${response.status}`);
+    }
+    return response.json();
+}
+
 // Load wreaths data
 async function loadWreaths() {
     try {
-        const response = await fetch('wreaths.json');
-        if (!response.ok) {
-            throw new Error('Failed to load wreaths data');
+        // catalog/index.json is published by the admin and names content-hashed
+        // shards: a small first-screen page, full pages, one shard per filter
+        // and the descriptions. Only the first page is needed to show the grid.
+        try {
+            catalogIndex = await fetchJson('catalog/index.json', { cache: 'no-cache' });
+            wreathsData = [];
+            mergeWreaths(await fetchJson(catalogIndex.first), true);
+        } catch (error) {
+            // Sites deployed before the catalog shards existed
+            console.warn('Catalog index not available, loading wreaths.json:', error);
+            catalogIndex = null;
+            wreathsData = [];
+            mergeWreaths(await fetchJson('wreaths.json'), false);
+            catalogComplete = true;
+            descriptionsLoading = Promise.resolve();
         }
-        wreathsData = await response.json();
-        
+    } catch (error) {
+        console.error('Error loading wreaths:', error);
+        throw error;
+    }
+}
+
+// Add records to wreathsData, replacing first-screen (partial) copies of the same wreath
+function mergeWreaths(records, partial) {
+    const positions = new Map(wreathsData.map((wreath, index) => [wreath.id, index]));
+    records.forEach(wreath => {
         // Add featured field if missing (for backward compatibility)
-        wreathsData.forEach(wreath => {
-            if (wreath.featured === undefined) {
-                wreath.featured = false;
+        if (wreath.featured === undefined) {
+            wreath.featured = false;
+        }
+        if (partial) {
+            wreath.partial = true;
+        }
+        if (descriptionsById && wreath.description === undefined && descriptionsById[wreath.id]) {
+            wreath.description = descriptionsById[wreath.id];
+        }
+        
+        const index = positions.get(wreath.id);
+        if (index === undefined) {
+            positions.set(wreath.id, wreathsData.length);
+            wreathsData.push(wreath);
+        } else if (wreathsData[index].partial && !partial) {
+            wreathsData[index] = wreath;
+        }
+    });
+}
+
+// Load every catalog page (after the first screen is showing)
+function loadFullCatalog() {
+    if (!catalogLoading) {
+        if (catalogComplete) {
+            catalogLoading = Promise.resolve();
+        } else {
+            catalogLoading = Promise.all(catalogIndex.pages.map(path => fetchJson(path)))
+                .then(pages => {
+                    wreathsData = [];
+                    pages.forEach(page => mergeWreaths(page, false));
+                    catalogComplete = true;
+                })
+                .catch(error => {
+                    console.error('Error loading catalog pages:', error);
+                    catalogLoading = null;  // Try again on the next request
+                });
+        }
+    }
+    return catalogLoading;
+}
+
+// Load one filter's shard so it can be shown before the full catalog arrives
+function loadCategory(category, subcategory) {
+    const key = `${category.name}|${subcategory.name}`;
+    const path = catalogIndex && catalogIndex.categories[key];
+    if (catalogComplete || !path || loadedCategories.has(key)) {
+        return;
+    }
+    
+    loadedCategories.add(key);
+    fetchJson(path)
+        .then(records => {
+            if (!catalogComplete) {
+                mergeWreaths(records, false);
+                displayWreaths();
+                updateItemCount();
             }
+        })
+        .catch(error => {
+            console.warn(`Could not load ${key}:`, error);
+            loadedCategories.delete(key);
+        });
+}
+
+// Load descriptions (only needed for the detail modal and search)
+function loadDescriptions() {
+    if (!descriptionsLoading) {
+        descriptionsLoading = fetchJson(catalogIndex.descriptions)
+            .then(descriptions => {
+                descriptionsById = descriptions;
+                wreathsData.forEach(wreath => {
+                    if (wreath.description === undefined && descriptions[wreath.id]) {
+                        wreath.description = descriptions[wreath.id];
+                    }
+                });
+            })
+            .catch(error => {
+                console.warn('Could not load descriptions:', error);
+            });
+    }
+    return descriptionsLoading;
+}
+
+// Load the search index (terms, wreath ids and each term's wreath ordinals)
+function loadSearchIndex() {
+    if (!searchIndexLoading) {
+        searchIndexLoading = Promise.all([fetchJson(catalogIndex.search), loadCatalogIds()])
+            .then(([index, ids]) => {
+                // Postings are stored as gaps between ordinals; turn them back into ids
+                const postings = index.postings.map(gaps => {
+                    let ordinal = 0;
+                    return gaps.map(gap => ids[ordinal += gap]);
+                });
+                searchIndex = { terms: index.terms, postings: postings };
+            })
+            .catch(error => {
+                console.warn('Could not load search index:', error);
+                searchIndexLoading = null;  // Try again on the next search
+                // The substring scan searches descriptions too, so make sure they're loaded
+                return loadDescriptions();
+            });
+    }
+    return searchIndexLoading;
+}
+
+// Load the wreath ids the search index and facet bitsets number wreaths by
+function loadCatalogIds() {
+    if (!catalogIdsLoading) {
+        catalogIdsLoading = fetchJson(catalogIndex.ids).then(ids => {
+            ordinalById = new Map(ids.map((id, ordinal) => [id, ordinal]));
+            return ids;
+        });
+        catalogIdsLoading.catch(() => {
+            catalogIdsLoading = null;  // Try again on the next request
+        });
+    }
+    return catalogIdsLoading;
+}
+
+// Load the facet bitsets, keeping only facets compiled from the same
+// filter definitions this page has
+function loadFacets() {
+    if (!catalogIndex || !catalogIndex.facets) {
+        return Promise.resolve();
+    }
+    return Promise.all([fetchJson(catalogIndex.facets), loadCatalogIds()])
+        .then(([facets]) => {
+            const bits = new Map();
+            filterConfig.forEach(category => {
+                category.subcategories.forEach(subcategory => {
+                    const key = `${category.name}|${subcategory.name}`;
+                    const facet = facets[key];
+                    const hashtags = subcategory.hashtags.map(tag => tag.toLowerCase());
+                    if (facet && facet.hashtags.join(',') === hashtags.join(',')) {
+                        bits.set(key, Uint8Array.from(atob(facet.bits), c => c.charCodeAt(0)));
+                    }
+                });
+            });
+            facetBits = bits;
+        })
+        .catch(error => {
+            console.warn('Could not load facets:', error);
         });
+}
+
+// Bitset of wreaths matching every active filter, or null if a filter has no bitset
+function activeFacetBits(extraKey) {
+    if (!facetBits) {
+        return null;
+    }
+    const keys = [...activeFilters.values()];
+    if (extraKey) {
+        keys.push(extraKey);
+    }
+    
+    let result = null;
+    for (const key of keys) {
+        const bits = facetBits.get(key);
+        if (!bits) {
+            return null;
+        }
+        if (result === null) {
+            result = Uint8Array.from(bits);
+        } else {
+            for (let i = 0; i < result.length; i++) {
+                result[i] &= bits[i];
+            }
+        }
+    }
+    return result;
+}
+
+// Bitset (over the catalog's wreath positions) of a list of wreaths
+function wreathBits(wreaths) {
+    const bits = new Uint8Array(Math.ceil(ordinalById.size / 8));
+    wreaths.forEach(wreath => {
+        const ordinal = ordinalById.get(wreath.id);
+        if (ordinal !== undefined) {
+            bits[ordinal >> 3] |= 1 << (ordinal & 7);
+        }
+    });
+    return bits;
+}
+
+// Number of set bits in a bitset
+function countBits(bits) {
+    let count = 0;
+    for (let i = 0; i < bits.length; i++) {
+        let byte = bits[i];
+        while (byte) {
+            byte &= byte - 1;
+            count++;
+        }
+    }
+    return count;
+}
+
+// Show how many wreaths each filter would match alongside the chosen filters,
+// the search and the "available only" toggle
+function updateFacetCounts() {
+    // Search and "available only" narrow the counts too; that takes the whole
+    // catalog, so until it has loaded those counts are left blank
+    const narrowed = currentSearchTerm.trim() !== '' || showAvailableOnly.checked;
+    const searched = narrowed && catalogComplete && facetBits ? wreathBits(getSearchedWreaths()) : null;
+    
+    facetCountElements.forEach((element, key) => {
+        let count = null;
+        const bits = activeFacetBits(key);
+        if (bits && (!narrowed || searched)) {
+            if (searched) {
+                for (let i = 0; i < bits.length; i++) {
+                    bits[i] &= searched[i];
+                }
+            }
+            count = countBits(bits);
+        } else if (!narrowed && activeFilters.size === 0 && catalogIndex && catalogIndex.facetCounts) {
+            count = catalogIndex.facetCounts[key];
+        }
+        element.textContent = count === null || count === undefined ? '' : `(${count})`;
+    });
+}
+
+// Split search text into lowercase word tokens (as the admin's indexer does)
+function tokenize(text) {
+    return text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [];
+}
+
+// Ids of wreaths matching every search word, where a word matches any
+// indexed term it is a prefix of
+function searchMatches(searchTerm) {
+    if (lastSearch.term === searchTerm) {
+        return lastSearch.ids;
+    }
+    
+    let matches = null;
+    for (const token of tokenize(searchTerm)) {
+        // Binary search for the first term not before the token
+        const terms = searchIndex.terms;
+        let low = 0;
+        let high = terms.length;
+        while (low < high) {
+            const middle = (low + high) >> 1;
+            if (terms[middle] < token) {
+                low = middle + 1;
+            } else {
+                high = middle;
+            }
+        }
         
-    } catch (error) {
-        console.error('Error loading wreaths:', error);
-        throw error;
+        const tokenMatches = new Set();
+        for (let i = low; i < terms.length && terms[i].startsWith(token); i++) {
+            searchIndex.postings[i].forEach(id => tokenMatches.add(id));
+        }
+        matches = matches === null ? tokenMatches : new Set([...matches].filter(id => tokenMatches.has(id)));
+        if (matches.size === 0) {
+            break;
+        }
     }
+    
+    lastSearch = { term: searchTerm, ids: matches || new Set() };
+    return lastSearch.ids;
 }
 
 // Load filter configuration
@@ -115,6 +415,7 @@ function buildFilterUI() {
     }
 
     filterCategories.innerHTML = '';
+    facetCountElements.clear();
 
     filterConfig.forEach(category => {
         const categoryDiv = document.createElement('div');
@@ -136,15 +437,20 @@ function buildFilterUI() {
             checkbox.type = 'checkbox';
             checkbox.id = `filter-${category.name.replace(/\s+/g, '-').toLowerCase()}-${subcategory.name.replace(/\s+/g, '-').toLowerCase()}`;
             checkbox.className = 'mr-2 h-4 w-4 text-blue-600 rounded';
-            checkbox.addEventListener('change', () => handleFilterChange(subcategory, checkbox.checked));
+            checkbox.addEventListener('change', () => handleFilterChange(category, subcategory, checkbox.checked));
 
             const label = document.createElement('label');
             label.htmlFor = checkbox.id;
             label.className = 'text-sm text-gray-700 cursor-pointer';
             label.textContent = subcategory.name;
+            
+            const countSpan = document.createElement('span');
+            countSpan.className = 'text-xs text-gray-400 ml-1';
+            facetCountElements.set(`${category.name}|${subcategory.name}`, countSpan);
 
             subDiv.appendChild(checkbox);
             subDiv.appendChild(label);
+            subDiv.appendChild(countSpan);
             subcategoriesDiv.appendChild(subDiv);
         });
 
@@ -161,11 +467,12 @@ function buildFilterUI() {
 }
 
 // Handle filter changes
-function handleFilterChange(subcategory, isChecked) {
+function handleFilterChange(category, subcategory, isChecked) {
     const filterId = `${subcategory.name}|${subcategory.hashtags.join(',')}`;
     
     if (isChecked) {
-        activeFilters.add(filterId);
+        activeFilters.set(filterId, `${category.name}|${subcategory.name}`);
+        loadCategory(category, subcategory);
     } else {
         activeFilters.delete(filterId);
     }
@@ -193,6 +500,36 @@ function clearAllFiltersHandler() {
 
 // Filter wreaths based on active filters and search
 function getFilteredWreaths() {
+    let filtered = getSearchedWreaths();
+
+    // Apply category filters (AND logic): a bitset intersection once facets are loaded
+    const facetMatches = activeFilters.size > 0 ? activeFacetBits() : null;
+    if (facetMatches) {
+        filtered = filtered.filter(wreath => {
+            const ordinal = ordinalById.get(wreath.id);
+            return ordinal !== undefined && (facetMatches[ordinal >> 3] & (1 << (ordinal & 7))) !== 0;
+        });
+    } else if (activeFilters.size > 0) {
+        filtered = filtered.filter(wreath => {
+            return Array.from(activeFilters.keys()).every(filterId => {
+                const [filterName, hashtagsStr] = filterId.split('|');
+                const hashtags = hashtagsStr.split(',');
+                
+                // Check if wreath has any of the hashtags for this filter
+                return hashtags.some(hashtag => {
+                    return wreath.hashtags && wreath.hashtags.some(wreathTag => 
+                        wreathTag.toLowerCase() === hashtag.toLowerCase()
+                    );
+                });
+            });
+        });
+    }
+
+    return filtered;
+}
+
+// Wreaths passing the "available only" toggle and the search, before category filters
+function getSearchedWreaths() {
     let filtered = wreathsData;
 
     // Apply availability filter
@@ -200,8 +537,11 @@ function getFilteredWreaths() {
         filtered = filtered.filter(w => !w.sold);
     }
 
-    // Apply search filter
-    if (currentSearchTerm.trim()) {
+    // Apply search filter: an index lookup once the search index is loaded
+    if (currentSearchTerm.trim() && searchIndex) {
+        const matches = searchMatches(currentSearchTerm);
+        filtered = filtered.filter(wreath => matches.has(wreath.id));
+    } else if (currentSearchTerm.trim()) {
         const searchTerm = currentSearchTerm.toLowerCase();
         filtered = filtered.filter(wreath => {
             // Search in title
@@ -225,23 +565,6 @@ function getFilteredWreaths() {
         });
     }
 
-    // Apply category filters (AND logic)
-    if (activeFilters.size > 0) {
-        filtered = filtered.filter(wreath => {
-            return Array.from(activeFilters).every(filterId => {
-                const [filterName, hashtagsStr] = filterId.split('|');
-                const hashtags = hashtagsStr.split(',');
-                
-                // Check if wreath has any of the hashtags for this filter
-                return hashtags.some(hashtag => {
-                    return wreath.hashtags && wreath.hashtags.some(wreathTag => 
-                        wreathTag.toLowerCase() === hashtag.toLowerCase()
-                    );
-                });
-            });
-        });
-    }
-
     return filtered;
 }
 
@@ -364,6 +687,13 @@ function openWreathModal(wreath) {
     modalTitle.textContent = wreath.title;
     modalPrice.textContent = `$${wreath.localPrice} Local Pickup`;
     modalDescription.textContent = wreath.description || '';
+    if (wreath.description === undefined) {
+        loadDescriptions().then(() => {
+            if (currentWreath === wreath) {
+                modalDescription.textContent = wreath.description || '';
+            }
+        });
+    }
     
     // Show/hide sold badge
     if (wreath.sold) {
@@ -391,6 +721,16 @@ function openWreathModal(wreath) {
     // Show modal
     wreathModal.classList.add('active');
     document.body.style.overflow = 'hidden';
+    
+    // First-screen records only have the first image; fill in the full record
+    if (wreath.partial) {
+        loadFullCatalog().then(() => {
+            const fullWreath = wreathsData.find(w => w.id === wreath.id);
+            if (currentWreath === wreath && fullWreath && !fullWreath.partial) {
+                openWreathModal(fullWreath);
+            }
+        });
+    }
 }
 
 // Setup image carousel
@@ -500,7 +840,20 @@ function updateItemCount() {
         countText += ` (${featuredCount} featured)`;
     }
     
+    // Until every page has arrived, count from the index when nothing narrows the list
+    if (!catalogComplete && catalogIndex) {
+        if (activeFilters.size === 0 && !currentSearchTerm.trim() && !showAvailableOnly.checked) {
+            countText = `${catalogIndex.total} wreath${catalogIndex.total !== 1 ? 's' : ''}`;
+            if (catalogIndex.featured > 0) {
+                countText += ` (${catalogIndex.featured} featured)`;
+            }
+        } else {
+            countText += ' (loading more...)';
+        }
+    }
+    
     itemCount.textContent = countText;
+    updateFacetCounts();
 }
 
 // Mobile sidebar functions
@@ -522,6 +875,24 @@ function handleSearchInput() {
     updateClearSearchButton();
     displayWreaths();
     updateItemCount();
+    
+    // Search through the prebuilt index once it arrives
+    if (currentSearchTerm.trim() && !searchIndex && catalogIndex && catalogIndex.search) {
+        loadSearchIndex().then(() => {
+            if (currentSearchTerm.trim()) {
+                displayWreaths();
+                updateItemCount();
+            }
+        });
+    } else if (currentSearchTerm.trim() && !descriptionsLoading) {
+        // Search covers descriptions too; show those matches once they arrive
+        loadDescriptions().then(() => {
+            if (currentSearchTerm.trim()) {
+                displayWreaths();
+                updateItemCount();
+            }
+        });
+    }
 }
 
 // Handle clear search